@@ -77,6 +77,9 @@ from .thermonics import Thermonics as Thermonics
 from .utils import (
     Logger as Logger,
 )
+from .utils import (
+    configure_parallel as configure_parallel,
+)
 from .utils import (
     countdown as countdown,
 )
@@ -86,6 +89,9 @@ from .utils import (
 from .utils import (
     get_directory as get_directory,
 )
+from .utils import (
+    get_resource_manager as get_resource_manager,
+)
 from .utils import (
     getAllLiveUnits as getAllLiveUnits,
 )
@@ -6,19 +6,93 @@ can inherit from. It provides shared functionality such as connection handling,
 identification, and basic VISA commands.
 """
 
+import asyncio
 import logging
+import threading
 import time
 from abc import ABC
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, Iterator, List, Optional, Sequence, TypeVar, Union
 
 import pyvisa
 
 from .utils.decorators import visa_exception_handler
+from .utils.utilities import get_resource_manager, join_scpi_commands
 
 # Setup module logger
 logger = logging.getLogger(__name__)
 
+# Status byte bit set by SCPI instruments while the error/event queue is not empty
+_STB_ERROR_QUEUE = 0x04
+
+# Status byte summary bit for the standard event register, and the standard
+# event bits for query, device, execution and command errors
+_STB_EVENT_SUMMARY = 0x20
+_ESR_ERRORS = 0x3C
+
+# Bytes requested per low-level read; pyvisa's 20 KB default splits larger
+# replies such as traces and binary blocks into many transfers
+_CHUNK_SIZE = 1024 * 1024
+
+# Timeout for the *IDN? probe when connecting, so a wrong address fails fast
+_IDENTIFY_TIMEOUT_MS = 500
+
+# Return type of a method run through LibraryTemplate.submit
+T = TypeVar('T')
+
+
+class _LockedResource:
+    """VISA resource wrapper that holds the instrument's I/O lock per call.
+
+    pyvisa sessions are not safe to use from several threads at once, so every
+    transfer goes through one lock per instrument. Attribute reads and writes
+    such as timeout or read_termination pass straight through.
+
+    The wrapper is not an instance of pyvisa's resource classes, so
+    ``isinstance(connection, MessageBasedResource)`` is False; check the
+    wrapped resource in ``connection._resource`` instead.
+    """
+
+    _IO_METHODS = frozenset(
+        {
+            "write",
+            "write_raw",
+            "write_ascii_values",
+            "write_binary_values",
+            "read",
+            "read_raw",
+            "read_bytes",
+            "read_stb",
+            "query",
+            "query_ascii_values",
+            "query_binary_values",
+            "clear",
+        }
+    )
+
+    def __init__(self, resource: Any, lock: threading.RLock):
+        object.__setattr__(self, "_resource", resource)
+        object.__setattr__(self, "_lock", lock)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._resource, name)
+        if name not in self._IO_METHODS:
+            return attr
+
+        resource, lock = self._resource, self._lock
+
+        def locked(*args: Any, **kwargs: Any) -> Any:
+            with lock:
+                return getattr(resource, name)(*args, **kwargs)
+
+        # Keep the wrapper on the proxy so later lookups skip __getattr__
+        object.__setattr__(self, name, locked)
+        return locked
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._resource, name, value)
+
 
 class LibraryTemplate(ABC):
     """Base class for lab instrument interfaces.
@@ -34,6 +108,9 @@ class LibraryTemplate(ABC):
         nickname (str): User-defined name for the instrument (optional).
     """
 
+    # Single worker thread that runs submit() calls, created on first use
+    _executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(
         self,
         instrument_address: str = "GPIB0::20::INSTR",
@@ -53,8 +130,13 @@ class LibraryTemplate(ABC):
             SystemExit: If connection fails and no exception handler is in place.
         """
         self.instrument_address = instrument_address
-        self.rm = pyvisa.ResourceManager()
+        self.rm = get_resource_manager()
         self.connection = None
+        # Held for each transfer so threads can share this instrument
+        self._io_lock = threading.RLock()
+        # pipeline() buffers per thread, so a submit() worker never writes
+        # into a block opened by the caller's thread or vice versa
+        self._pipeline_state = threading.local()
         self.instrumentID = None
         self.nickname = nickname
         self.timeout = timeout
@@ -77,12 +159,19 @@ class LibraryTemplate(ABC):
         """
         try:
             # Make the connection
-            self.connection = self.rm.open_resource(instrument_address)
+            self.connection = _LockedResource(self.rm.open_resource(instrument_address), self._io_lock)
             self.connection.timeout = self.timeout
-
-            # Handle identification if requested
-            if identify and not self._identify_instrument():
-                return False
+            # Termination is left to each instrument class, since some return
+            # raw binary blocks that can contain newline bytes
+            self.connection.chunk_size = _CHUNK_SIZE
+            self.instrumentID = None
+
+            # Handle identification if requested, with a short timeout so a
+            # wrong address fails fast instead of after the full timeout
+            if identify:
+                with self.temporary_timeout(min(self.timeout, _IDENTIFY_TIMEOUT_MS)):
+                    if not self._identify_instrument():
+                        return False
 
             # Connection successful
             display_name = (
@@ -146,10 +235,79 @@ class LibraryTemplate(ABC):
 
         This method should be called when finished with the instrument to release resources.
         """
+        if self._executor is not None:
+            # Let queued submit() calls finish before the session goes away
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
         if self.connection:
             self.connection.close()
             logger.info(f"Connection to {self.instrument_address} closed")
 
+    def submit(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Run an instrument method on a background I/O thread.
+
+        Calls are queued to a single worker thread owned by this instrument,
+        so they run one at a time in submission order while the caller
+        carries on. Avoid calling the instrument directly while submitted
+        calls are still pending, since both would share the VISA session;
+        :meth:`wait_for_submitted` waits for them to finish.
+
+        Args:
+            method: Bound method of this instrument to run, e.g. ``smu.set_voltage``.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            Future: Resolves to the method's return value.
+
+        Example:
+            future = smu.submit(smu.measure_voltage, 1)
+            ...  # other work
+            voltage = future.result()
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"visa-io-{self.instrument_address}")
+        return self._executor.submit(method, *args, **kwargs)
+
+    async def run_async(self, method: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Await an instrument method run on the background I/O thread.
+
+        The asyncio counterpart of :meth:`submit`: the call joins the same
+        ordered per-instrument queue, and the event loop stays free while it
+        runs. Awaiting several instruments together overlaps their bus time.
+
+        Args:
+            method: Bound method of this instrument to run, e.g. ``supply.set_voltage``.
+            *args: Positional arguments for the method.
+            **kwargs: Keyword arguments for the method.
+
+        Returns:
+            The method's return value.
+
+        Example:
+            await asyncio.gather(*(s.run_async(s.set_voltage, 5.0, 0.1) for s in supplies))
+        """
+        return await asyncio.wrap_future(self.submit(method, *args, **kwargs))
+
+    def wait_for_submitted(self, timeout: Optional[float] = None) -> None:
+        """Block until every call queued with :meth:`submit` so far has run.
+
+        Use this as an ordering barrier before talking to the instrument
+        directly again, e.g. before a query that must see queued setter
+        writes. Don't call it from a submitted call, which would wait on itself.
+
+        Args:
+            timeout: Maximum time to wait in seconds, or None to wait indefinitely.
+
+        Raises:
+            concurrent.futures.TimeoutError: If the queue did not drain in time.
+        """
+        if self._executor is not None:
+            # The worker runs calls in order, so once this no-op has run
+            # everything queued before it has too
+            self._executor.submit(lambda: None).result(timeout)
+
     # Alias for backward compatibility
     close = close_connection
 
@@ -175,30 +333,147 @@ class LibraryTemplate(ABC):
         self.close_connection()
 
     @visa_exception_handler(default_return_value=None, module_logger=logger)
-    def identify(self) -> Optional[str]:
+    def identify(self, refresh: bool = False) -> Optional[str]:
         """Query the instrument's identification string.
 
         This method sends the standard IEEE-488.2 *IDN? query to identify the instrument.
+        The identity cannot change while connected, so once known it is
+        returned without another round-trip.
+
+        Args:
+            refresh: Query the instrument even if the identity is already known.
 
         Returns:
             str: The instrument identification string, or None if identification failed.
         """
+        if self.instrumentID and not refresh:
+            return self.instrumentID
+
         response = self.connection.query("*IDN?").strip()
         self.instrumentID = response
         return self.instrumentID
 
     @visa_exception_handler(default_return_value=None, module_logger=logger)
-    def write(self, command: str) -> None:
+    def write(self, command: str) -> Optional[bool]:
         """Send a command string to the instrument.
 
         Args:
             command: The command string to send.
 
         Returns:
-            None: Returns None if successful, None if operation fails.
+            Optional[bool]: True if the command was sent, False if it was only
+            queued by :meth:`pipeline`, None if operation fails.
         """
+        if self._pipeline is not None:
+            self._pipeline.append(command)
+            # A query's reply is read straight after the write, so it has to go out now
+            if "?" in command:
+                return self._flush_pipeline()
+            return False
+
         self.connection.write(command)
-        logger.debug(f"Wrote to {self.instrument_address}: {command}")
+        # Skip building the debug message on the hot path unless it is emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Wrote to {self.instrument_address}: {command}")
+        return True
+
+    def _write_many(self, *commands: str) -> Optional[bool]:
+        """Send several commands to the instrument as a single SCPI message.
+
+        The commands are joined with semicolons so they travel in one bus
+        transaction. Every command after the first is anchored at the root of
+        the command tree with a leading colon, so the header path of one
+        command does not leak into the next.
+
+        Args:
+            *commands: The command strings to send, in order.
+
+        Returns:
+            Optional[bool]: True if the message was sent, False if it was only
+            queued by :meth:`pipeline`, None if it failed.
+        """
+        return self.write(self._join_commands(commands))
+
+    # Instrument classes join compound messages through this alias
+    _join_commands = staticmethod(join_scpi_commands)
+
+    def _query_many(self, *queries: str) -> List[str]:
+        """Send several queries as a single SCPI message and split the replies.
+
+        The queries are joined the same way as in :meth:`_write_many`, and
+        the instrument answers with one semicolon-separated response line.
+
+        Args:
+            *queries: The query strings to send, in order.
+
+        Returns:
+            List[str]: One stripped response per query.
+        """
+        return [part.strip() for part in self.query(self._join_commands(queries)).split(";")]
+
+    @contextmanager
+    def pipeline(self) -> Iterator[None]:
+        """Batch the writes made inside the block into as few bus transactions as possible.
+
+        Commands sent through :meth:`write` are buffered and sent as one
+        SCPI message when the block exits. A query flushes the buffer first
+        so replies stay in order. Nested blocks join the outer one.
+
+        The buffer belongs to the calling thread, so calls run through
+        :meth:`submit` are not batched into it. Queued writes report False
+        rather than True, and methods that cache instrument state on a
+        successful write leave that state unknown until it is read back.
+        A failed flush is logged like any other failed write and does not
+        hide an exception raised inside the block.
+
+        Supply controllers write to the connection directly and are not
+        batched; use ``Supply.apply`` or ``Supply.apply_all`` to program a
+        supply in one message.
+
+        Yields:
+            None
+
+        Example:
+            with smu.pipeline():
+                smu.set_mode(1, "VOLT")
+                smu.set_voltage(2.0, 0.1, channel=1)
+                smu.enable_output(1)
+        """
+        if self._pipeline is not None:
+            yield
+            return
+
+        self._pipeline = []
+        try:
+            yield
+        finally:
+            self._flush_pipeline()
+            self._pipeline = None
+
+    @property
+    def _pipeline(self) -> Optional[List[str]]:
+        """Commands buffered by this thread's pipeline() block, None when not batching."""
+        return getattr(self._pipeline_state, "commands", None)
+
+    @_pipeline.setter
+    def _pipeline(self, commands: Optional[List[str]]) -> None:
+        self._pipeline_state.commands = commands
+
+    @visa_exception_handler(default_return_value=None, module_logger=logger)
+    def _flush_pipeline(self) -> Optional[bool]:
+        """Send the commands buffered by :meth:`pipeline` as a single message.
+
+        Returns:
+            Optional[bool]: True if the buffer was empty or sent, None if the write failed.
+        """
+        if not self._pipeline:
+            return True
+        commands, self._pipeline = self._pipeline, []
+        message = self._join_commands(commands)
+        self.connection.write(message)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Wrote to {self.instrument_address}: {message}")
+        return True
 
     @visa_exception_handler(default_return_value="", module_logger=logger)
     def query(self, command: str, delay: Optional[float] = None) -> str:
@@ -211,14 +486,18 @@ class LibraryTemplate(ABC):
         Returns:
             str: The response from the instrument or empty string on failure.
         """
+        self._flush_pipeline()
         if delay:
-            self.connection.write(command)
-            time.sleep(delay)
-            response = self.connection.read()
+            # Keep other threads off the bus until this reply has been read
+            with self._io_lock:
+                self.connection.write(command)
+                time.sleep(delay)
+                response = self.connection.read()
         else:
             response = self.connection.query(command)
 
-        logger.debug(f"Queried {self.instrument_address} with '{command}', got '{response}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Queried {self.instrument_address} with '{command}', got '{response}'")
         return response.strip()
 
     @visa_exception_handler(default_return_value=[], module_logger=logger)
@@ -236,22 +515,27 @@ class LibraryTemplate(ABC):
         Returns:
             A list (or specified container) of the retrieved values, or empty list on failure.
         """
+        self._flush_pipeline()
         values = self.connection.query_binary_values(command, datatype, is_big_endian, container)
         return values
 
     @visa_exception_handler(default_return_value=[], module_logger=logger)
-    def query_ascii_values(self, command: str, separator: str = ',', container: Any = list) -> List[Any]:
+    def query_ascii_values(
+        self, command: str, separator: Union[str, Callable[[str], Sequence[str]]] = ',', container: Any = list
+    ) -> List[Any]:
         """Query the instrument for ASCII values.
 
         Args:
             command: The query command to send.
-            separator: The separator character between values.
+            separator: The separator character between values, or a callable
+                that splits the reply into value strings.
             container: The container type for the returned values.
 
         Returns:
             A list (or specified container) of the retrieved values, or empty list on failure.
         """
-        values = self.connection.query_ascii_values(command, separator, container)
+        self._flush_pipeline()
+        values = self.connection.query_ascii_values(command, separator=separator, container=container)
         return values
 
     @visa_exception_handler(default_return_value=False, module_logger=logger)
@@ -287,6 +571,8 @@ class LibraryTemplate(ABC):
         """Wait for pending operations to complete.
 
         Uses the *OPC? query to wait until all pending commands are completed.
+        The instrument holds its reply until then, so the call returns as
+        soon as the operation finishes rather than after a fixed delay.
 
         Args:
             timeout: Maximum time to wait in seconds.
@@ -295,10 +581,65 @@ class LibraryTemplate(ABC):
             bool: True if completed within timeout, False otherwise.
         """
         start_time = time.time()
-        response = self.connection.query("*OPC?", delay=timeout)
+        with self.temporary_timeout(int(timeout * 1000)):
+            response = self.connection.query("*OPC?")
         elapsed = time.time() - start_time
         logger.debug(f"Operation completed in {elapsed:.2f} seconds")
-        return bool(int(response.strip()))
+        return bool(int(response))
+
+    @visa_exception_handler(default_return_value=True, module_logger=logger)
+    def has_errors(self) -> bool:
+        """Check whether the instrument's error queue holds any entries.
+
+        Reads the status byte with a serial poll instead of sending a query,
+        which is much cheaper on GPIB and never touches the error queue. Poll
+        this in loops and only read the queue when it returns True.
+
+        Returns:
+            bool: True if the error/event queue is not empty, or the status
+            byte could not be read.
+        """
+        return bool(self.connection.read_stb() & _STB_ERROR_QUEUE)
+
+    @visa_exception_handler(default_return_value=False, module_logger=logger)
+    def enable_error_srq(self) -> bool:
+        """Have the instrument request service whenever it logs an error.
+
+        Enables the error bits of the standard event register and its summary
+        bit in the service request enable register, then queues SRQ events on
+        the session so :meth:`wait_for_srq` can wait for them without polling.
+
+        Returns:
+            bool: True if SRQ reporting was enabled, False otherwise.
+        """
+        self._write_many(f"*ESE {_ESR_ERRORS}", f"*SRE {_STB_EVENT_SUMMARY}")
+        self.connection.enable_event(
+            pyvisa.constants.EventType.service_request, pyvisa.constants.EventMechanism.queue
+        )
+        return True
+
+    @visa_exception_handler(default_return_value=False, module_logger=logger)
+    def wait_for_srq(self, timeout: float = 10.0) -> bool:
+        """Wait for a service request from the instrument.
+
+        Call :meth:`enable_error_srq` first. The wait happens in the VISA
+        layer, so nothing is sent on the bus until the instrument raises SRQ;
+        only then is the error queue worth reading.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if the instrument requested service, False on timeout.
+        """
+        response = self.connection.wait_on_event(
+            pyvisa.constants.EventType.service_request, int(timeout * 1000), capture_timeout=True
+        )
+        if response.timed_out:
+            return False
+        # The serial poll clears the request so the next one is seen
+        self.connection.read_stb()
+        return True
 
     @visa_exception_handler(default_return_value="Error: Unable to retrieve error status", module_logger=logger)
     def get_error(self) -> str:
@@ -177,7 +177,7 @@ class AFG3000(LibraryTemplate):
         Raises:
             ValueError: If an invalid channel is specified.
         """
-        response = self.query(f"OUTPut{channel}:STATe?").strip()
+        response = self.query(f"OUTPut{channel}:STATe?")
         logger.debug(f"Channel {channel} output state is {response}")
         return response
 
@@ -188,8 +188,8 @@ class AFG3000(LibraryTemplate):
         Returns:
             str: The error message or "0,No Error" if no errors.
         """
-        response = self.query("SYSTem:ERRor?").strip("\n")
-        if not response.startswith("0,"):
+        response = self.query("SYSTem:ERRor?")
+        if not response.startswith(("0,", "+0,")):
             logger.warning(f"Error in function generator: {response}")
         return response
 
@@ -226,10 +226,12 @@ class AFG3000(LibraryTemplate):
         """
         logger.info(f"Setting up frequency sweep on channel {channel}")
 
-        self.write(f"FREQ{channel}:STAR {start_freq}")
-        self.write(f"FREQ{channel}:STOP {stop_freq}")
-        self.write(f"SWE{channel}:TIME {sweep_time}")
-        self.write(f"SWE{channel}:STAT ON")
+        self._write_many(
+            f"FREQ{channel}:STAR {start_freq}",
+            f"FREQ{channel}:STOP {stop_freq}",
+            f"SWE{channel}:TIME {sweep_time}",
+            f"SWE{channel}:STAT ON",
+        )
 
         logger.info(f"Configured sweep from {start_freq} Hz to {stop_freq} Hz in {sweep_time} seconds")
 
@@ -332,8 +334,8 @@ class AFG3000(LibraryTemplate):
         """
         logger.info(f"Setting up burst mode on channel {channel}")
 
-        self.write(f"BURS{channel}:STAT ON")
-        self.write(f"BURS{channel}:NCYC {burst_count}")
-        self.write(f"BURS{channel}:INT:PER {burst_period}")
+        self._write_many(
+            f"BURS{channel}:STAT ON", f"BURS{channel}:NCYC {burst_count}", f"BURS{channel}:INT:PER {burst_period}"
+        )
 
         logger.info(f"Configured burst mode with {burst_count} cycles and {burst_period}s period")
@@ -82,7 +82,8 @@ class KeithleyBaseSMU(LibraryTemplate, ABC):
         Raises:
             ValueError: If voltage exceeds instrument limits.
         """
-        logger.debug(f"Setting voltage to {voltage}V")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Setting voltage to {voltage}V")
         self.write(f"SOUR:VOLT {voltage}")
 
     @parameter_validator(current=lambda i: abs(i) <= KeithleyBaseSMU.MAX_CURRENT)
@@ -96,7 +97,8 @@ class KeithleyBaseSMU(LibraryTemplate, ABC):
         Raises:
             ValueError: If current exceeds instrument limits.
         """
-        logger.debug(f"Setting current to {current}A")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Setting current to {current}A")
         self.write(f"SOUR:CURR {current}")
 
     @visa_exception_handler(default_return_value=0.0, module_logger=logger)
@@ -107,8 +109,9 @@ class KeithleyBaseSMU(LibraryTemplate, ABC):
             float: The measured output voltage or 0.0 on error.
         """
         response = self.query("MEAS:VOLT?")
-        result = float(response.strip())
-        logger.debug(f"Measured voltage: {result}V")
+        result = float(response)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Measured voltage: {result}V")
         return result
 
     @visa_exception_handler(default_return_value=0.0, module_logger=logger)
@@ -119,8 +122,9 @@ class KeithleyBaseSMU(LibraryTemplate, ABC):
             float: The measured output current or 0.0 on error.
         """
         response = self.query("MEAS:CURR?")
-        result = float(response.strip())
-        logger.debug(f"Measured current: {result}A")
+        result = float(response)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Measured current: {result}A")
         return result
 
     @visa_exception_handler(default_return_value=None, module_logger=logger)
@@ -258,8 +262,7 @@ class KeithleyBaseSMU(LibraryTemplate, ABC):
             voltage_limit: Maximum allowed voltage
             current_limit: Maximum allowed current
         """
-        self.write(f"SENS:VOLT:PROT {voltage_limit}")
-        self.write(f"SENS:CURR:PROT {current_limit}")
+        self._write_many(f"SENS:VOLT:PROT {voltage_limit}", f"SENS:CURR:PROT {current_limit}")
         logger.info(f"Set limits: voltage={voltage_limit}V, current={current_limit}A")
 
     @visa_exception_handler(default_return_value=(0.0, 0.0), module_logger=logger)
@@ -269,8 +272,8 @@ class KeithleyBaseSMU(LibraryTemplate, ABC):
         Returns:
             Tuple containing (voltage, current) measurements
         """
-        voltage = self.measure_voltage()
-        current = self.measure_current()
+        # Read both values with one compound query instead of two round-trips
+        voltage, current = map(float, self._query_many("MEAS:VOLT?", "MEAS:CURR?"))
         return voltage, current
 
     def _save_state(self) -> Dict[str, Any]:
@@ -424,9 +427,7 @@ class Keithley238(KeithleyBaseSMU):
         if mode.upper() not in ['MOV', 'REP']:
             raise ValueError("Mode must be 'MOV' or 'REP'")
 
-        self.write(f"SENS:AVER:COUN {count}")
-        self.write(f"SENS:AVER:TCON {mode}")
-        self.write("SENS:AVER ON")
+        self._write_many(f"SENS:AVER:COUN {count}", f"SENS:AVER:TCON {mode}", "SENS:AVER ON")
 
         logger.debug(f"Configured filter: mode={mode}, count={count}")
 
@@ -447,9 +448,11 @@ class Keithley238(KeithleyBaseSMU):
             stop: Stop voltage
             steps: Number of steps
         """
-        self.write(f"SOUR:VOLT:STAR {start}")
-        self.write(f"SOUR:VOLT:STOP {stop}")
-        self.write(f"SOUR:VOLT:STEP {(stop-start)/(steps-1 if steps > 1 else 1)}")
-        self.write("SOUR:VOLT:MODE SWE")
+        self._write_many(
+            f"SOUR:VOLT:STAR {start}",
+            f"SOUR:VOLT:STOP {stop}",
+            f"SOUR:VOLT:STEP {(stop-start)/(steps-1 if steps > 1 else 1)}",
+            "SOUR:VOLT:MODE SWE",
+        )
 
         logger.info(f"Configured built-in sweep from {start}V to {stop}V in {steps} steps")
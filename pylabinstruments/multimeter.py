@@ -24,10 +24,10 @@ from abc import ABC
 from typing import Dict, Optional, Tuple
 
 import numpy as np
-import pyvisa
 
-from .base import LibraryTemplate
+from .base import _IDENTIFY_TIMEOUT_MS, LibraryTemplate
 from .utils.decorators import parameter_validator, visa_exception_handler
+from .utils.utilities import get_resource_manager
 
 # Setup module logger
 logger = logging.getLogger(__name__)
@@ -137,6 +137,16 @@ class MultimeterBase(LibraryTemplate, ABC):
             timeout: Connection timeout in milliseconds.
         """
         super().__init__(instrument_address, nickname, identify, timeout)
+
+        # Multimeters only exchange text, so let VISA end each read at the
+        # newline terminator instead of waiting for EOI or the timeout
+        self.connection.read_termination = '\n'
+        self.connection.write_termination = '\n'
+
+        # Measurement function last selected through this class (None when
+        # unknown), so the function guards in measure/read/fetch don't need
+        # a FUNC? round-trip on every call
+        self._function: Optional[str] = None
         logger.info(f"Initialized {self.__class__.__name__} at {instrument_address}")
 
     @parameter_validator(function=lambda f: _normalize_function_token(f) is not None)
@@ -150,28 +160,41 @@ class MultimeterBase(LibraryTemplate, ABC):
                     "CURR" (DC current), "CURR:AC" (AC current), "RES" (resistance).
 
         Returns:
-            str: The current selected function (canonical token).
+            str: The function just selected (canonical token). This is the
+            cached value and is not read back from the instrument; call
+            get_function(refresh=True) to confirm it. If the write fails,
+            the instrument is queried instead.
         """
         canonical = _normalize_function_token(function)
         # Prefer CONF for broad compatibility
-        self.write(f":CONF:{canonical}")
+        self._function = canonical if self.write(f":CONF:{canonical}") else None
         return self.get_function()
 
     @visa_exception_handler(default_return_value="VOLT", module_logger=logger)
-    def get_function(self) -> str:
+    def get_function(self, refresh: bool = False) -> str:
         """Get the currently selected measurement function.
 
+        The function last selected through this class is returned from the
+        cache; the instrument is only queried when the function is unknown.
+
+        Args:
+            refresh: Query the instrument even if the function is cached.
+
         Returns:
             str: The current selected function (canonical token).
         """
+        if self._function is not None and not refresh:
+            return self._function
+
         current_function = self.query("FUNC?")
         # Responses often include quotes, e.g. "VOLT"
-        token = current_function.strip().strip("\"")
+        token = current_function.strip("\"")
         try:
-            return _normalize_function_token(token)
+            self._function = _normalize_function_token(token)
         except Exception:
             # If normalization fails, return raw token
             return token
+        return self._function
 
     @parameter_validator(function=lambda f: _normalize_function_token(f) is not None)
     @visa_exception_handler(default_return_value=0.0, module_logger=logger)
@@ -195,7 +218,9 @@ class MultimeterBase(LibraryTemplate, ABC):
         # Use MEASure command for a complete measurement
         canonical = _normalize_function_token(function)
         response = self.query(f"MEAS:{canonical}?")
-        return float(response.strip())
+        # MEASure? reconfigures the instrument for the requested function
+        self._function = canonical
+        return float(response)
 
     @visa_exception_handler(default_return_value=0.0, module_logger=logger)
     def read(self, function: Optional[str] = None) -> float:
@@ -219,7 +244,7 @@ class MultimeterBase(LibraryTemplate, ABC):
 
         # Get a reading
         response = self.query("READ?")
-        return float(response.strip())
+        return float(response)
 
     @visa_exception_handler(default_return_value=0.0, module_logger=logger)
     def fetch(self, function: Optional[str] = None) -> float:
@@ -243,7 +268,7 @@ class MultimeterBase(LibraryTemplate, ABC):
 
         # Fetch the result
         response = self.query("FETC?")
-        return float(response.strip())
+        return float(response)
 
     @visa_exception_handler(default_return_value=False, module_logger=logger)
     def initiate(self) -> bool:
@@ -297,7 +322,7 @@ class MultimeterBase(LibraryTemplate, ABC):
         current_function = self.get_function()
         response = self.query(f"{current_function}:NPLC?")
         try:
-            return float(response.strip())
+            return float(response)
         except Exception:
             return 1.0
 
@@ -468,7 +493,7 @@ class MultimeterBase(LibraryTemplate, ABC):
         """
         canonical = _normalize_function_token(function)
         response = self.query(f"{canonical}:RANG?")
-        return float(response.strip())
+        return float(response)
 
     @parameter_validator(
         function=lambda f: _normalize_function_token(f) is not None, state=lambda s: isinstance(s, bool)
@@ -497,7 +522,7 @@ class MultimeterBase(LibraryTemplate, ABC):
             bool: True if auto-range is enabled, False otherwise
         """
         canonical = _normalize_function_token(function)
-        response = self.query(f"{canonical}:RANG:AUTO?").strip()
+        response = self.query(f"{canonical}:RANG:AUTO?")
         return response == "1" or response.upper() == "ON"
 
     @parameter_validator(source=lambda s: s.upper() in ["IMM", "EXT", "BUS"], count=lambda c: c > 0)
@@ -509,8 +534,7 @@ class MultimeterBase(LibraryTemplate, ABC):
             source: Trigger source ("IMM", "EXT", "BUS")
             count: Trigger count
         """
-        self.write(f"TRIG:SOUR {source}")
-        self.write(f"TRIG:COUN {count}")
+        self._write_many(f"TRIG:SOUR {source}", f"TRIG:COUN {count}")
         logger.info(f"Set trigger source to {source}, count to {count}")
 
     @visa_exception_handler(default_return_value="0,No Error", module_logger=logger)
@@ -520,8 +544,8 @@ class MultimeterBase(LibraryTemplate, ABC):
         Returns:
             str: Error message or "0,No Error" if no errors.
         """
-        response = self.query("SYST:ERR?").strip("\n")
-        if not response.startswith("0,"):
+        response = self.query("SYST:ERR?")
+        if not response.startswith(("0,", "+0,")):
             logger.warning(f"Error in multimeter: {response}")
         return response
 
@@ -533,6 +557,7 @@ class MultimeterBase(LibraryTemplate, ABC):
             bool: True if reset succeeded, False otherwise.
         """
         logger.info(f"Resetting {self.__class__.__name__}")
+        self._function = None
         return super().reset()
 
     @visa_exception_handler(default_return_value=False, module_logger=logger)
@@ -577,8 +602,21 @@ class HP34401A(MultimeterBase):
 
         # Apply model-specific configuration
         self.write("DISP:TEXT:CLE")  # Clear the display
+
+        # Text shown on the front panel ("" when clear, None when unknown), so
+        # repeated display updates with the same text skip the bus
+        self._display_text: Optional[str] = ""
         logger.info(f"Initialized HP 34401A multimeter at {instrument_address}")
 
+    def reset(self) -> bool:
+        """Reset the instrument to factory settings.
+
+        Returns:
+            bool: True if reset succeeded, False otherwise.
+        """
+        self._display_text = None
+        return super().reset()
+
     @visa_exception_handler(default_return_value=None, module_logger=logger)
     def display_text(self, text: str) -> None:
         """Display text on the multimeter's front panel.
@@ -590,13 +628,21 @@ class HP34401A(MultimeterBase):
         if len(text) > 12:
             text = text[:12]
 
+        if text == self._display_text:
+            return
+
         self.write(f'DISP:TEXT "{text}"')
+        self._display_text = text
         logger.debug(f"Displayed text: {text}")
 
     @visa_exception_handler(default_return_value=None, module_logger=logger)
     def clear_display(self) -> None:
         """Clear the custom text from the display."""
+        if self._display_text == "":
+            return
+
         self.write("DISP:TEXT:CLE")
+        self._display_text = ""
         logger.debug("Cleared display text")
 
     @parameter_validator(nplc=lambda n: 0.02 <= n <= 100)
@@ -628,14 +674,27 @@ class HP34401A(MultimeterBase):
         Raises:
             ValueError: If parameters are out of range
         """
-        self.write(f"TRIG:COUN {count}")
-        self.write(f"SAMP:COUN {samples}")
-
+        commands = [f"TRIG:COUN {count}", f"SAMP:COUN {samples}"]
         if delay > 0:
-            self.write(f"SAMP:TIM {delay}")
+            commands.append(f"SAMP:TIM {delay}")
+        self._write_many(*commands)
 
         logger.debug(f"Setup data logging: {samples} samples, {count} triggers, {delay}s delay")
 
+    @visa_exception_handler(default_return_value=np.array([]), module_logger=logger)
+    def read_logged_data(self) -> np.ndarray:
+        """Run the logging configured by setup_data_logging and return every reading.
+
+        All readings arrive as one comma-separated READ? reply, which is parsed
+        in a single NumPy call rather than float() per value.
+
+        Returns:
+            numpy.ndarray: The readings as float64, in acquisition order
+        """
+        readings = np.fromstring(self.query("READ?"), sep=",")
+        logger.debug(f"Read {len(readings)} logged readings")
+        return readings
+
 
 class Keithley2000(MultimeterBase):
     """Class for Keithley 2000 Digital Multimeter.
@@ -684,7 +743,7 @@ class Keithley2000(MultimeterBase):
 
         # Get a reading
         response = self.query("READ?")
-        return float(response.strip())
+        return float(response)
 
     @parameter_validator(
         state=lambda s: isinstance(s, bool), type=lambda t: t.upper() in ['MOV', 'REP'], count=lambda c: 1 <= c <= 100
@@ -701,9 +760,7 @@ class Keithley2000(MultimeterBase):
         Raises:
             ValueError: If parameters are invalid
         """
-        self.write(f"SENS:AVER:TCON {type}")
-        self.write(f"SENS:AVER:COUN {count}")
-        self.write(f"SENS:AVER {'ON' if state else 'OFF'}")
+        self._write_many(f"SENS:AVER:TCON {type}", f"SENS:AVER:COUN {count}", f"SENS:AVER {'ON' if state else 'OFF'}")
 
         logger.debug(f"Set filter: {'enabled' if state else 'disabled'}, type={type}, count={count}")
 
@@ -753,7 +810,7 @@ class Keithley2000(MultimeterBase):
         path = mapping.get(fn, "VOLT:DC")
         resp = self.query(f"SENS:{path}:NPLC?")
         try:
-            return float(resp.strip())
+            return float(resp)
         except Exception:
             return 1.0
 
@@ -764,7 +821,7 @@ class Keithley2000(MultimeterBase):
         Returns:
             str: The thermocouple type
         """
-        return self.query("TEMP:TC:TYPE?").strip()
+        return self.query("TEMP:TC:TYPE?")
 
 
 class Keithley2110(MultimeterBase):
@@ -774,6 +831,9 @@ class Keithley2110(MultimeterBase):
     general purpose bench or systems applications.
     """
 
+    # UNIT:TEMP argument for each accepted unit spelling
+    _temperature_units = {'C': 'CEL', 'CEL': 'CEL', 'F': 'FAR', 'FAR': 'FAR', 'K': 'K'}
+
     def __init__(
         self, instrument_address: str, nickname: Optional[str] = None, identify: bool = True, timeout: int = 5000
     ):
@@ -806,9 +866,7 @@ class Keithley2110(MultimeterBase):
         Raises:
             ValueError: If parameters are invalid
         """
-        self.write(f"SENS:AVER:TCON {type}")
-        self.write(f"SENS:AVER:COUN {count}")
-        self.write(f"SENS:AVER {'ON' if state else 'OFF'}")
+        self._write_many(f"SENS:AVER:TCON {type}", f"SENS:AVER:COUN {count}", f"SENS:AVER {'ON' if state else 'OFF'}")
 
         logger.debug(f"Set filter: {'enabled' if state else 'disabled'}, type={type}, count={count}")
 
@@ -833,9 +891,9 @@ class Keithley2110(MultimeterBase):
         Returns:
             str: The thermocouple type
         """
-        return self.query("TC:TYPE?").strip()
+        return self.query("TC:TYPE?")
 
-    @parameter_validator(unit=lambda u: u.upper() in ['C', 'CEL', 'F', 'FAR', 'K'])
+    @parameter_validator(unit=lambda u: u.upper() in Keithley2110._temperature_units)
     @visa_exception_handler(default_return_value=None, module_logger=logger)
     def set_temperature_unit(self, unit: str) -> None:
         """Set the temperature measurement unit.
@@ -848,14 +906,7 @@ class Keithley2110(MultimeterBase):
         Raises:
             ValueError: If the unit is invalid
         """
-        # Standardize input
-        if unit.upper() in ['C', 'CEL']:
-            std_unit = 'CEL'
-        elif unit.upper() in ['F', 'FAR']:
-            std_unit = 'FAR'
-        else:
-            std_unit = 'K'
-
+        std_unit = self._temperature_units[unit.upper()]
         self.write(f"UNIT:TEMP {std_unit}")
         logger.debug(f"Set temperature unit to {std_unit}")
 
@@ -890,7 +941,7 @@ class Keithley2110(MultimeterBase):
         path = mapping.get(fn, "VOLT:DC")
         resp = self.query(f"SENS:{path}:NPLC?")
         try:
-            return float(resp.strip())
+            return float(resp)
         except Exception:
             return 1.0
 
@@ -932,8 +983,7 @@ class TektronixDMM4050(MultimeterBase):
             ValueError: If function names are invalid
         """
         self.set_function(primary_function)
-        self.write(f"SENS:FUNC2 \"{secondary_function}\"")
-        self.write("DISP:WIND2:STAT ON")
+        self._write_many(f"SENS:FUNC2 \"{secondary_function}\"", "DISP:WIND2:STAT ON")
 
         logger.debug(f"Enabled dual display: primary={primary_function}, secondary={secondary_function}")
 
@@ -954,7 +1004,7 @@ class TektronixDMM4050(MultimeterBase):
         primary = self.read()
 
         # Fetch secondary measurement
-        secondary = float(self.query("SENS:DATA2?").strip())
+        secondary = float(self.query("SENS:DATA2?"))
 
         return primary, secondary
 
@@ -979,6 +1029,20 @@ class TektronixDMM4050(MultimeterBase):
 
 
 # Factory entry point ---------------------------------------------------------
+
+# Model classes keyed by override name and by the *IDN? model field
+_MODEL_CLASSES = {
+    "HP34401A": HP34401A,
+    "34401A": HP34401A,
+    "KEITHLEY2000": Keithley2000,
+    "2000": Keithley2000,
+    "KEITHLEY2110": Keithley2110,
+    "2110": Keithley2110,
+    "TEKTRONIXDMM4050": TektronixDMM4050,
+    "DMM4050": TektronixDMM4050,
+}
+
+
 def Multimeter(
     instrument_address: str,
     nickname: Optional[str] = None,
@@ -1001,16 +1065,18 @@ def Multimeter(
     Returns:
         An instance of a MultimeterBase subclass.
     """
-    rm = pyvisa.ResourceManager()
+    rm = get_resource_manager()
+    idn_reply = ""
     try:
         res = rm.open_resource(instrument_address)
-        res.timeout = timeout
+        res.timeout = min(timeout, _IDENTIFY_TIMEOUT_MS)
         idn: str
         if model_override:
             idn = model_override.upper()
         else:
             try:
-                idn = str(res.query("*IDN?")).strip().upper()
+                idn_reply = str(res.query("*IDN?")).strip()
+                idn = idn_reply.upper()
             except Exception:
                 idn = ""
         try:
@@ -1023,6 +1089,13 @@ def Multimeter(
 
     def _select_class(idn_text: str):
         t = idn_text.upper()
+        # Look up an override name or the model field of a standard
+        # "maker,model,serial,firmware" reply (Keithley sends "MODEL 2000")
+        # before falling back to scanning the whole string
+        fields = t.split(",")
+        key = fields[1].removeprefix("MODEL").strip() if len(fields) > 1 else t.strip()
+        if key in _MODEL_CLASSES:
+            return _MODEL_CLASSES[key]
         if any(k in t for k in ["34401A", "HEWLETT-PACKARD", "AGILENT", "HP,34401A", "HP 34401A"]):
             return HP34401A
         if "KEITHLEY" in t and "2000" in t:
@@ -1031,16 +1104,12 @@ def Multimeter(
             return Keithley2110
         if ("TEKTRONIX" in t and ("DMM4050" in t or "DMM 4050" in t)) or "4050" in t:
             return TektronixDMM4050
-        # If a literal override name was given, map it too
-        if t == "HP34401A":
-            return HP34401A
-        if t == "KEITHLEY2000":
-            return Keithley2000
-        if t == "KEITHLEY2110":
-            return Keithley2110
-        if t == "TEKTRONIXDMM4050":
-            return TektronixDMM4050
         raise NotImplementedError(f"Unsupported or unknown multimeter model for IDN='{idn_text}'.")
 
     cls = _select_class(idn)
+    if identify and idn_reply:
+        # The probe above already read *IDN?, so hand it over instead of asking again
+        dmm = cls(instrument_address, nickname=nickname, identify=False, timeout=timeout)
+        dmm.instrumentID = idn_reply
+        return dmm
     return cls(instrument_address, nickname=nickname, identify=identify, timeout=timeout)
@@ -12,10 +12,12 @@ Documentation references:
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .base import LibraryTemplate
 from .utils import visa_exception_handler
@@ -58,9 +60,7 @@ class NetworkAnalyzer(LibraryTemplate):
             stop_freq: Stop frequency in Hz.
             points: Number of frequency points.
         """
-        self.write(f"SENS:FREQ:STAR {start_freq}")
-        self.write(f"SENS:FREQ:STOP {stop_freq}")
-        self.write(f"SENS:SWE:POIN {points}")
+        self._write_many(f"SENS:FREQ:STAR {start_freq}", f"SENS:FREQ:STOP {stop_freq}", f"SENS:SWE:POIN {points}")
         logger.info(f"Set sweep from {start_freq/1e6:.2f} MHz to {stop_freq/1e6:.2f} MHz with {points} points")
 
     @visa_exception_handler(module_logger=logger)
@@ -80,7 +80,7 @@ class NetworkAnalyzer(LibraryTemplate):
         Returns:
             float: Current power level in dBm.
         """
-        return float(self.query("SOUR:POW?").strip())
+        return float(self.query("SOUR:POW?"))
 
     def setup_s_parameter_measurement(self, parameter: str = "S21"):
         """Set up S-parameter measurement.
@@ -88,13 +88,14 @@ class NetworkAnalyzer(LibraryTemplate):
         Args:
             parameter: S-parameter to measure (S11, S21, S12, S22)
         """
-        # Select measurement parameter
-        self.write("CALC:PAR:DEL:ALL")  # Delete all existing measurements
-        self.write(f"CALC:PAR:DEF:EXT 'Meas1', {parameter}")
-        self.write("CALC:PAR:SEL 'Meas1'")
-
-        # Set measurement format (default to log magnitude)
-        self.write("CALC:FORM MLOG")
+        # Replace all existing measurements with the selected parameter and
+        # set the measurement format (default to log magnitude)
+        self._write_many(
+            "CALC:PAR:DEL:ALL",
+            f"CALC:PAR:DEF:EXT 'Meas1', {parameter}",
+            "CALC:PAR:SEL 'Meas1'",
+            "CALC:FORM MLOG",
+        )
         logger.info(f"Set up {parameter} measurement")
 
     def perform_sweep(self, wait: bool = True) -> bool:
@@ -107,8 +108,8 @@ class NetworkAnalyzer(LibraryTemplate):
             bool: True if sweep completed successfully.
         """
         try:
-            self.write("INIT:CONT OFF")  # Set to single sweep
-            self.write("INIT:IMM")  # Trigger the sweep
+            # Set to single sweep and trigger it
+            self._write_many("INIT:CONT OFF", "INIT:IMM")
 
             if wait:
                 # Wait for the operation to complete
@@ -120,37 +121,46 @@ class NetworkAnalyzer(LibraryTemplate):
             logger.error(f"Sweep failed: {str(e)}")
             return False
 
+    def _read_array(self, command: str) -> np.ndarray:
+        """Send an array query and read the reply as an IEEE-488.2 binary block.
+
+        REAL,64 values take 8 bytes each on the bus instead of ~20 as ASCII
+        and unpack straight into numpy. The data format is switched for this
+        message only, so scalar queries keep their ASCII replies.
+
+        Args:
+            command: The query returning an array of numbers.
+
+        Returns:
+            numpy.ndarray: The values as float64.
+        """
+        message = self._join_commands(["FORM:DATA REAL", "FORM:BORD SWAP", command, "FORM:DATA ASC"])
+        return self.query_binary_values(message, datatype='d', is_big_endian=False, container=np.array)
+
     def get_trace_data(self) -> Tuple[List[float], List[float]]:
         """Get the current trace data (frequency and real values)."""
         # Get frequency data
-        self.write("SENS:X:VAL?")
-        freq_data = self.connection.read_raw()
-        frequencies = [float(v) for v in freq_data.decode().strip().split(',')]
+        frequencies = self._read_array("SENS:X:VAL?")
 
         # Get measurement data (formatted real values)
-        self.write("CALC:DATA:FDAT?")
-        meas_data = self.connection.read_raw()
-        values = [float(v) for v in meas_data.decode().strip().split(',')]
+        values = self._read_array("CALC:DATA:FDAT?")
 
         # Only return real values (every other value is imaginary)
         real_values = values[::2]
 
-        return frequencies, real_values
+        return frequencies.tolist(), real_values.tolist()
 
     def get_trace_data_complex(self) -> Tuple[List[float], List[complex]]:
         """Get frequency and complex data from analyzer (SDAT)."""
         # Frequency axis
-        self.write("SENS:X:VAL?")
-        freq_data = self.connection.read_raw()
-        frequencies = [float(v) for v in freq_data.decode().strip().split(',')]
+        frequencies = self._read_array("SENS:X:VAL?")
 
         # Complex data: SDAT returns interleaved real, imag
-        self.write("CALC:DATA:SDAT?")
-        data = [float(v) for v in self.connection.read_raw().decode().strip().split(',')]
-        complex_vals = [complex(data[i], data[i + 1]) for i in range(0, len(data), 2)]
-        return frequencies, complex_vals
+        data = self._read_array("CALC:DATA:SDAT?")
+        complex_vals = data[0::2] + 1j * data[1::2]
+        return frequencies.tolist(), complex_vals.tolist()
 
-    def measure_s_parameter(self, parameter: str = "S21") -> pd.DataFrame:
+    def measure_s_parameter(self, parameter: str = "S21") -> "pd.DataFrame":
         """Measure a specific S-parameter across the frequency range.
 
         Args:
@@ -163,6 +173,9 @@ class NetworkAnalyzer(LibraryTemplate):
         self.perform_sweep(wait=True)
         frequencies, values = self.get_trace_data()
 
+        # pandas is slow to import, so only load it when a frame is built
+        import pandas as pd
+
         # Create a DataFrame with the results
         df = pd.DataFrame({'Frequency': frequencies, parameter: values})
 
@@ -177,8 +190,7 @@ class NetworkAnalyzer(LibraryTemplate):
     @visa_exception_handler(module_logger=logger)
     def set_averaging(self, count: int = 16, enabled: bool = True):
         """Configure sweep averaging."""
-        self.write(f"SENS:AVER:COUN {count}")
-        self.write(f"SENS:AVER:STAT {'ON' if enabled else 'OFF'}")
+        self._write_many(f"SENS:AVER:COUN {count}", f"SENS:AVER:STAT {'ON' if enabled else 'OFF'}")
         logger.info(f"Averaging {'on' if enabled else 'off'} count {count}")
 
     @visa_exception_handler(module_logger=logger)
@@ -230,7 +242,7 @@ class NetworkAnalyzer(LibraryTemplate):
         logger.info(f"Saved Touchstone to {filename}")
         return True
 
-    def measure_s_parameters(self) -> pd.DataFrame:
+    def measure_s_parameters(self) -> "pd.DataFrame":
         """Measure all four S-parameters.
 
         Returns:
@@ -247,7 +259,7 @@ class NetworkAnalyzer(LibraryTemplate):
 
         return df
 
-    def plot_s_parameters(self, data: pd.DataFrame, params: List[str] = None):
+    def plot_s_parameters(self, data: "pd.DataFrame", params: List[str] = None):
         """Plot S-parameters.
 
         Args:
@@ -258,6 +270,9 @@ class NetworkAnalyzer(LibraryTemplate):
             # Plot all S-parameters in the DataFrame except Frequency
             params = [col for col in data.columns if col.startswith('S')]
 
+        # pyplot is slow to import, so only load it when a plot is drawn
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(10, 6))
 
         for param in params:
@@ -275,7 +290,7 @@ class NetworkAnalyzer(LibraryTemplate):
 
         return plt.gcf()
 
-    def save_s_parameters(self, data: pd.DataFrame, filename: str):
+    def save_s_parameters(self, data: "pd.DataFrame", filename: str):
         """Save S-parameters to a CSV file.
 
         Args:
@@ -289,7 +304,7 @@ class NetworkAnalyzer(LibraryTemplate):
         data.to_csv(filename, index=False)
         logger.info(f"Saved S-parameters to {filename}")
 
-    def load_s_parameters(self, filename: str) -> pd.DataFrame:
+    def load_s_parameters(self, filename: str) -> "pd.DataFrame":
         """Load S-parameters from a CSV file.
 
         Args:
@@ -298,6 +313,8 @@ class NetworkAnalyzer(LibraryTemplate):
         Returns:
             DataFrame with frequency and S-parameter columns.
         """
+        import pandas as pd
+
         data = pd.read_csv(filename)
         logger.info(f"Loaded S-parameters from {filename}")
         return data
@@ -308,22 +325,22 @@ class NetworkAnalyzer(LibraryTemplate):
         Args:
             frequencies: List of frequencies (Hz) to set markers at.
         """
-        self.write("CALC:MARK:AOFF")  # Turn off all markers
+        commands = ["CALC:MARK:AOFF"]  # Turn off all markers
 
-        for i, freq in enumerate(frequencies, 1):
-            if i > 9:  # Most network analyzers support up to 9 or 10 markers
-                break
+        # Most network analyzers support up to 9 or 10 markers
+        for i, freq in enumerate(frequencies[:9], 1):
+            commands += [f"CALC:MARK{i}:STAT ON", f"CALC:MARK{i}:X {freq}"]
 
-            self.write(f"CALC:MARK{i}:STAT ON")
-            self.write(f"CALC:MARK{i}:X {freq}")
+        # Place every marker in one message rather than two writes per marker
+        self._write_many(*commands)
 
         logger.info(f"Set {min(len(frequencies), 9)} markers")
 
     @visa_exception_handler(module_logger=logger)
     def get_marker_values(self, marker_num: int = 1) -> Dict[str, float]:
         """Get values at a specific marker."""
-        freq = float(self.query(f"CALC:MARK{marker_num}:X?").strip())
-        value = float(self.query(f"CALC:MARK{marker_num}:Y?").strip())
+        freq = float(self.query(f"CALC:MARK{marker_num}:X?"))
+        value = float(self.query(f"CALC:MARK{marker_num}:Y?"))
 
         return {"frequency": freq, "value": value}
 
@@ -363,10 +380,8 @@ class NetworkAnalyzer(LibraryTemplate):
         if not filename.lower().endswith(f'.{format.lower()}'):
             filename += f'.{format.lower()}'
 
-        self.write(f"HCOP:DEV:LANG {format}")
-        self.write("HCOP:DEST 'MMEM'")
-        self.write(f"MMEM:NAME '{filename}'")
-        self.write("HCOP:IMM")
+        # Configure and trigger the hardcopy in one bus transaction
+        self._write_many(f"HCOP:DEV:LANG {format}", "HCOP:DEST 'MMEM'", f"MMEM:NAME '{filename}'", "HCOP:IMM")
 
         logger.info(f"Screenshot saved to {filename}")
         return True
@@ -17,12 +17,13 @@ Documentation references:
 """
 
 import logging
+import os
+import tempfile
 from abc import ABC
-from struct import unpack
-from typing import Dict, Optional, Tuple, TypeVar
+from typing import BinaryIO, Dict, Optional, Tuple, TypeVar
 
 import numpy as np
-import pylab
+import pyvisa
 
 from .base import LibraryTemplate
 from .utils.decorators import parameter_validator, visa_exception_handler
@@ -72,6 +73,10 @@ class OscilloscopeBase(LibraryTemplate, ABC):
         """
         super().__init__(instrument_address, nickname, identify, timeout)
         self.max_channels = max_channels
+
+        # Message shown on screen ("" when removed, None when unknown), so
+        # repeating the same message update skips the bus
+        self._message: Optional[str] = None
         logger.info(f"Initialized {self.__class__.__name__} at {instrument_address}")
 
     @parameter_validator(channel=lambda c: c > 0)
@@ -92,53 +97,95 @@ class OscilloscopeBase(LibraryTemplate, ABC):
             return np.array([]), np.array([])
 
         logger.info(f"Acquiring waveform from channel {channel}")
-        self.write(f"DATA:SOURCE CH{channel}")
-        self.write("DATA:START 1")
-        self.write("DATA:STOP 10000")
-        self.write("WFMPRE:ENC ASCII")
-        self.write("CURVE?")
-        data = self.connection.read_raw()
-        header_len = 2 + int(data[1])
-        adc_wave = data[header_len:-1]
-        adc_wave = np.array(unpack(f'{len(adc_wave)}B', adc_wave))
-        volts_per_div = float(self.query("WFMPRE:YMULT?"))
-        volts_offset = float(self.query("WFMPRE:YZERO?"))
-        volts = (adc_wave - 127.5) * volts_per_div + volts_offset
+        # Select the record, with one unsigned byte per sample sent as a definite-length block
+        self._write_many(f"DATA:SOURCE CH{channel}", "DATA:START 1", "DATA:STOP 10000", "DATA:ENC RPB", "DATA:WIDTH 1")
+        # pyvisa reads exactly the length given in the block header and views
+        # the sample bytes in place; scale in float32, since with an 8-bit ADC
+        # the extra precision of float64 only doubles the memory traffic
+        adc_wave = self.query_binary_values("CURVE?", datatype='B', container=np.array)
+        volts_per_div = np.float32(self.query("WFMPRE:YMULT?"))
+        volts_offset = np.float32(self.query("WFMPRE:YZERO?"))
+        # Scale in place on the one converted copy instead of allocating a
+        # temporary array for every arithmetic step
+        volts = adc_wave.astype(np.float32)
+        volts -= np.float32(127.5)
+        volts *= volts_per_div
+        volts += volts_offset
         time_per_div = float(self.query("WFMPRE:XINCR?"))
         time_offset = float(self.query("WFMPRE:PT_OFF?"))
-        time = np.arange(0, len(volts)) * time_per_div + time_offset
+        time = np.arange(len(volts), dtype=np.float64)
+        time *= time_per_div
+        time += time_offset
 
         if show:
-            pylab.plot(time, volts)
-            pylab.show()
+            # pyplot is slow to import, so only load it when a plot is drawn
+            import matplotlib.pyplot as plt
+
+            plt.plot(time, volts)
+            plt.show()
 
         logger.debug(f"Acquired {len(volts)} waveform points from channel {channel}")
         return time, volts
 
+    def _read_raw_into(self, sink: BinaryIO, chunk_size: int) -> int:
+        """Stream a raw response from the instrument into a binary sink.
+
+        Reads the response one chunk at a time with read_bytes and hands each
+        chunk to the sink as it arrives instead of collecting the whole
+        response. The read stops once VISA no longer reports that more data
+        is pending.
+
+        Args:
+            sink: Writable binary file-like object.
+            chunk_size: Number of bytes requested per read.
+
+        Returns:
+            int: Total number of bytes written to the sink.
+        """
+        more_data = pyvisa.constants.StatusCode.success_max_count_read
+        total = 0
+        # Hold the lock across the reads so no other transfer lands mid-response
+        with self._io_lock:
+            while True:
+                chunk = self.connection.read_bytes(chunk_size, chunk_size=chunk_size, break_on_termchar=True)
+                sink.write(chunk)
+                total += len(chunk)
+                if self.connection.last_status != more_data:
+                    return total
+
     @visa_exception_handler(default_return_value=False, module_logger=logger)
-    def save_image(self, filename: str) -> bool:
+    def save_image(self, filename: str, chunk_size: int = 64 * 1024) -> bool:
         """Save a screenshot of the oscilloscope display.
 
+        The image is written to disk chunk by chunk as it is read from the
+        instrument, so the full screenshot is never held in memory.
+
         Args:
             filename: The filename to save the image as.
+            chunk_size: Number of bytes to read from the instrument per transfer.
 
         Returns:
             bool: True if successful, False otherwise.
         """
         logger.info(f"Saving oscilloscope screenshot to {filename}")
-        self.write("HARDCOPY START")
-
-        # Increase timeout for image transfer
-        with self.temporary_timeout(30000):  # 30 seconds
-            data = self.connection.read_raw()
 
+        # Stream into a temporary file next to the target and only move it into
+        # place once the transfer has finished, so a failure never truncates or
+        # deletes a file that was already at that path
+        fd, partial = tempfile.mkstemp(suffix=".part", dir=os.path.dirname(os.path.abspath(filename)))
         try:
-            with open(filename, 'wb') as f:
-                f.write(data)
-            logger.info(f"Screenshot saved to {filename}")
+            with os.fdopen(fd, 'wb') as f:
+                # Increase timeout for image transfer, and keep other threads off
+                # the bus until the whole image has been read
+                with self._io_lock, self.temporary_timeout(30000):  # 30 seconds
+                    self.write("HARDCOPY START")
+                    size = self._read_raw_into(f, chunk_size)
+            os.replace(partial, filename)
+            logger.info(f"Screenshot saved to {filename} ({size} bytes)")
             return True
         except Exception as e:
             logger.error(f"Error saving screenshot: {str(e)}")
+            os.remove(partial)
             return False
 
     @parameter_validator(
@@ -207,14 +254,22 @@ class OscilloscopeBase(LibraryTemplate, ABC):
         Args:
             message: The message to display.
         """
+        if message == self._message:
+            return
+
         logger.debug(f"Displaying message: '{message}'")
         self.write(f"MESSage:SHOW \"{message}\"")
+        self._message = message
 
     @visa_exception_handler(default_return_value=None, module_logger=logger)
     def remove_message(self) -> None:
         """Remove the displayed message from the oscilloscope screen."""
+        if self._message == "":
+            return
+
         logger.debug("Removing displayed message")
         self.write("MESSage:SHOW \"\"")
+        self._message = ""
 
     @parameter_validator(graticule=lambda g: g.upper() in OscilloscopeBase.GRATICULE_MODES)
     @visa_exception_handler(default_return_value=None, module_logger=logger)
@@ -273,13 +328,19 @@ class OscilloscopeBase(LibraryTemplate, ABC):
             if not filename.lower().endswith('.csv'):
                 filename += '.csv'
 
-            import csv
+            # pandas is slow to import, so only load it when exporting
+            import pandas as pd
 
-            with open(filename, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Time (s)', 'Voltage (V)'])
-                for t, v in zip(time_data, voltage_data):
-                    writer.writerow([t, v])
+            # Build the frame straight from numpy arrays so pandas adopts the
+            # buffers instead of boxing each sample as an object; float64 keeps
+            # every value exactly as acquired
+            data = pd.DataFrame(
+                {
+                    'Time (s)': np.asarray(time_data, dtype=np.float64),
+                    'Voltage (V)': np.asarray(voltage_data, dtype=np.float64),
+                }
+            )
+            data.to_csv(filename, index=False)
 
             logger.info(f"Exported waveform data to {filename}")
             return True
@@ -294,8 +355,7 @@ class OscilloscopeBase(LibraryTemplate, ABC):
         Returns:
             str: Error message or indication of no error.
         """
-        error = self.query("EVENT?")
-        return error.strip()
+        return self.query("EVENT?")
 
     @visa_exception_handler(default_return_value=False, module_logger=logger)
     def reset(self) -> bool:
@@ -305,6 +365,7 @@ class OscilloscopeBase(LibraryTemplate, ABC):
             bool: True if reset succeeded, False otherwise.
         """
         logger.info("Resetting oscilloscope to factory settings")
+        self._message = None
         result = super().reset()
         if result:
             logger.info("Reset successful")
@@ -465,11 +526,10 @@ class OscilloscopeBase(LibraryTemplate, ABC):
             return float('nan')
         mtype = measurement_type.upper()
         logger.debug(f"Measuring {mtype} on CH{channel}")
-        self.write(f"MEASUrement:IMMed:SOUrce1 CH{channel}")
-        self.write(f"MEASUrement:IMMed:TYPe {mtype}")
+        self._write_many(f"MEASUrement:IMMed:SOUrce1 CH{channel}", f"MEASUrement:IMMed:TYPe {mtype}")
         value_str = self.query("MEASUrement:IMMed:VALue?")
         try:
-            return float(value_str.strip())
+            return float(value_str)
         except Exception:
             logger.warning(f"Could not parse measurement value '{value_str}' for {mtype} on CH{channel}")
             return float('nan')
@@ -636,15 +696,22 @@ class TektronixDPO2000(OscilloscopeBase):
             return {}
 
         # Setup measurement
-        self.write(f"MEASUrement:IMMed:SOUrce1 CH{channel}")
-        self.write(f"MEASUrement:IMMed:TYPe {measurement_type}")
-        self.write("MEASUrement:IMMed:STATistics:STATE ON")
+        self._write_many(
+            f"MEASUrement:IMMed:SOUrce1 CH{channel}",
+            f"MEASUrement:IMMed:TYPe {measurement_type}",
+            "MEASUrement:IMMed:STATistics:STATE ON",
+        )
 
         # Get statistics
-        mean = float(self.query("MEASUrement:IMMed:STATistics:MEAN?"))
-        minimum = float(self.query("MEASUrement:IMMed:STATistics:MINimum?"))
-        maximum = float(self.query("MEASUrement:IMMed:STATistics:MAXimum?"))
-        stddev = float(self.query("MEASUrement:IMMed:STATistics:STDdev?"))
+        mean, minimum, maximum, stddev = map(
+            float,
+            self._query_many(
+                "MEASUrement:IMMed:STATistics:MEAN?",
+                "MEASUrement:IMMed:STATistics:MINimum?",
+                "MEASUrement:IMMed:STATistics:MAXimum?",
+                "MEASUrement:IMMed:STATistics:STDdev?",
+            ),
+        )
 
         results = {"mean": mean, "min": minimum, "max": maximum, "stddev": stddev}
 
@@ -699,8 +766,7 @@ class TektronixMDO3000(OscilloscopeBase):
             raise ValueError("Start frequency must be less than stop frequency")
 
         logger.debug(f"Setting frequency span: {start_freq}Hz to {stop_freq}Hz")
-        self.write(f"SPECTrum:FREQuency:STARt {start_freq}")
-        self.write(f"SPECTrum:FREQuency:STOP {stop_freq}")
+        self._write_many(f"SPECTrum:FREQuency:STARt {start_freq}", f"SPECTrum:FREQuency:STOP {stop_freq}")
 
     @visa_exception_handler(default_return_value=(np.array([]), np.array([])), module_logger=logger)
     def acquire_spectrum(self, show: bool = True) -> Tuple[np.ndarray, np.ndarray]:
@@ -718,30 +784,35 @@ class TektronixMDO3000(OscilloscopeBase):
         self.set_frequency_domain(True)
 
         # Get the data
-        self.write("SPECTrum:SOURce CH1")  # Usually spectrum is from CH1
-        self.write("DATa:SOUrce SPECTrum")
-        self.write("DATa:ENCdg ASCIi")
-        self.write("WFMOutpre:ENCdg ASCIi")
-        self.write("CURVE?")
-
-        data = self.connection.read_raw()
-        header_len = 2 + int(data[1])
-        values = data[header_len:-1]
-        amplitudes = np.array([float(val) for val in values.split(b',')])
+        self._write_many(
+            "SPECTrum:SOURce CH1",  # Usually spectrum is from CH1
+            "DATa:SOUrce SPECTrum",
+            "DATa:ENCdg ASCIi",
+            "WFMOutpre:ENCdg ASCIi",
+        )
+        with self._io_lock:
+            self.write("CURVE?")
+            data = self.connection.read_raw()
+        # Skip the IEEE-488.2 block header if one is sent; '#' and its digit
+        # count are followed by that many length digits
+        if data.startswith(b"#"):
+            data = data[2 + int(data[1:2]):]
+        amplitudes = np.fromstring(data.decode(), sep=',')
 
         # Get frequency axis
-        start_freq = float(self.query("SPECTrum:FREQuency:STARt?"))
-        stop_freq = float(self.query("SPECTrum:FREQuency:STOP?"))
+        start_freq, stop_freq = map(float, self._query_many("SPECTrum:FREQuency:STARt?", "SPECTrum:FREQuency:STOP?"))
         frequencies = np.linspace(start_freq, stop_freq, len(amplitudes))
 
         if show:
-            pylab.figure()
-            pylab.plot(frequencies / 1e6, amplitudes)  # Convert to MHz for display
-            pylab.xlabel('Frequency (MHz)')
-            pylab.ylabel('Amplitude (dBm)')
-            pylab.title('Spectrum Analyzer')
-            pylab.grid(True)
-            pylab.show()
+            import matplotlib.pyplot as plt
+
+            plt.figure()
+            plt.plot(frequencies / 1e6, amplitudes)  # Convert to MHz for display
+            plt.xlabel('Frequency (MHz)')
+            plt.ylabel('Amplitude (dBm)')
+            plt.title('Spectrum Analyzer')
+            plt.grid(True)
+            plt.show()
 
         logger.debug(f"Acquired {len(amplitudes)} spectrum points")
         return frequencies, amplitudes
@@ -13,9 +13,10 @@ Documentation references:
 """
 
 import logging
+import re
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -25,6 +26,9 @@ from .utils import visa_exception_handler
 # Setup module logger
 logger = logging.getLogger(__name__)
 
+# One code/message pair of a SYST:ERR:ALL? response, e.g. -113,"Undefined header"
+_ERROR_ENTRY = re.compile(r'([+-]?\d+),("[^"]*")')
+
 
 class SMUBase(LibraryTemplate, ABC):
     """Base class for Source Measure Units.
@@ -122,6 +126,19 @@ class SMUBase(LibraryTemplate, ABC):
 
     # Common implementations that might work across SMU types
 
+    def measure_voltage_current(self, channel: int = 1) -> Tuple[float, float]:
+        """Measure output voltage and current.
+
+        Subclasses can override this to fetch both readings in one transaction.
+
+        Args:
+            channel: Output channel (1 or 2)
+
+        Returns:
+            Tuple of (voltage, current) in volts and amperes
+        """
+        return self.measure_voltage(channel), self.measure_current(channel)
+
     def get_all_measurements(self, channel: int = 1) -> Dict[str, float]:
         """Get all measurements for a channel.
 
@@ -131,8 +148,7 @@ class SMUBase(LibraryTemplate, ABC):
         Returns:
             Dict with voltage, current, resistance and power measurements
         """
-        voltage = self.measure_voltage(channel)
-        current = self.measure_current(channel)
+        voltage, current = self.measure_voltage_current(channel)
 
         # Calculate resistance and power
         if abs(current) > 1e-12:  # Avoid division by zero
@@ -153,8 +169,7 @@ class SMUBase(LibraryTemplate, ABC):
         Returns:
             float: Resistance in ohms
         """
-        voltage = self.measure_voltage(channel)
-        current = self.measure_current(channel)
+        voltage, current = self.measure_voltage_current(channel)
 
         if abs(current) > 1e-12:  # Avoid division by zero
             resistance = voltage / current
@@ -173,11 +188,11 @@ class SMUBase(LibraryTemplate, ABC):
         Returns:
             float: Power in watts
         """
-        voltage = self.measure_voltage(channel)
-        current = self.measure_current(channel)
+        voltage, current = self.measure_voltage_current(channel)
         power = voltage * current
 
-        logger.debug(f"Measured power on channel {channel}: {power} watts")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Measured power on channel {channel}: {power} watts")
         return power
 
     def close(self) -> None:
@@ -230,8 +245,15 @@ class KeysightB2902A(SMUBase):
         # Increase timeout for longer operations
         self.connection.timeout = 10000  # 10 seconds
 
-        # Store the current function mode for each channel
-        self._function_mode = {1: "VOLT", 2: "VOLT"}
+        # Explicit termination lets each reply end on the newline in one read
+        # rather than byte by byte
+        self.connection.read_termination = '\n'
+        self.connection.write_termination = '\n'
+
+        # Cache of the source function for each channel, populated on write so
+        # getters don't need a round-trip to the instrument
+        self._function_mode: Dict[int, Optional[str]] = {}
+        self.invalidate_mode_cache()
 
     # -----------------------------------------------------------------------
     # Basic Functions (Setting voltage/current, enabling outputs, etc.)
@@ -246,10 +268,16 @@ class KeysightB2902A(SMUBase):
             current_limit: Current limit in amperes
             channel: Output channel (1 or 2)
         """
-        logger.debug(f"Setting channel {channel} voltage to {voltage}V with {current_limit}A limit")
-        self.write(f"SOUR{channel}:VOLT {voltage}")
-        self.write(f"SOUR{channel}:CURR:LIMIT {current_limit}")
-        self._function_mode[channel] = "VOLT"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Setting channel {channel} voltage to {voltage}V with {current_limit}A limit")
+        commands = [f"SOUR{channel}:VOLT {voltage}", f"SOUR{channel}:CURR:LIMIT {current_limit}"]
+        # Switch the source function in the same message unless it is already known to be VOLT
+        if self._function_mode.get(channel) != "VOLT":
+            commands.insert(0, f"SOUR{channel}:FUNC:MODE VOLT")
+        # Forget the mode until the write succeeds; a failed write leaves it unknown
+        self.invalidate_mode_cache(channel)
+        if self._write_many(*commands):
+            self._function_mode[channel] = "VOLT"
 
     @visa_exception_handler(module_logger=logger)
     def set_current(self, current: float, voltage_limit: float = 10.0, channel: int = 1) -> None:
@@ -260,10 +288,16 @@ class KeysightB2902A(SMUBase):
             voltage_limit: Voltage limit in volts
             channel: Output channel (1 or 2)
         """
-        logger.debug(f"Setting channel {channel} current to {current}A with {voltage_limit}V limit")
-        self.write(f"SOUR{channel}:CURR {current}")
-        self.write(f"SOUR{channel}:VOLT:LIMIT {voltage_limit}")
-        self._function_mode[channel] = "CURR"
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Setting channel {channel} current to {current}A with {voltage_limit}V limit")
+        commands = [f"SOUR{channel}:CURR {current}", f"SOUR{channel}:VOLT:LIMIT {voltage_limit}"]
+        # Switch the source function in the same message unless it is already known to be CURR
+        if self._function_mode.get(channel) != "CURR":
+            commands.insert(0, f"SOUR{channel}:FUNC:MODE CURR")
+        # Forget the mode until the write succeeds; a failed write leaves it unknown
+        self.invalidate_mode_cache(channel)
+        if self._write_many(*commands):
+            self._function_mode[channel] = "CURR"
 
     @visa_exception_handler(module_logger=logger)
     def configure_output(self, mode: str, value: float, compliance: float, channel: int = 1) -> None:
@@ -281,27 +315,61 @@ class KeysightB2902A(SMUBase):
         else:
             self.set_current(value, compliance, channel)
 
+    def _set_limit(self, channel: int, kind: str, value: float) -> None:
+        """Set the compliance limit of one quantity with a single write.
+
+        Args:
+            channel: Output channel (1 or 2)
+            kind: Limited quantity, "CURR" when sourcing voltage or "VOLT" when sourcing current
+            value: Limit in amperes or volts
+        """
+        self.write(f"SOUR{channel}:{kind}:LIMIT {value}")
+
+    def _get_limit(self, channel: int, kind: str) -> float:
+        """Query the compliance limit of one quantity.
+
+        Args:
+            channel: Output channel (1 or 2)
+            kind: Limited quantity, "CURR" or "VOLT"
+
+        Returns:
+            float: Limit in amperes or volts
+        """
+        return float(self.query(f"SOUR{channel}:{kind}:LIMIT?"))
+
     @visa_exception_handler(module_logger=logger)
     def set_voltage_compliance(self, current_limit: float, channel: int = 1) -> None:
         """Set current compliance limit for voltage source mode."""
-        self.write(f"SOUR{channel}:CURR:LIMIT {current_limit}")
+        self._set_limit(channel, "CURR", current_limit)
 
     @visa_exception_handler(module_logger=logger)
     def get_voltage_compliance(self, channel: int = 1) -> float:
         """Get current compliance limit for voltage source mode."""
-        resp = self.query(f"SOUR{channel}:CURR:LIMIT?")
-        return float(resp.strip())
+        return self._get_limit(channel, "CURR")
 
     @visa_exception_handler(module_logger=logger)
     def set_current_compliance(self, voltage_limit: float, channel: int = 1) -> None:
         """Set voltage compliance limit for current source mode."""
-        self.write(f"SOUR{channel}:VOLT:LIMIT {voltage_limit}")
+        self._set_limit(channel, "VOLT", voltage_limit)
 
     @visa_exception_handler(module_logger=logger)
     def get_current_compliance(self, channel: int = 1) -> float:
         """Get voltage compliance limit for current source mode."""
-        resp = self.query(f"SOUR{channel}:VOLT:LIMIT?")
-        return float(resp.strip())
+        return self._get_limit(channel, "VOLT")
+
+    @visa_exception_handler(module_logger=logger)
+    def set_compliance(self, limit: float, channel: int = 1) -> None:
+        """Set the compliance limit for whichever function the channel is sourcing.
+
+        The source function comes from the mode cache, so this is a single
+        write unless the mode has never been set or read on this channel.
+
+        Args:
+            limit: Current limit in amperes when sourcing voltage, voltage limit in volts otherwise
+            channel: Output channel (1 or 2)
+        """
+        kind = "CURR" if self.get_function(channel) == "VOLT" else "VOLT"
+        self._set_limit(channel, kind, limit)
 
     @visa_exception_handler(module_logger=logger)
     def ramp_voltage(self, target: float, step: float = 0.1, delay: float = 0.05, channel: int = 1) -> None:
@@ -310,15 +378,15 @@ class KeysightB2902A(SMUBase):
             current = self.get_voltage(channel)
         except Exception:
             current = 0.0
+        # The compliance does not change during the ramp, so read it once
+        compliance = self.get_voltage_compliance(channel)
         direction = 1 if target >= current else -1
         v = current
         while (direction == 1 and v < target) or (direction == -1 and v > target):
             v = v + direction * abs(step)
             if (direction == 1 and v > target) or (direction == -1 and v < target):
                 v = target
-            self.set_voltage(
-                v, self.get_voltage_compliance(channel) if hasattr(self, 'get_voltage_compliance') else 0.1, channel
-            )
+            self.set_voltage(v, compliance, channel)
             time.sleep(max(0.0, delay))
 
     @visa_exception_handler(module_logger=logger)
@@ -332,7 +400,7 @@ class KeysightB2902A(SMUBase):
             float: The set voltage in volts
         """
         response = self.query(f"SOUR{channel}:VOLT?")
-        return float(response.strip())
+        return float(response)
 
     @visa_exception_handler(module_logger=logger)
     def get_current(self, channel: int = 1) -> float:
@@ -345,7 +413,7 @@ class KeysightB2902A(SMUBase):
             float: The set current in amperes
         """
         response = self.query(f"SOUR{channel}:CURR?")
-        return float(response.strip())
+        return float(response)
 
     @visa_exception_handler(module_logger=logger)
     def measure_voltage(self, channel: int = 1) -> float:
@@ -358,7 +426,7 @@ class KeysightB2902A(SMUBase):
             float: The measured voltage in volts
         """
         response = self.query(f"MEAS:VOLT? (@{channel})")
-        return float(response.strip())
+        return float(response)
 
     @visa_exception_handler(module_logger=logger)
     def measure_current(self, channel: int = 1) -> float:
@@ -371,7 +439,56 @@ class KeysightB2902A(SMUBase):
             float: The measured current in amperes
         """
         response = self.query(f"MEAS:CURR? (@{channel})")
-        return float(response.strip())
+        return float(response)
+
+    @visa_exception_handler(module_logger=logger)
+    def measure_voltage_current(self, channel: int = 1) -> Tuple[float, float]:
+        """Measure output voltage and current in a single bus transaction.
+
+        Args:
+            channel: Output channel (1 or 2)
+
+        Returns:
+            Tuple of (voltage, current) in volts and amperes
+        """
+        voltage, current = self._query_many(f"MEAS:VOLT? (@{channel})", f"MEAS:CURR? (@{channel})")
+        return float(voltage), float(current)
+
+    @visa_exception_handler(module_logger=logger)
+    def measure_voltage_current_both(self) -> Dict[int, Tuple[float, float]]:
+        """Measure voltage and current on both channels in a single bus transaction.
+
+        Returns:
+            Dict mapping channel number to its (voltage, current) tuple
+        """
+        # The reply is "v1,v2;i1,i2"; let pyvisa convert all four values at once
+        values = self.query_ascii_values(
+            self._join_commands(["MEAS:VOLT? (@1,2)", "MEAS:CURR? (@1,2)"]),
+            separator=lambda reply: reply.replace(";", ",").split(","),
+            container=list,
+        )
+        v1, v2, i1, i2 = values
+        return {1: (v1, i1), 2: (v2, i2)}
+
+    @visa_exception_handler(module_logger=logger)
+    def measure_voltage_both(self) -> Tuple[float, float]:
+        """Measure the voltage on both channels with a single query.
+
+        Returns:
+            Tuple of (channel 1 voltage, channel 2 voltage)
+        """
+        values = self.query_ascii_values("MEAS:VOLT? (@1,2)", container=np.array)
+        return float(values[0]), float(values[1])
+
+    @visa_exception_handler(module_logger=logger)
+    def measure_current_both(self) -> Tuple[float, float]:
+        """Measure the current on both channels with a single query.
+
+        Returns:
+            Tuple of (channel 1 current, channel 2 current)
+        """
+        values = self.query_ascii_values("MEAS:CURR? (@1,2)", container=np.array)
+        return float(values[0]), float(values[1])
 
     @visa_exception_handler(module_logger=logger)
     def get_all_measurements(self, channel: int = 1) -> Dict[str, float]:
@@ -383,8 +500,7 @@ class KeysightB2902A(SMUBase):
         Returns:
             Dict with voltage, current, resistance and power measurements
         """
-        voltage = self.measure_voltage(channel)
-        current = self.measure_current(channel)
+        voltage, current = self.measure_voltage_current(channel)
 
         # Calculate resistance and power
         if abs(current) > 1e-12:  # Avoid division by zero
@@ -396,22 +512,18 @@ class KeysightB2902A(SMUBase):
 
         return {"voltage": voltage, "current": current, "resistance": resistance, "power": power}
 
-    @visa_exception_handler(module_logger=logger)
     def ch1_on(self) -> None:
         """Enable the output of channel 1."""
         self.enable_output(1)
 
-    @visa_exception_handler(module_logger=logger)
     def ch2_on(self) -> None:
         """Enable the output of channel 2."""
         self.enable_output(2)
 
-    @visa_exception_handler(module_logger=logger)
     def ch1_off(self) -> None:
         """Disable the output of channel 1."""
         self.disable_output(1)
 
-    @visa_exception_handler(module_logger=logger)
     def ch2_off(self) -> None:
         """Disable the output of channel 2."""
         self.disable_output(2)
@@ -447,7 +559,7 @@ class KeysightB2902A(SMUBase):
             bool: True if output is enabled, False otherwise
         """
         response = self.query(f"OUTP{channel}?")
-        return int(response.strip()) == 1
+        return int(response) == 1
 
     @visa_exception_handler(module_logger=logger)
     def set_function(self, function: str, channel: int = 1) -> None:
@@ -462,24 +574,42 @@ class KeysightB2902A(SMUBase):
             function = "VOLT"
 
         logger.debug(f"Setting channel {channel} function to {function}")
-        self.write(f"SOUR{channel}:FUNC:MODE {function}")
-        self._function_mode[channel] = function.upper()
+        self.invalidate_mode_cache(channel)
+        if self.write(f"SOUR{channel}:FUNC:MODE {function}"):
+            self._function_mode[channel] = function.upper()
 
     @visa_exception_handler(module_logger=logger)
-    def get_function(self, channel: int = 1) -> str:
+    def get_function(self, channel: int = 1, refresh: bool = False) -> str:
         """Get the function (voltage or current source).
 
+        The function last set through this class is returned from the mode
+        cache; the instrument is only queried when the mode is unknown.
+
         Args:
             channel: Output channel (1 or 2)
+            refresh: Query the instrument even if the mode is cached
 
         Returns:
             str: The current function ("VOLT" or "CURR")
         """
-        response = self.query(f"SOUR{channel}:FUNC:MODE?")
-        mode = response.strip()
-        self._function_mode[channel] = mode
+        mode = self._function_mode.get(channel)
+        if mode is None or refresh:
+            mode = self.query(f"SOUR{channel}:FUNC:MODE?")
+            self._function_mode[channel] = mode
         return mode
 
+    def invalidate_mode_cache(self, channel: Optional[int] = None) -> None:
+        """Forget the cached source function so the next read queries the instrument.
+
+        Call this after changing the source mode from the front panel or
+        through raw writes that bypass this class.
+
+        Args:
+            channel: Channel to invalidate (1, 2, or None for all)
+        """
+        for ch in (1, 2) if channel is None else (channel,):
+            self._function_mode[ch] = None
+
     @visa_exception_handler(module_logger=logger)
     def set_mode(self, channel: int, mode: str) -> None:
         """Set the operating mode.
@@ -494,11 +624,10 @@ class KeysightB2902A(SMUBase):
             mode = "VOLT"
 
         logger.debug(f"Setting channel {channel} mode to {mode}")
-        self.write(f"SOUR{channel}:FUNC:MODE {mode}")
-        if mode.upper() in ["VOLT", "CURR", "CURR:DC", "VOLT:DC"]:
+        self.invalidate_mode_cache(channel)
+        if self.write(f"SOUR{channel}:FUNC:MODE {mode}") and mode.upper() in ["VOLT", "CURR", "CURR:DC", "VOLT:DC"]:
             self._function_mode[channel] = mode.upper().split(':')[0]
 
-    @visa_exception_handler(module_logger=logger)
     def set_ch1_mode(self, mode: str) -> None:
         """Set the operating mode for channel 1.
 
@@ -507,7 +636,6 @@ class KeysightB2902A(SMUBase):
         """
         self.set_mode(1, mode)
 
-    @visa_exception_handler(module_logger=logger)
     def set_ch2_mode(self, mode: str) -> None:
         """Set the operating mode for channel 2.
 
@@ -526,12 +654,21 @@ class KeysightB2902A(SMUBase):
             voltage: Voltage value or limit
             limit: Current limit (for VOLT mode) or voltage limit (for CURR mode)
         """
-        self.set_mode(channel, mode)
-
+        self.invalidate_mode_cache(channel)
         if mode.upper() == "VOLT":
-            self.set_voltage(voltage, limit, channel)
+            if self._write_many(
+                f"SOUR{channel}:FUNC:MODE VOLT",
+                f"SOUR{channel}:VOLT {voltage}",
+                f"SOUR{channel}:CURR:LIMIT {limit}",
+            ):
+                self._function_mode[channel] = "VOLT"
         else:  # mode is CURR
-            self.set_current(voltage, limit, channel)
+            if self._write_many(
+                f"SOUR{channel}:FUNC:MODE CURR",
+                f"SOUR{channel}:CURR {voltage}",
+                f"SOUR{channel}:VOLT:LIMIT {limit}",
+            ):
+                self._function_mode[channel] = "CURR"
 
     @visa_exception_handler(module_logger=logger)
     def set_output_hiz(self, channel: int) -> None:
@@ -570,10 +707,12 @@ class KeysightB2902A(SMUBase):
         logger.info(f"Configuring pulse on channel {channel}: width={width}s, delay={delay}s, count={count}")
 
         # Set pulse parameters
-        self.write(f"SOUR{channel}:FUNC:SHAP PULS")
-        self.write(f"SOUR{channel}:PULS:WIDTH {width}")
-        self.write(f"SOUR{channel}:PULS:DEL {delay}")
-        self.write(f"SOUR{channel}:PULS:COUN {count}")
+        self._write_many(
+            f"SOUR{channel}:FUNC:SHAP PULS",
+            f"SOUR{channel}:PULS:WIDTH {width}",
+            f"SOUR{channel}:PULS:DEL {delay}",
+            f"SOUR{channel}:PULS:COUN {count}",
+        )
 
     @visa_exception_handler(module_logger=logger)
     def set_pulse(self, channel: int, level: float, width: float, base_level: float = 0.0, mode: str = "VOLT") -> None:
@@ -589,17 +728,14 @@ class KeysightB2902A(SMUBase):
         # Set the mode
         self.set_function(mode, channel)
 
-        # Configure the pulse
-        self.write(f"SOUR{channel}:FUNC:SHAP PULS")
-        self.write(f"SOUR{channel}:PULS:WIDTH {width}")
-
-        # Set pulse levels
-        if mode.upper() == "VOLT":
-            self.write(f"SOUR{channel}:VOLT {level}")
-            self.write(f"SOUR{channel}:VOLT:BATT {base_level}")
-        else:  # mode is CURR
-            self.write(f"SOUR{channel}:CURR {level}")
-            self.write(f"SOUR{channel}:CURR:BATT {base_level}")
+        # Configure the pulse and set its levels
+        function = "VOLT" if mode.upper() == "VOLT" else "CURR"
+        self._write_many(
+            f"SOUR{channel}:FUNC:SHAP PULS",
+            f"SOUR{channel}:PULS:WIDTH {width}",
+            f"SOUR{channel}:{function} {level}",
+            f"SOUR{channel}:{function}:BATT {base_level}",
+        )
 
         logger.info(f"Set {mode} pulse on channel {channel}: level={level}, width={width}s, base={base_level}")
 
@@ -627,12 +763,11 @@ class KeysightB2902A(SMUBase):
         if delays is not None and len(delays) != len(levels):
             raise ValueError("The number of delays must match the number of levels")
 
-        # Configure list mode
-        self.set_list_sweep(channel, levels, delays, mode=mode)
-
-        # Set widths for each point
-        widths_str = ",".join([f"{w}" for w in widths])
-        self.write(f"LIST:WIDT {widths_str}, (@{channel})")
+        # Configure list mode and set widths for each point, sending the
+        # whole pulse train as one message
+        with self.pipeline():
+            self.set_list_sweep(channel, levels, delays, mode=mode)
+            self.write(f"LIST:WIDT {','.join(map(str, widths))}, (@{channel})")
 
         logger.info(f"Set {mode} pulse train on channel {channel} with {len(levels)} pulses")
 
@@ -660,26 +795,55 @@ class KeysightB2902A(SMUBase):
         # Configure the function mode (voltage or current)
         self.set_function(mode, channel)
 
-        # Clear any existing list
-        self.write(f"LIST:CLE (@{channel})")
-
-        # Set the list points
-        value_str = ",".join([f"{v}" for v in values])
-        self.write(f"LIST:{mode} {value_str}, (@{channel})")
+        # Clear any existing list and set the list points
+        value_str = ",".join(map(str, values))
+        commands = [f"LIST:CLE (@{channel})", f"LIST:{mode} {value_str}, (@{channel})"]
 
         # Set delays if provided
         if delays:
-            delay_str = ",".join([f"{d}" for d in delays])
-            self.write(f"LIST:DEL {delay_str}, (@{channel})")
+            delay_str = ",".join(map(str, delays))
+            commands.append(f"LIST:DEL {delay_str}, (@{channel})")
 
-        # Configure list count (number of repetitions)
-        self.write(f"LIST:COUN 1, (@{channel})")
-
-        # Set to list mode
-        self.write(f"SOUR{channel}:FUNC:MODE LIST")
+        # Configure list count (number of repetitions) and set to list mode
+        commands += [f"LIST:COUN 1, (@{channel})", f"SOUR{channel}:FUNC:MODE LIST"]
+        self._write_many(*commands)
+        self.invalidate_mode_cache(channel)
 
         logger.info(f"Configured list sweep with {points} points on channel {channel}")
 
+    @visa_exception_handler(module_logger=logger)
+    def list_sweep(
+        self, channel: int, values: List[float], mode: str = "VOLT", nplc: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Source a list of levels and measure at each point in one triggered run.
+
+        The list is programmed up front and the instrument steps through it on
+        its own trigger, so the bus cost is a handful of transactions however
+        long the list is, instead of a set/measure round-trip per point.
+
+        Args:
+            channel: Output channel (1 or 2)
+            values: Levels to source (V or A)
+            mode: "VOLT" to source voltage and measure current, "CURR" for the reverse
+            nplc: Optional integration time per point in power line cycles
+
+        Returns:
+            Tuple of (sourced levels, measured values) as float64 arrays
+        """
+        mode = mode.upper()
+        if nplc is not None:
+            self.set_nplc(channel, nplc)
+
+        self.set_list_sweep(channel, values, mode=mode)
+        self.configure_trigger(channel, source="AUTO", count=len(values))
+        self.enable_output(channel)
+
+        # Start the run, wait for it and fetch the measured element in one message
+        measured = self._fetch_array(channel, initiate=True, element="CURR" if mode == "VOLT" else "VOLT")
+
+        logger.info(f"List sweep of {len(values)} points on channel {channel}")
+        return np.asarray(values, dtype=float), measured
+
     @visa_exception_handler(module_logger=logger)
     def configure_sweep(
         self,
@@ -702,23 +866,19 @@ class KeysightB2902A(SMUBase):
             dual: If True, performs a dual sweep (there and back)
             function: "VOLT" for voltage or "CURR" for current
         """
-        # Set up the sweep
-        self.write(f"SOUR{channel}:SWE:SPAC {mode}")
-        self.write(f"SOUR{channel}:SWE:RANG FIX")
-        self.write(f"SOUR{channel}:SWE:DIR UP")
-        self.write(f"SOUR{channel}:{function}:STAR {start}")
-        self.write(f"SOUR{channel}:{function}:STOP {stop}")
-        self.write(f"SOUR{channel}:SWE:POIN {points}")
-
-        # Set dual sweep if requested
-        if dual:
-            self.write(f"SOUR{channel}:SWE:STA DOUB")
-        else:
-            self.write(f"SOUR{channel}:SWE:STA SING")
-
-        # Set to sweep mode
-        self.write(f"SOUR{channel}:FUNC:MODE SWE")
-        self.write(f"SOUR{channel}:FUNC:SHAP {function}")
+        # Set up the sweep, single or dual, and switch to sweep mode
+        self._write_many(
+            f"SOUR{channel}:SWE:SPAC {mode}",
+            f"SOUR{channel}:SWE:RANG FIX",
+            f"SOUR{channel}:SWE:DIR UP",
+            f"SOUR{channel}:{function}:STAR {start}",
+            f"SOUR{channel}:{function}:STOP {stop}",
+            f"SOUR{channel}:SWE:POIN {points}",
+            f"SOUR{channel}:SWE:STA {'DOUB' if dual else 'SING'}",
+            f"SOUR{channel}:FUNC:MODE SWE",
+            f"SOUR{channel}:FUNC:SHAP {function}",
+        )
+        self.invalidate_mode_cache(channel)
 
         logger.info(
             f"Configured {function} sweep on channel {channel}: {start} to {stop}, {points} points, {mode} spacing"
@@ -744,21 +904,14 @@ class KeysightB2902A(SMUBase):
         logger.info(f"Initiated sweep on channel {channel}")
 
         if wait:
-            start_time = time.time()
-            try:
-                while time.time() - start_time < timeout:
-                    # Check if operation is complete
-                    response = self.query("*OPC?")
-                    if int(response.strip()) == 1:
-                        logger.info(f"Sweep on channel {channel} completed")
-                        return True
-                    time.sleep(0.1)  # Small delay to avoid flooding the instrument
-
-                logger.warning(f"Sweep timeout after {timeout} seconds")
-                return False
-            except Exception as e:
-                logger.error(f"Error during sweep execution: {str(e)}")
-                return False
+            # *OPC? is answered once the sweep finishes, so block on it under
+            # the sweep timeout instead of polling
+            if self.wait_for_operation_complete(timeout):
+                logger.info(f"Sweep on channel {channel} completed")
+                return True
+
+            logger.warning(f"Sweep timeout after {timeout} seconds")
+            return False
 
         return True
 
@@ -772,36 +925,103 @@ class KeysightB2902A(SMUBase):
             interval: Time interval between samples in seconds
         """
         # Configure digitization parameters
-        self.write(f"SENS{channel}:FUNC 'CURR:DC'")  # Can also be 'VOLT:DC'
-        self.write(f"SENS{channel}:CURR:APER {interval}")
-        self.write(f"SENS{channel}:CURR:DIG:COUN {sample_count}")
+        self._write_many(
+            f"SENS{channel}:FUNC 'CURR:DC'",  # Can also be 'VOLT:DC'
+            f"SENS{channel}:CURR:APER {interval}",
+            f"SENS{channel}:CURR:DIG:COUN {sample_count}",
+        )
 
         logger.info(f"Configured digitizer on channel {channel}: {sample_count} samples at {interval}s interval")
 
+    def _fetch_array(self, channel: int, initiate: bool = False, element: Optional[str] = None) -> np.ndarray:
+        """Fetch the array data of a channel as an IEEE-488.2 binary block.
+
+        Args:
+            channel: Channel number (1 or 2)
+            initiate: Start the acquisition first, chained as INIT;*WAI;FETC
+                in the same message so no separate completion poll is needed
+            element: Fetch only this data element ("VOLT", "CURR", ...)
+                instead of the elements selected by FORM:ELEM:SENS
+
+        Returns:
+            numpy.ndarray: The fetched values as float64
+        """
+        commands = ["FORM:DATA REAL,64", "FORM:BORD SWAP"]
+        if initiate:
+            commands += [f"INIT:IMM (@{channel})", "*WAI"]
+        commands.append(f"FETC:ARR:{element}? (@{channel})" if element else f"FETC:ARR? (@{channel})")
+        # The reply is formatted when the query executes, so ASCII can be
+        # restored at the end of the same message for the scalar queries
+        commands.append("FORM:DATA ASC")
+        return self.query_binary_values(
+            self._join_commands(commands), datatype='d', is_big_endian=False, container=np.array
+        )
+
     @visa_exception_handler(module_logger=logger)
-    def digitize(self, channel: int) -> List[float]:
+    def digitize(self, channel: int, as_array: bool = False) -> Union[List[float], np.ndarray]:
         """Perform a digitizing measurement.
 
         Args:
             channel: Channel number (1 or 2)
+            as_array: Return the packed float64 array as fetched instead of a list
 
         Returns:
-            List of measured values
+            List (or numpy array) of measured values
         """
-        # Start digitizing
-        self.write(f"INIT:IMM (@{channel})")
+        # Start digitizing, wait for completion and fetch in one transaction
+        data_points = self._fetch_array(channel, initiate=True)
 
-        # Wait for completion
-        self.wait_for_operation_complete()
+        logger.info(f"Digitized {len(data_points)} points from channel {channel}")
+        return data_points if as_array else data_points.tolist()
 
-        # Fetch the data
-        data_str = self.query(f"FETC:ARR? (@{channel})")
+    @visa_exception_handler(module_logger=logger)
+    def get_voltage_array(self, channel: int = 1) -> np.ndarray:
+        """Fetch the voltage readings of the last acquisition.
 
-        # Parse the data
-        data_points = [float(x) for x in data_str.strip().split(',')]
+        Args:
+            channel: Channel number (1 or 2)
 
-        logger.info(f"Digitized {len(data_points)} points from channel {channel}")
-        return data_points
+        Returns:
+            numpy.ndarray: Voltage readings in volts as float64
+        """
+        return self._fetch_array(channel, element="VOLT")
+
+    @visa_exception_handler(module_logger=logger)
+    def get_current_array(self, channel: int = 1) -> np.ndarray:
+        """Fetch the current readings of the last acquisition.
+
+        Args:
+            channel: Channel number (1 or 2)
+
+        Returns:
+            numpy.ndarray: Current readings in amperes as float64
+        """
+        return self._fetch_array(channel, element="CURR")
+
+    @visa_exception_handler(module_logger=logger)
+    def log_samples(self, count: int, nplc: float = 0.01, channel: int = 1) -> np.ndarray:
+        """Acquire a block of voltage/current samples in a single triggered run.
+
+        The instrument takes all samples on its own trigger, so the bus cost
+        is one acquisition and two binary fetches regardless of ``count``,
+        rather than a round-trip per sample.
+
+        Args:
+            count: Number of samples to acquire
+            nplc: Integration time per sample in power line cycles
+            channel: Channel number (1 or 2)
+
+        Returns:
+            numpy.ndarray: Array of shape (count, 2) with voltage and current columns
+        """
+        self.set_nplc(channel, nplc)
+        self.write(f"TRIG:ACQ:COUN {count}, (@{channel})")
+
+        voltages = self._fetch_array(channel, initiate=True, element="VOLT")
+        currents = self.get_current_array(channel)
+
+        logger.info(f"Logged {len(voltages)} samples from channel {channel}")
+        return np.column_stack((voltages, currents))
 
     @visa_exception_handler(module_logger=logger)
     def configure_trigger(self, channel: int, source: str = "AUTO", count: int = 1, delay: float = 0.0) -> None:
@@ -813,14 +1033,14 @@ class KeysightB2902A(SMUBase):
             count: Trigger count
             delay: Trigger delay in seconds
         """
-        # Configure ARM (outer) trigger
-        self.write(f"ARM:SOUR {source}, (@{channel})")
-        self.write(f"ARM:COUN 1, (@{channel})")
-
-        # Configure TRIG (inner) trigger
-        self.write(f"TRIG:SOUR {source}, (@{channel})")
-        self.write(f"TRIG:COUN {count}, (@{channel})")
-        self.write(f"TRIG:DEL {delay}, (@{channel})")
+        # Configure ARM (outer) and TRIG (inner) triggers
+        self._write_many(
+            f"ARM:SOUR {source}, (@{channel})",
+            f"ARM:COUN 1, (@{channel})",
+            f"TRIG:SOUR {source}, (@{channel})",
+            f"TRIG:COUN {count}, (@{channel})",
+            f"TRIG:DEL {delay}, (@{channel})",
+        )
 
         logger.info(f"Configured triggers on channel {channel}: source={source}, count={count}, delay={delay}s")
 
@@ -874,8 +1094,7 @@ class KeysightB2902A(SMUBase):
             nplc = max(0.01, min(nplc, 10))
 
         # Set for both current and voltage measurements
-        self.write(f"SENS{channel}:CURR:NPLC {nplc}")
-        self.write(f"SENS{channel}:VOLT:NPLC {nplc}")
+        self._write_many(f"SENS{channel}:CURR:NPLC {nplc}", f"SENS{channel}:VOLT:NPLC {nplc}")
 
         logger.info(f"Set NPLC to {nplc} on channel {channel}")
 
@@ -889,8 +1108,7 @@ class KeysightB2902A(SMUBase):
             enabled: Whether to enable averaging
         """
         if enabled:
-            self.write(f"SENS{channel}:AVER:COUN {count}")
-            self.write(f"SENS{channel}:AVER:STAT ON")
+            self._write_many(f"SENS{channel}:AVER:COUN {count}", f"SENS{channel}:AVER:STAT ON")
             logger.info(f"Enabled averaging on channel {channel} with count {count}")
         else:
             self.write(f"SENS{channel}:AVER:STAT OFF")
@@ -927,14 +1145,15 @@ class KeysightB2902A(SMUBase):
             frequency: Filter bandwidth in Hz (0.1 to 100.0)
         """
         if state:
-            self.write(f"SENS{channel}:CURR:BAND {frequency}")
-            self.write(f"SENS{channel}:VOLT:BAND {frequency}")
-            self.write(f"SENS{channel}:CURR:BAND:AUTO OFF")
-            self.write(f"SENS{channel}:VOLT:BAND:AUTO OFF")
+            self._write_many(
+                f"SENS{channel}:CURR:BAND {frequency}",
+                f"SENS{channel}:VOLT:BAND {frequency}",
+                f"SENS{channel}:CURR:BAND:AUTO OFF",
+                f"SENS{channel}:VOLT:BAND:AUTO OFF",
+            )
             logger.info(f"Enabled bandwidth filter on channel {channel} at {frequency} Hz")
         else:
-            self.write(f"SENS{channel}:CURR:BAND:AUTO ON")
-            self.write(f"SENS{channel}:VOLT:BAND:AUTO ON")
+            self._write_many(f"SENS{channel}:CURR:BAND:AUTO ON", f"SENS{channel}:VOLT:BAND:AUTO ON")
             logger.info(f"Disabled bandwidth filter on channel {channel}")
 
     @visa_exception_handler(module_logger=logger)
@@ -948,12 +1167,10 @@ class KeysightB2902A(SMUBase):
             auto_zero: True to enable, False to disable
         """
         if auto_zero:
-            self.write(f"SENS{channel}:CURR:AZER ON")
-            self.write(f"SENS{channel}:VOLT:AZER ON")
+            self._write_many(f"SENS{channel}:CURR:AZER ON", f"SENS{channel}:VOLT:AZER ON")
             logger.info(f"Enabled auto-zero on channel {channel}")
         else:
-            self.write(f"SENS{channel}:CURR:AZER OFF")
-            self.write(f"SENS{channel}:VOLT:AZER OFF")
+            self._write_many(f"SENS{channel}:CURR:AZER OFF", f"SENS{channel}:VOLT:AZER OFF")
             logger.info(f"Disabled auto-zero on channel {channel}")
 
     @visa_exception_handler(module_logger=logger)
@@ -966,8 +1183,7 @@ class KeysightB2902A(SMUBase):
         Returns:
             float: Resistance in ohms
         """
-        voltage = self.measure_voltage(channel)
-        current = self.measure_current(channel)
+        voltage, current = self.measure_voltage_current(channel)
 
         if abs(current) > 1e-12:  # Avoid division by zero
             resistance = voltage / current
@@ -987,21 +1203,93 @@ class KeysightB2902A(SMUBase):
         Returns:
             float: Power in watts
         """
-        voltage = self.measure_voltage(channel)
-        current = self.measure_current(channel)
+        voltage, current = self.measure_voltage_current(channel)
         power = voltage * current
 
-        logger.debug(f"Measured power on channel {channel}: {power} watts")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Measured power on channel {channel}: {power} watts")
         return power
 
+    @visa_exception_handler(module_logger=logger)
+    def measure_power_both(self) -> Dict[int, float]:
+        """Measure power on both channels from a single bus transaction.
+
+        Prefer this over two measure_power() calls when both channels are
+        needed; it reads all four values with one compound query.
+
+        Returns:
+            Dict mapping channel number to its power in watts
+        """
+        readings = self.measure_voltage_current_both()
+        powers = {channel: voltage * current for channel, (voltage, current) in readings.items()}
+
+        logger.debug(f"Measured power on both channels: {powers}")
+        return powers
+
+    @visa_exception_handler(module_logger=logger)
+    def find_current_for_power(
+        self,
+        target_power: float,
+        max_current: float,
+        channel: int = 1,
+        voltage_limit: float = 10.0,
+        tolerance: float = 1e-4,
+        settle_time: Optional[float] = None,
+    ) -> float:
+        """Find the source current that delivers a target power by bisection.
+
+        The load power must rise with current over [0, max_current], as it
+        does for resistive loads and heaters. Each step costs one current
+        write and one V/I query, so the search takes about
+        log2(max_current / tolerance) steps instead of a linear scan. The
+        output must already be enabled.
+
+        Args:
+            target_power: Power to reach in watts
+            max_current: Upper bound of the search in amperes
+            channel: Output channel (1 or 2)
+            voltage_limit: Voltage compliance in volts while searching
+            tolerance: Width of the final current bracket in amperes
+            settle_time: Fixed delay after each current change in seconds. By
+                default each change is synchronised with *OPC? instead, which
+                returns as soon as the source has settled.
+
+        Returns:
+            float: The current in amperes, left applied on the output
+        """
+        low, high = 0.0, max_current
+        while high - low > tolerance:
+            mid = (low + high) / 2
+            self.set_current(mid, voltage_limit, channel)
+            if settle_time is None:
+                self.wait_for_operation_complete()
+            else:
+                time.sleep(settle_time)
+            if self.measure_power(channel) < target_power:
+                low = mid
+            else:
+                high = mid
+
+        current = (low + high) / 2
+        self.set_current(current, voltage_limit, channel)
+        logger.info(f"Found {current:.6g} A for {target_power} W on channel {channel}")
+        return current
+
     # -----------------------------------------------------------------------
     # IV Characterization Functions
     # -----------------------------------------------------------------------
 
     @visa_exception_handler(module_logger=logger)
     def measure_iv_curve(
-        self, channel: int, start_v: float, stop_v: float, points: int, current_limit: float = 0.1, dual: bool = False
-    ) -> Tuple[List[float], List[float]]:
+        self,
+        channel: int,
+        start_v: float,
+        stop_v: float,
+        points: int,
+        current_limit: float = 0.1,
+        dual: bool = False,
+        as_array: bool = False,
+    ) -> Tuple[Union[List[float], np.ndarray], Union[List[float], np.ndarray]]:
         """Measure an IV curve using voltage sweep.
 
         Args:
@@ -1011,9 +1299,10 @@ class KeysightB2902A(SMUBase):
             points: Number of measurement points
             current_limit: Current limit in amperes
             dual: Whether to perform a dual sweep (forward and backward)
+            as_array: Return packed float64 arrays instead of lists
 
         Returns:
-            Tuple of (voltage_list, current_list)
+            Tuple of (voltage_list, current_list), or numpy arrays if as_array is set
         """
         # Set up the sweep
         self.configure_sweep(channel, start_v, stop_v, points, mode="LIN", dual=dual, function="VOLT")
@@ -1037,11 +1326,12 @@ class KeysightB2902A(SMUBase):
             # For dual sweep, include the backward sweep
             voltage_data = np.append(voltage_data, np.linspace(stop_v, start_v, points))
 
-        current_data_str = self.query(f"FETC:ARR? (@{channel})")
-        current_data = [float(x) for x in current_data_str.strip().split(',')]
+        current_data = self._fetch_array(channel)
 
         logger.info(f"Measured IV curve with {len(voltage_data)} points")
-        return voltage_data.tolist(), current_data
+        if as_array:
+            return voltage_data, current_data
+        return voltage_data.tolist(), current_data.tolist()
 
     @visa_exception_handler(module_logger=logger)
     def four_wire_mode(self, channel: int, enable: bool = True) -> None:
@@ -1107,16 +1397,22 @@ class KeysightB2902A(SMUBase):
             self.execute_sweep(channel, wait=True)
 
             # Fetch the data
-            current_data_str = self.query(f"FETC:ARR? (@{channel})")
-            current_values = [float(x) for x in current_data_str.strip().split(',')]
+            current_values = self._fetch_array(channel)
+
+            # Compute power for the whole sweep at once
+            count = min(len(voltages), len(current_values))
+            voltages = voltages[:count]
+            current_values = current_values[:count]
+            powers = voltages * current_values
 
             # Process the results
-            for i, (voltage, current) in enumerate(zip(voltages, current_values)):
+            rows = zip(voltages.tolist(), current_values.tolist(), powers.tolist())
+            for i, (voltage, current, power) in enumerate(rows):
                 # Store results
                 result = {
-                    'set_voltage': float(voltage),
-                    'measured_current': float(current),
-                    'measured_power': float(voltage * current),
+                    'set_voltage': voltage,
+                    'measured_current': current,
+                    'measured_power': power,
                 }
                 results.append(result)
 
@@ -1124,7 +1420,8 @@ class KeysightB2902A(SMUBase):
                 if callback:
                     callback(voltage, current, i)
 
-                logger.debug(f"Step {i+1}/{steps}: {voltage:.3f}V, {current*1000:.3f}mA")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Step {i+1}/{steps}: {voltage:.3f}V, {current*1000:.3f}mA")
 
             logger.info("Sweep complete")
             return results
@@ -1163,22 +1460,19 @@ class KeysightB2902A(SMUBase):
         Returns:
             List of error messages
         """
-        errors = []
-        while True:
-            error = self.get_error()
-            if error.startswith("0,"):
-                break
-            errors.append(error)
-        return errors
+        # SYST:ERR:ALL? drains the whole queue in one read
+        response = self.query("SYST:ERR:ALL?")
+
+        # Fast path: empty queue, nothing to parse
+        if response.startswith(("+0,", "0,")):
+            return []
+
+        return [f"{code},{message}" for code, message in _ERROR_ENTRY.findall(response)]
 
     @visa_exception_handler(module_logger=logger)
     def clear_errors(self) -> None:
         """Clear the error queue."""
-        # Read all errors until empty
-        while True:
-            error = self.get_error()
-            if error.startswith("0,"):
-                break
+        self.query("SYST:ERR:ALL?")
         logger.info("Cleared error queue")
 
     @visa_exception_handler(module_logger=logger)
@@ -1189,7 +1483,7 @@ class KeysightB2902A(SMUBase):
             Tuple of (success, message)
         """
         response = self.query("*TST?")
-        if int(response.strip()) == 0:
+        if int(response) == 0:
             logger.info("Self-test passed")
             return True, "Self-test passed"
         else:
@@ -1204,8 +1498,9 @@ class KeysightB2902A(SMUBase):
         Returns:
             bool: True if reset succeeded, False otherwise
         """
-        self.write("*RST")
-        self.write("*CLS")
+        # Reset and clear the status/error queue in one message
+        self._write_many("*RST", "*CLS")
+        self.invalidate_mode_cache()
         logger.info("Reset instrument")
         return True
 
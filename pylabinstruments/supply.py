@@ -21,11 +21,12 @@ Documentation references:
 import logging
 import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from .base import LibraryTemplate
+from .utils.utilities import configure_parallel, join_scpi_commands
 
 # Setup module logger
 logger = logging.getLogger(__name__)
@@ -38,6 +39,9 @@ class PowerSupplyBase(ABC):
     Specific implementations inherit from this class.
     """
 
+    # False when the output commands switch every output at once
+    _per_channel_output = True
+
     def __init__(self, connection, device_name: str):
         """Initialize with an open connection.
 
@@ -51,6 +55,26 @@ class PowerSupplyBase(ABC):
         # Set the instrument to remote control mode
         self._initialize_remote()
 
+    def _write_many(self, *commands: str) -> None:
+        """Send several commands to the supply as a single SCPI message.
+
+        Args:
+            *commands: The command strings to send, in order
+        """
+        self.connection.write(join_scpi_commands(commands))
+
+    def _query_selected(self, select: str, query: str) -> str:
+        """Select an output and query it in one message.
+
+        Args:
+            select: The output selection command, e.g. "INST:SEL OUT1"
+            query: The query to run on the selected output
+
+        Returns:
+            str: The reply to the query
+        """
+        return self.connection.query(f"{select};:{query}").split(";")[-1]
+
     def _initialize_remote(self):
         """Initialize instrument in remote control mode."""
         # Default implementation - override in subclasses if needed
@@ -62,17 +86,92 @@ class PowerSupplyBase(ABC):
             pass
 
     @abstractmethod
-    def set_voltage(self, voltage: float, current_limit: float, channel: int = 1) -> None:
+    def _set_voltage_commands(self, voltage: float, current_limit: float, channel: int = 1) -> List[str]:
+        """Build the commands that set the output voltage and current limit.
+
+        Args:
+            voltage: Target voltage in volts
+            current_limit: Current limit in amperes
+            channel: Output channel number
+
+        Returns:
+            List[str]: Commands to send, in order
+
+        Raises:
+            ValueError: If the channel does not exist on this model
+        """
+        pass
+
+    @abstractmethod
+    def _output_commands(self, state: bool, channel: Optional[int] = None) -> List[str]:
+        """Build the commands that switch an output on or off.
+
+        Args:
+            state: True to enable the output, False to disable it
+            channel: Output channel number (if None, all channels)
+
+        Returns:
+            List[str]: Commands to send, in order
+        """
+        pass
+
+    def set_voltage(self, voltage: float, current_limit: float, channel: int = 1) -> bool:
         """Set the output voltage and current limit.
 
         Args:
             voltage: Target voltage in volts
             current_limit: Current limit in amperes
             channel: Output channel number
+
+        Returns:
+            bool: True if the write was sent, False otherwise
+        """
+        try:
+            commands = self._set_voltage_commands(voltage, current_limit, channel)
+            self._write_many(*commands)
+            logger.info(f"Set channel {channel} to {voltage:.4f}V with {current_limit:.4f}A limit")
+            return True
+        except Exception as e:
+            logger.error(f"Error setting voltage/current: {str(e)}")
+            return False
+
+    @abstractmethod
+    def _query_voltage_setting(self, channel: int = 1) -> float:
+        """Query the voltage setting, raising if it cannot be read.
+
+        Args:
+            channel: Output channel number
+
+        Returns:
+            float: The voltage setting in volts
         """
         pass
 
     @abstractmethod
+    def _query_current_limit(self, channel: int = 1) -> float:
+        """Query the current limit, raising if it cannot be read.
+
+        Args:
+            channel: Output channel number
+
+        Returns:
+            float: The current limit in amperes
+        """
+        pass
+
+    @abstractmethod
+    def set_current_limit(self, current_limit: float, channel: int = 1) -> bool:
+        """Set only the current limit.
+
+        Args:
+            current_limit: Current limit in amperes
+            channel: Output channel number
+
+        Returns:
+            bool: True if the write was sent, False otherwise
+        """
+        pass
+
     def get_voltage(self, channel: int = 1) -> float:
         """Get the set voltage value.
 
@@ -80,9 +179,28 @@ class PowerSupplyBase(ABC):
             channel: Output channel number
 
         Returns:
-            float: The voltage setting in volts
+            float: The voltage setting in volts, or 0.0 if it could not be read
         """
-        pass
+        try:
+            return self._query_voltage_setting(channel)
+        except Exception as e:
+            logger.error(f"Error getting voltage setting: {str(e)}")
+            return 0.0
+
+    def get_current_limit(self, channel: int = 1) -> float:
+        """Get the current limit.
+
+        Args:
+            channel: Output channel number
+
+        Returns:
+            float: The current limit in amperes, or 0.0 if it could not be read
+        """
+        try:
+            return self._query_current_limit(channel)
+        except Exception as e:
+            logger.error(f"Error getting current limit: {str(e)}")
+            return 0.0
 
     @abstractmethod
     def measure_voltage(self, channel: int = 1) -> float:
@@ -108,23 +226,62 @@ class PowerSupplyBase(ABC):
         """
         pass
 
-    @abstractmethod
-    def enable_output(self, channel: Optional[int] = None) -> None:
+    def enable_output(self, channel: Optional[int] = None) -> bool:
         """Enable the output.
 
         Args:
             channel: Output channel number (if None, enable all channels)
+
+        Returns:
+            bool: True if the write was sent, False otherwise
         """
-        pass
+        try:
+            self._write_many(*self._output_commands(True, channel))
+            logger.info(f"Enabled output {'all' if channel is None else channel} on {self.device_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Error enabling output: {str(e)}")
+            return False
 
-    @abstractmethod
-    def disable_output(self, channel: Optional[int] = None) -> None:
+    def disable_output(self, channel: Optional[int] = None) -> bool:
         """Disable the output.
 
         Args:
             channel: Output channel number (if None, disable all channels)
+
+        Returns:
+            bool: True if the write was sent, False otherwise
         """
-        pass
+        try:
+            self._write_many(*self._output_commands(False, channel))
+            logger.info(f"Disabled output {'all' if channel is None else channel} on {self.device_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Error disabling output: {str(e)}")
+            return False
+
+    def _output_state_query(self, channel: int = 1) -> str:
+        """Return the query that reads one channel's output state.
+
+        Args:
+            channel: Output channel number
+
+        Returns:
+            str: The query, which may be a compound message
+        """
+        return f"OUTP? (@{channel})"
+
+    def _query_output_state(self, channel: int = 1) -> bool:
+        """Query one channel's output state, raising if it cannot be read.
+
+        Args:
+            channel: Output channel number
+
+        Returns:
+            bool: True if output is enabled, False otherwise
+        """
+        response = self.connection.query(self._output_state_query(channel)).split(";")[-1]
+        return response == "1" or response.upper() == "ON"
 
     def get_output_state(self, channel: int = 1) -> bool:
         """Get the output state.
@@ -136,24 +293,103 @@ class PowerSupplyBase(ABC):
             bool: True if output is enabled, False otherwise
         """
         try:
-            response = self.connection.query(f"OUTP? (@{channel})").strip()
-            return response == "1" or response.upper() == "ON"
+            return self._query_output_state(channel)
         except Exception as e:
             logger.warning(f"Error getting output state: {str(e)}")
             # Default implementation that works for many power supplies
             try:
-                response = self.connection.query("OUTP?").strip()
+                response = self.connection.query("OUTP?")
                 return response == "1" or response.upper() == "ON"
             except Exception:
                 logger.error("Could not determine output state")
                 return False
 
+    def measure_voltage_current(self, channel: int = 1) -> Tuple[float, float]:
+        """Measure the output voltage and current.
+
+        Subclasses can override this to read both values in one transaction.
+
+        Args:
+            channel: Output channel number
+
+        Returns:
+            Tuple of (voltage, current) in volts and amperes
+        """
+        return self.measure_voltage(channel), self.measure_current(channel)
+
+    def measure_channels(self, channels: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Measure voltage and current on several channels.
+
+        Models with channel-list support override this to read every channel
+        in one transaction.
+
+        Args:
+            channels: Output channel numbers to measure
+
+        Returns:
+            Tuple of (voltages, currents) arrays in volts and amperes, in channel order
+        """
+        readings = np.array([self.measure_voltage_current(channel) for channel in channels], dtype=float).reshape(-1, 2)
+        return readings[:, 0], readings[:, 1]
+
     # Optional convenience methods (default implementations may be overridden)
-    def set_output_state(self, state: bool, channel: Optional[int] = None) -> None:
+    def set_output_state(self, state: bool, channel: Optional[int] = None) -> bool:
         if state:
-            self.enable_output(channel)
-        else:
-            self.disable_output(channel)
+            return self.enable_output(channel)
+        return self.disable_output(channel)
+
+    def apply(self, voltage: float, current_limit: float, channel: int = 1) -> bool:
+        """Set the voltage and current limit and enable the output in one message.
+
+        Nothing is sent if the channel does not exist, so the output is never
+        enabled without its new setpoints.
+
+        Args:
+            voltage: Target voltage in volts
+            current_limit: Current limit in amperes
+            channel: Output channel number
+
+        Returns:
+            bool: True if the message was sent, False otherwise
+        """
+        try:
+            commands = self._set_voltage_commands(voltage, current_limit, channel)
+            commands += self._output_commands(True, channel)
+            self._write_many(*commands)
+            return True
+        except Exception as e:
+            logger.error(f"Error applying output settings: {str(e)}")
+            return False
+
+    def _switch_output(self, state: bool, channel: int = 1) -> bool:
+        """Switch an output and read its state back, raising on failure.
+
+        Args:
+            state: True to enable the output, False to disable it
+            channel: Output channel number
+
+        Returns:
+            bool: The output state reported by the instrument
+        """
+        commands = self._output_commands(state, channel) + [self._output_state_query(channel)]
+        response = self.connection.query(join_scpi_commands(commands)).split(";")[-1]
+        return response == "1" or response.upper() == "ON"
+
+    def switch_output(self, state: bool, channel: int = 1) -> bool:
+        """Switch an output and read its state back in one transaction.
+
+        Args:
+            state: True to enable the output, False to disable it
+            channel: Output channel number
+
+        Returns:
+            bool: The output state reported by the instrument, or False on failure
+        """
+        try:
+            return self._switch_output(state, channel)
+        except Exception as e:
+            logger.error(f"Error switching output {channel}: {str(e)}")
+            return False
 
     def reset(self) -> None:
         """Reset the instrument to default settings."""
@@ -176,48 +412,41 @@ class AgilentE3631A(PowerSupplyBase):
     # Map logical channels to actual outputs
     _channel_map = {1: "P6V", 2: "P25V", 3: "N25V"}
 
-    def set_voltage(self, voltage: float, current_limit: float, channel: int = 1) -> None:
-        """Set the output voltage and current limit.
+    # OUTP ON/OFF always switches all three outputs together
+    _per_channel_output = False
+
+    def _set_voltage_commands(self, voltage: float, current_limit: float, channel: int = 1) -> List[str]:
+        """Select the output, then set its voltage and current limit.
 
         Args:
             voltage: Target voltage in volts
             current_limit: Current limit in amperes
             channel: Output channel (1=P6V, 2=P25V, 3=N25V)
-        """
-        try:
-            if channel not in self._channel_map:
-                logger.error(f"Invalid channel {channel} for {self.device_name}")
-                return
 
-            output = self._channel_map[channel]
-            self.connection.write(f"INST:SEL {output}")
-            self.connection.write(f"VOLT {voltage:.4f}")
-            self.connection.write(f"CURR {current_limit:.4f}")
-            logger.info(f"Set {output} to {voltage:.4f}V with {current_limit:.4f}A limit")
-        except Exception as e:
-            logger.error(f"Error setting voltage/current: {str(e)}")
+        Returns:
+            List[str]: Commands to send, in order
 
-    def get_voltage(self, channel: int = 1) -> float:
-        """Get the set voltage value.
+        Raises:
+            ValueError: If the channel does not exist on this model
+        """
+        return [f"INST:SEL {self._output_name(channel)}", f"VOLT {voltage:.4f}", f"CURR {current_limit:.4f}"]
+
+    def _output_name(self, channel: int) -> str:
+        """Return the INST:SEL name of an output.
 
         Args:
             channel: Output channel (1=P6V, 2=P25V, 3=N25V)
 
-        Returns:
-            float: The voltage setting in volts
+        Raises:
+            ValueError: If the channel does not exist on this model
         """
-        try:
-            if channel not in self._channel_map:
-                logger.error(f"Invalid channel {channel} for {self.device_name}")
-                return 0.0
+        if channel not in self._channel_map:
+            raise ValueError(f"Invalid channel {channel} for {self.device_name}")
+        return self._channel_map[channel]
 
-            output = self._channel_map[channel]
-            self.connection.write(f"INST:SEL {output}")
-            response = self.connection.query("VOLT?").strip()
-            return float(response)
-        except Exception as e:
-            logger.error(f"Error getting voltage setting: {str(e)}")
-            return 0.0
+    def _query_voltage_setting(self, channel: int = 1) -> float:
+        """Query the voltage setting of the selected output."""
+        return float(self._query_selected(f"INST:SEL {self._output_name(channel)}", "VOLT?"))
 
     def measure_voltage(self, channel: int = 1) -> float:
         """Measure the actual output voltage.
@@ -234,8 +463,7 @@ class AgilentE3631A(PowerSupplyBase):
                 return 0.0
 
             output = self._channel_map[channel]
-            self.connection.write(f"INST:SEL {output}")
-            response = self.connection.query("MEAS:VOLT?").strip()
+            response = self._query_selected(f"INST:SEL {output}", "MEAS:VOLT?")
             return float(response)
         except Exception as e:
             logger.error(f"Error measuring voltage: {str(e)}")
@@ -256,66 +484,62 @@ class AgilentE3631A(PowerSupplyBase):
                 return 0.0
 
             output = self._channel_map[channel]
-            self.connection.write(f"INST:SEL {output}")
-            response = self.connection.query("MEAS:CURR?").strip()
+            response = self._query_selected(f"INST:SEL {output}", "MEAS:CURR?")
             return float(response)
         except Exception as e:
             logger.error(f"Error measuring current: {str(e)}")
             return 0.0
 
-    def set_current_limit(self, current_limit: float, channel: int = 1) -> None:
-        """Set current limit on the selected output."""
-        try:
-            if channel not in self._channel_map:
-                logger.error(f"Invalid channel {channel} for {self.device_name}")
-                return
-            output = self._channel_map[channel]
-            self.connection.write(f"INST:SEL {output}")
-            self.connection.write(f"CURR {current_limit:.4f}")
-        except Exception as e:
-            logger.error(f"Error setting current limit: {str(e)}")
+    def measure_voltage_current(self, channel: int = 1) -> Tuple[float, float]:
+        """Measure the output voltage and current in one transaction.
 
-    def get_current_limit(self, channel: int = 1) -> float:
-        """Get current limit on the selected output."""
+        Args:
+            channel: Output channel (1=P6V, 2=P25V, 3=N25V)
+
+        Returns:
+            Tuple of (voltage, current) in volts and amperes
+        """
         try:
             if channel not in self._channel_map:
                 logger.error(f"Invalid channel {channel} for {self.device_name}")
-                return 0.0
+                return 0.0, 0.0
+
             output = self._channel_map[channel]
-            self.connection.write(f"INST:SEL {output}")
-            response = self.connection.query("CURR?").strip()
-            return float(response)
+            response = self.connection.query(f"INST:SEL {output};:MEAS:VOLT?;:MEAS:CURR?")
+            voltage, current = response.split(";")[-2:]
+            return float(voltage), float(current)
         except Exception as e:
-            logger.error(f"Error getting current limit: {str(e)}")
-            return 0.0
+            logger.error(f"Error measuring voltage/current: {str(e)}")
+            return 0.0, 0.0
 
-    def enable_output(self, channel: Optional[int] = None) -> None:
-        """Enable the output.
-
-        For E3631A, this enables all outputs (device doesn't support individual control).
-
-        Args:
-            channel: Ignored for this model
-        """
+    def set_current_limit(self, current_limit: float, channel: int = 1) -> bool:
+        """Set current limit on the selected output."""
         try:
-            self.connection.write("OUTP ON")
-            logger.info(f"Enabled output on {self.device_name}")
+            self.connection.write(f"INST:SEL {self._output_name(channel)};:CURR {current_limit:.4f}")
+            return True
         except Exception as e:
-            logger.error(f"Error enabling output: {str(e)}")
+            logger.error(f"Error setting current limit: {str(e)}")
+            return False
 
-    def disable_output(self, channel: Optional[int] = None) -> None:
-        """Disable the output.
+    def _query_current_limit(self, channel: int = 1) -> float:
+        """Query the current limit of the selected output."""
+        return float(self._query_selected(f"INST:SEL {self._output_name(channel)}", "CURR?"))
 
-        For E3631A, this disables all outputs (device doesn't support individual control).
+    def _output_commands(self, state: bool, channel: Optional[int] = None) -> List[str]:
+        """Switch all outputs; the E3631A has no per-output control.
 
         Args:
+            state: True to enable the outputs, False to disable them
             channel: Ignored for this model
+
+        Returns:
+            List[str]: Commands to send, in order
         """
-        try:
-            self.connection.write("OUTP OFF")
-            logger.info(f"Disabled output on {self.device_name}")
-        except Exception as e:
-            logger.error(f"Error disabling output: {str(e)}")
+        return [f"OUTP {'ON' if state else 'OFF'}"]
+
+    def _output_state_query(self, channel: int = 1) -> str:
+        """All outputs share one switch, which OUTP? reports."""
+        return "OUTP?"
 
 
 class AgilentE3632A(PowerSupplyBase):
@@ -326,42 +550,23 @@ class AgilentE3632A(PowerSupplyBase):
     - High: 0-30V/0-4A
     """
 
-    def set_voltage(self, voltage: float, current_limit: float, channel: int = 1) -> None:
-        """Set the output voltage and current limit.
+    def _set_voltage_commands(self, voltage: float, current_limit: float, channel: int = 1) -> List[str]:
+        """Pick the range for the voltage, then set voltage and current limit.
 
         Args:
             voltage: Target voltage in volts
             current_limit: Current limit in amperes
             channel: Ignored for this single-output model
-        """
-        try:
-            # Select appropriate range automatically
-            if voltage <= 15.0:
-                self.connection.write("VOLT:RANG LOW")
-            else:
-                self.connection.write("VOLT:RANG HIGH")
-
-            self.connection.write(f"VOLT {voltage:.4f}")
-            self.connection.write(f"CURR {current_limit:.4f}")
-            logger.info(f"Set output to {voltage:.4f}V with {current_limit:.4f}A limit")
-        except Exception as e:
-            logger.error(f"Error setting voltage/current: {str(e)}")
-
-    def get_voltage(self, channel: int = 1) -> float:
-        """Get the set voltage value.
-
-        Args:
-            channel: Ignored for this single-output model
 
         Returns:
-            float: The voltage setting in volts
+            List[str]: Commands to send, in order
         """
-        try:
-            response = self.connection.query("VOLT?").strip()
-            return float(response)
-        except Exception as e:
-            logger.error(f"Error getting voltage setting: {str(e)}")
-            return 0.0
+        voltage_range = "LOW" if voltage <= 15.0 else "HIGH"
+        return [f"VOLT:RANG {voltage_range}", f"VOLT {voltage:.4f}", f"CURR {current_limit:.4f}"]
+
+    def _query_voltage_setting(self, channel: int = 1) -> float:
+        """Query the voltage setting of the selected output."""
+        return float(self.connection.query("VOLT?"))
 
     def measure_voltage(self, channel: int = 1) -> float:
         """Measure the actual output voltage.
@@ -373,7 +578,7 @@ class AgilentE3632A(PowerSupplyBase):
             float: The measured voltage in volts
         """
         try:
-            response = self.connection.query("MEAS:VOLT?").strip()
+            response = self.connection.query("MEAS:VOLT?")
             return float(response)
         except Exception as e:
             logger.error(f"Error measuring voltage: {str(e)}")
@@ -389,97 +594,84 @@ class AgilentE3632A(PowerSupplyBase):
             float: The measured current in amperes
         """
         try:
-            response = self.connection.query("MEAS:CURR?").strip()
+            response = self.connection.query("MEAS:CURR?")
             return float(response)
         except Exception as e:
             logger.error(f"Error measuring current: {str(e)}")
             return 0.0
 
-    def set_current_limit(self, current_limit: float, channel: int = 1) -> None:
+    def measure_voltage_current(self, channel: int = 1) -> Tuple[float, float]:
+        """Measure the output voltage and current in one transaction.
+
+        Args:
+            channel: Ignored for this single-output model
+
+        Returns:
+            Tuple of (voltage, current) in volts and amperes
+        """
+        try:
+            voltage, current = self.connection.query("MEAS:VOLT?;:MEAS:CURR?").split(";")
+            return float(voltage), float(current)
+        except Exception as e:
+            logger.error(f"Error measuring voltage/current: {str(e)}")
+            return 0.0, 0.0
+
+    def set_current_limit(self, current_limit: float, channel: int = 1) -> bool:
         """Set current limit for this single-output model."""
         try:
             self.connection.write(f"CURR {current_limit:.4f}")
+            return True
         except Exception as e:
             logger.error(f"Error setting current limit: {str(e)}")
+            return False
 
-    def get_current_limit(self, channel: int = 1) -> float:
-        """Get current limit for this single-output model."""
-        try:
-            response = self.connection.query("CURR?").strip()
-            return float(response)
-        except Exception as e:
-            logger.error(f"Error getting current limit: {str(e)}")
-            return 0.0
+    def _query_current_limit(self, channel: int = 1) -> float:
+        """Query the current limit of the selected output."""
+        return float(self.connection.query("CURR?"))
 
-    def enable_output(self, channel: Optional[int] = None) -> None:
-        """Enable the output.
+    def _output_commands(self, state: bool, channel: Optional[int] = None) -> List[str]:
+        """Switch the single output.
 
         Args:
+            state: True to enable the output, False to disable it
             channel: Ignored for this single-output model
-        """
-        try:
-            self.connection.write("OUTP ON")
-            logger.info(f"Enabled output on {self.device_name}")
-        except Exception as e:
-            logger.error(f"Error enabling output: {str(e)}")
 
-    def disable_output(self, channel: Optional[int] = None) -> None:
-        """Disable the output.
-
-        Args:
-            channel: Ignored for this single-output model
+        Returns:
+            List[str]: Commands to send, in order
         """
-        try:
-            self.connection.write("OUTP OFF")
-            logger.info(f"Disabled output on {self.device_name}")
-        except Exception as e:
-            logger.error(f"Error disabling output: {str(e)}")
+        return [f"OUTP {'ON' if state else 'OFF'}"]
+
+    def _output_state_query(self, channel: int = 1) -> str:
+        """The single output's state is reported by plain OUTP?."""
+        return "OUTP?"
 
 
 class KeysightE3649A(PowerSupplyBase):
     """Controller for Keysight E3649A Dual Output Power Supply."""
 
-    def set_voltage(self, voltage: float, current_limit: float, channel: int = 1) -> None:
-        """Set the output voltage and current limit.
+    def _set_voltage_commands(self, voltage: float, current_limit: float, channel: int = 1) -> List[str]:
+        """Select the output, pick its range, then set voltage and current limit.
 
         Args:
             voltage: Target voltage in volts
             current_limit: Current limit in amperes
             channel: Output channel (1 or 2)
-        """
-        try:
-            # Select channel first
-            self.connection.write(f"INST:SEL OUT{channel}")
-
-            # Set range based on voltage (0-35V/0.8A or 0-60V/0.5A)
-            if voltage <= 35.0:
-                self.connection.write("VOLT:RANG LOW")
-            else:
-                self.connection.write("VOLT:RANG HIGH")
-
-            # Set voltage and current
-            self.connection.write(f"VOLT {voltage:.4f}")
-            self.connection.write(f"CURR {current_limit:.4f}")
-            logger.info(f"Set channel {channel} to {voltage:.4f}V with {current_limit:.4f}A limit")
-        except Exception as e:
-            logger.error(f"Error setting voltage/current: {str(e)}")
-
-    def get_voltage(self, channel: int = 1) -> float:
-        """Get the set voltage value.
-
-        Args:
-            channel: Output channel (1 or 2)
 
         Returns:
-            float: The voltage setting in volts
+            List[str]: Commands to send, in order
         """
-        try:
-            self.connection.write(f"INST:SEL OUT{channel}")
-            response = self.connection.query("VOLT?").strip()
-            return float(response)
-        except Exception as e:
-            logger.error(f"Error getting voltage setting: {str(e)}")
-            return 0.0
+        # Set range based on voltage (0-35V/0.8A or 0-60V/0.5A)
+        voltage_range = "LOW" if voltage <= 35.0 else "HIGH"
+        return [
+            f"INST:SEL OUT{channel}",
+            f"VOLT:RANG {voltage_range}",
+            f"VOLT {voltage:.4f}",
+            f"CURR {current_limit:.4f}",
+        ]
+
+    def _query_voltage_setting(self, channel: int = 1) -> float:
+        """Query the voltage setting of the selected output."""
+        return float(self._query_selected(f"INST:SEL OUT{channel}", "VOLT?"))
 
     def measure_voltage(self, channel: int = 1) -> float:
         """Measure the actual output voltage.
@@ -491,8 +683,7 @@ class KeysightE3649A(PowerSupplyBase):
             float: The measured voltage in volts
         """
         try:
-            self.connection.write(f"INST:SEL OUT{channel}")
-            response = self.connection.query("MEAS:VOLT?").strip()
+            response = self._query_selected(f"INST:SEL OUT{channel}", "MEAS:VOLT?")
             return float(response)
         except Exception as e:
             logger.error(f"Error measuring voltage: {str(e)}")
@@ -508,104 +699,79 @@ class KeysightE3649A(PowerSupplyBase):
             float: The measured current in amperes
         """
         try:
-            self.connection.write(f"INST:SEL OUT{channel}")
-            response = self.connection.query("MEAS:CURR?").strip()
+            response = self._query_selected(f"INST:SEL OUT{channel}", "MEAS:CURR?")
             return float(response)
         except Exception as e:
             logger.error(f"Error measuring current: {str(e)}")
             return 0.0
 
-    def set_current_limit(self, current_limit: float, channel: int = 1) -> None:
-        """Set current limit on the selected output."""
-        try:
-            self.connection.write(f"INST:SEL OUT{channel}")
-            self.connection.write(f"CURR {current_limit:.4f}")
-        except Exception as e:
-            logger.error(f"Error setting current limit: {str(e)}")
+    def measure_voltage_current(self, channel: int = 1) -> Tuple[float, float]:
+        """Measure the output voltage and current in one transaction.
 
-    def get_current_limit(self, channel: int = 1) -> float:
-        """Get current limit on the selected output."""
+        Args:
+            channel: Output channel (1 or 2)
+
+        Returns:
+            Tuple of (voltage, current) in volts and amperes
+        """
         try:
-            self.connection.write(f"INST:SEL OUT{channel}")
-            response = self.connection.query("CURR?").strip()
-            return float(response)
+            response = self.connection.query(f"INST:SEL OUT{channel};:MEAS:VOLT?;:MEAS:CURR?")
+            voltage, current = response.split(";")[-2:]
+            return float(voltage), float(current)
         except Exception as e:
-            logger.error(f"Error getting current limit: {str(e)}")
-            return 0.0
+            logger.error(f"Error measuring voltage/current: {str(e)}")
+            return 0.0, 0.0
 
-    def enable_output(self, channel: Optional[int] = None) -> None:
-        """Enable the output.
-
-        Args:
-            channel: Output channel (1, 2, or None for all)
-        """
+    def set_current_limit(self, current_limit: float, channel: int = 1) -> bool:
+        """Set current limit on the selected output."""
         try:
-            if channel is None:
-                # Enable all channels
-                self.connection.write("OUTP ON")
-                logger.info(f"Enabled all outputs on {self.device_name}")
-            else:
-                # Enable specific channel
-                self.connection.write(f"INST:SEL OUT{channel}")
-                self.connection.write("OUTP ON")
-                logger.info(f"Enabled output {channel} on {self.device_name}")
+            self.connection.write(f"INST:SEL OUT{channel};:CURR {current_limit:.4f}")
+            return True
         except Exception as e:
-            logger.error(f"Error enabling output: {str(e)}")
+            logger.error(f"Error setting current limit: {str(e)}")
+            return False
 
-    def disable_output(self, channel: Optional[int] = None) -> None:
-        """Disable the output.
+    def _query_current_limit(self, channel: int = 1) -> float:
+        """Query the current limit of the selected output."""
+        return float(self._query_selected(f"INST:SEL OUT{channel}", "CURR?"))
+
+    def _output_commands(self, state: bool, channel: Optional[int] = None) -> List[str]:
+        """Switch one output after selecting it, or all outputs.
 
         Args:
+            state: True to enable the output, False to disable it
             channel: Output channel (1, 2, or None for all)
+
+        Returns:
+            List[str]: Commands to send, in order
         """
-        try:
-            if channel is None:
-                # Disable all channels
-                self.connection.write("OUTP OFF")
-                logger.info(f"Disabled all outputs on {self.device_name}")
-            else:
-                # Disable specific channel
-                self.connection.write(f"INST:SEL OUT{channel}")
-                self.connection.write("OUTP OFF")
-                logger.info(f"Disabled output {channel} on {self.device_name}")
-        except Exception as e:
-            logger.error(f"Error disabling output: {str(e)}")
+        switch = f"OUTP {'ON' if state else 'OFF'}"
+        return [switch] if channel is None else [f"INST:SEL OUT{channel}", switch]
+
+    def _output_state_query(self, channel: int = 1) -> str:
+        """Select the output and read its state in the same message."""
+        return f"INST:SEL OUT{channel};:OUTP?"
 
 
 class KeysightE36300(PowerSupplyBase):
     """Controller for Keysight E36300 Series (E36313A, E36234A) Multi-Output Power Supplies."""
 
-    def set_voltage(self, voltage: float, current_limit: float, channel: int = 1) -> None:
-        """Set the output voltage and current limit.
+    def _set_voltage_commands(self, voltage: float, current_limit: float, channel: int = 1) -> List[str]:
+        """Set voltage and current limit with the (@N) channel syntax.
 
         Args:
             voltage: Target voltage in volts
             current_limit: Current limit in amperes
             channel: Output channel number
-        """
-        try:
-            # Modern Keysight supplies use (@N) channel syntax
-            self.connection.write(f"VOLT {voltage:.4f}, (@{channel})")
-            self.connection.write(f"CURR {current_limit:.4f}, (@{channel})")
-            logger.info(f"Set channel {channel} to {voltage:.4f}V with {current_limit:.4f}A limit")
-        except Exception as e:
-            logger.error(f"Error setting voltage/current: {str(e)}")
-
-    def get_voltage(self, channel: int = 1) -> float:
-        """Get the set voltage value.
-
-        Args:
-            channel: Output channel number
 
         Returns:
-            float: The voltage setting in volts
+            List[str]: Commands to send, in order
         """
-        try:
-            response = self.connection.query(f"VOLT? (@{channel})").strip()
-            return float(response)
-        except Exception as e:
-            logger.error(f"Error getting voltage setting: {str(e)}")
-            return 0.0
+        return [f"VOLT {voltage:.4f}, (@{channel})", f"CURR {current_limit:.4f}, (@{channel})"]
+
+    def _query_voltage_setting(self, channel: int = 1) -> float:
+        """Query the voltage setting of the selected output."""
+        return float(self.connection.query(f"VOLT? (@{channel})"))
 
     def measure_voltage(self, channel: int = 1) -> float:
         """Measure the actual output voltage.
@@ -617,7 +783,7 @@ class KeysightE36300(PowerSupplyBase):
             float: The measured voltage in volts
         """
         try:
-            response = self.connection.query(f"MEAS:VOLT? (@{channel})").strip()
+            response = self.connection.query(f"MEAS:VOLT? (@{channel})")
             return float(response)
         except Exception as e:
             logger.error(f"Error measuring voltage: {str(e)}")
@@ -633,27 +799,102 @@ class KeysightE36300(PowerSupplyBase):
             float: The measured current in amperes
         """
         try:
-            response = self.connection.query(f"MEAS:CURR? (@{channel})").strip()
+            response = self.connection.query(f"MEAS:CURR? (@{channel})")
             return float(response)
         except Exception as e:
             logger.error(f"Error measuring current: {str(e)}")
             return 0.0
 
-    def set_current_limit(self, current_limit: float, channel: int = 1) -> None:
+    def measure_voltage_current(self, channel: int = 1) -> Tuple[float, float]:
+        """Measure the output voltage and current in one transaction.
+
+        Args:
+            channel: Output channel number
+
+        Returns:
+            Tuple of (voltage, current) in volts and amperes
+        """
+        try:
+            response = self.connection.query(f"MEAS:VOLT? (@{channel});:MEAS:CURR? (@{channel})")
+            voltage, current = response.split(";")
+            return float(voltage), float(current)
+        except Exception as e:
+            logger.error(f"Error measuring voltage/current: {str(e)}")
+            return 0.0, 0.0
+
+    def measure_channels(self, channels: Sequence[int] = (1, 2, 3)) -> Tuple[np.ndarray, np.ndarray]:
+        """Measure voltage and current on several channels in one transaction.
+
+        The channel list form of MEAS? returns one comma-separated value per
+        channel, so both readings for every channel come back in a single
+        reply that pyvisa converts straight into an array.
+
+        Args:
+            channels: Output channel numbers to measure
+
+        Returns:
+            Tuple of (voltages, currents) arrays in volts and amperes, in channel order
+        """
+        try:
+            channel_list = ",".join(map(str, channels))
+            values = self.connection.query_ascii_values(
+                f"MEAS:VOLT? (@{channel_list});:MEAS:CURR? (@{channel_list})",
+                separator=lambda reply: reply.replace(";", ",").split(","),
+                container=np.array,
+            )
+            voltages, currents = values.reshape(2, len(channels))
+            return voltages, currents
+        except Exception as e:
+            logger.error(f"Error measuring channels {list(channels)}: {str(e)}")
+            return np.zeros(len(channels)), np.zeros(len(channels))
+
+    def apply_all(self, voltages: Sequence[float], current_limits: Sequence[float],
+                  channels: Sequence[int] = (1, 2, 3), enable: bool = True) -> bool:
+        """Program several channels and their outputs in one message.
+
+        Setpoints differ per channel, so each channel gets its own VOLT/CURR
+        pair; the output switch uses a single channel list.
+
+        Args:
+            voltages: Target voltage per channel in volts
+            current_limits: Current limit per channel in amperes
+            channels: Output channel numbers, in the same order as the values
+            enable: Also switch the listed outputs on
+
+        Returns:
+            bool: True if the message was sent, False otherwise
+
+        Raises:
+            ValueError: If the three sequences differ in length
+        """
+        if not len(voltages) == len(current_limits) == len(channels):
+            raise ValueError("voltages, current_limits and channels must have the same length")
+        commands = []
+        for voltage, current_limit, channel in zip(voltages, current_limits, channels):
+            commands.append(f"VOLT {voltage:.4f}, (@{channel})")
+            commands.append(f"CURR {current_limit:.4f}, (@{channel})")
+        if enable:
+            commands.append(f"OUTP ON, (@{','.join(map(str, channels))})")
+        try:
+            self._write_many(*commands)
+            logger.info(f"Applied {list(voltages)}V / {list(current_limits)}A to channels {list(channels)}")
+            return True
+        except Exception as e:
+            logger.error(f"Error applying channels {list(channels)}: {str(e)}")
+            return False
+
+    def set_current_limit(self, current_limit: float, channel: int = 1) -> bool:
         """Set current limit for a channel."""
         try:
             self.connection.write(f"CURR {current_limit:.4f}, (@{channel})")
+            return True
         except Exception as e:
             logger.error(f"Error setting current limit: {str(e)}")
+            return False
 
-    def get_current_limit(self, channel: int = 1) -> float:
-        """Get current limit for a channel."""
-        try:
-            response = self.connection.query(f"CURR? (@{channel})").strip()
-            return float(response)
-        except Exception as e:
-            logger.error(f"Error getting current limit: {str(e)}")
-            return 0.0
+    def _query_current_limit(self, channel: int = 1) -> float:
+        """Query the current limit of the selected output."""
+        return float(self.connection.query(f"CURR? (@{channel})"))
 
     # Optional protection controls for E36300 series
     def enable_ovp(self, state: bool, channel: int = 1) -> None:
@@ -692,41 +933,18 @@ class KeysightE36300(PowerSupplyBase):
         except Exception as e:
             logger.error(f"Error clearing OCP: {str(e)}")
 
-    def enable_output(self, channel: Optional[int] = None) -> None:
-        """Enable the output.
+    def _output_commands(self, state: bool, channel: Optional[int] = None) -> List[str]:
+        """Switch one output, or all three, with the (@N) channel syntax.
 
         Args:
-            channel: Output channel number (if None, enable all channels)
-        """
-        try:
-            if channel is None:
-                # Enable all channels
-                self.connection.write("OUTP ON, (@1,2,3)")
-                logger.info(f"Enabled all outputs on {self.device_name}")
-            else:
-                # Enable specific channel
-                self.connection.write(f"OUTP ON, (@{channel})")
-                logger.info(f"Enabled output {channel} on {self.device_name}")
-        except Exception as e:
-            logger.error(f"Error enabling output: {str(e)}")
-
-    def disable_output(self, channel: Optional[int] = None) -> None:
-        """Disable the output.
+            state: True to enable the output, False to disable it
+            channel: Output channel number (if None, all channels)
 
-        Args:
-            channel: Output channel number (if None, disable all channels)
+        Returns:
+            List[str]: Commands to send, in order
         """
-        try:
-            if channel is None:
-                # Disable all channels
-                self.connection.write("OUTP OFF, (@1,2,3)")
-                logger.info(f"Disabled all outputs on {self.device_name}")
-            else:
-                # Disable specific channel
-                self.connection.write(f"OUTP OFF, (@{channel})")
-                logger.info(f"Disabled output {channel} on {self.device_name}")
-        except Exception as e:
-            logger.error(f"Error disabling output: {str(e)}")
+        channels = "1,2,3" if channel is None else str(channel)
+        return [f"OUTP {'ON' if state else 'OFF'}, (@{channels})"]
 
 
 class Supply(LibraryTemplate):
@@ -754,6 +972,10 @@ class Supply(LibraryTemplate):
         "5": "E36234A",
     }
 
+    # Seconds a commanded output state is trusted before get_output_state
+    # asks the instrument again
+    _OUTPUT_STATE_TTL = 0.5
+
     def __init__(
         self,
         instrument_address: str,
@@ -770,6 +992,21 @@ class Supply(LibraryTemplate):
             identify: Attempt to identify the instrument with IDN query.
         """
         super().__init__(instrument_address, nickname, identify)
+
+        # Let VISA trim the newline terminator as each reply is read, so
+        # controllers can parse query replies as-is
+        self.connection.read_termination = '\n'
+        self.connection.write_termination = '\n'
+
+        # Setpoints per channel, recorded on write so getters don't need a
+        # round-trip; cleared on reset
+        self._voltage_setpoints: Dict[int, float] = {}
+        self._current_limits: Dict[int, float] = {}
+        # Output states per channel with the time they were recorded; these
+        # expire after _OUTPUT_STATE_TTL since a protection trip can turn an
+        # output off without a command from us
+        self._output_states: Dict[int, Tuple[bool, float]] = {}
+
         self.supply = None
         self._create_controller(selected_instrument)
 
@@ -795,21 +1032,26 @@ class Supply(LibraryTemplate):
         """Determine the power supply model.
 
         Args:
-            selected_instrument: Explicit model name (optional)
+            selected_instrument: Explicit model name or lab_supplies shortcut (optional)
 
         Returns:
             str: Model name
         """
         # If model is explicitly specified, use it
         if selected_instrument:
-            return selected_instrument
+            return self.lab_supplies.get(selected_instrument, selected_instrument)
 
         # Try to extract model from identification string
         if self.instrumentID:
-            for model in self._controller_classes:
-                if model in self.instrumentID:
-                    logger.info(f"Detected {model} from identification")
-                    return model
+            # *IDN? replies "maker,model,serial,firmware", so look the model
+            # field up directly and only scan the whole reply if that misses
+            fields = self.instrumentID.split(",")
+            model = fields[1].strip() if len(fields) > 1 else ""
+            if model not in self._controller_classes:
+                model = next((m for m in self._controller_classes if m in self.instrumentID), "")
+            if model:
+                logger.info(f"Detected {model} from identification")
+                return model
 
         # If we can't determine the model, fall back without prompting interactively
         logger.warning(
@@ -818,26 +1060,54 @@ class Supply(LibraryTemplate):
         return "E3632A"
 
     # Forward methods to the controller
-    def set_voltage(self, voltage: float, current_limit: float = 0.1, channel: int = 1) -> None:
+    def set_voltage(self, voltage: float, current_limit: float = 0.1, channel: int = 1, force: bool = False) -> None:
         """Set the output voltage and current limit.
 
+        The write is skipped when both values match the last ones set on the
+        channel through this object. If the write fails, the channel's cached
+        setpoints are dropped since its state is no longer known.
+
         Args:
             voltage: Target voltage in volts
             current_limit: Current limit in amperes
             channel: Output channel number
+            force: Send the write even if the setpoints are unchanged
         """
-        self.supply.set_voltage(voltage, current_limit, channel)
-
-    def get_voltage(self, channel: int = 1) -> float:
+        if (
+            not force
+            and self._voltage_setpoints.get(channel) == voltage
+            and self._current_limits.get(channel) == current_limit
+        ):
+            return
+        if not self.supply.set_voltage(voltage, current_limit, channel):
+            self._voltage_setpoints.pop(channel, None)
+            self._current_limits.pop(channel, None)
+            return
+        self._voltage_setpoints[channel] = voltage
+        self._current_limits[channel] = current_limit
+
+    def get_voltage(self, channel: int = 1, refresh: bool = False) -> float:
         """Get the set voltage value.
 
+        Returns the value last set through this object unless refresh is
+        requested, e.g. after the setpoint was changed from the front panel.
+
         Args:
             channel: Output channel number
+            refresh: Query the instrument even if the setpoint is cached
 
         Returns:
             float: The voltage setting in volts
         """
-        return self.supply.get_voltage(channel)
+        if not refresh and channel in self._voltage_setpoints:
+            return self._voltage_setpoints[channel]
+        try:
+            voltage = self.supply._query_voltage_setting(channel)
+        except Exception as e:
+            logger.error(f"Error getting voltage setting: {str(e)}")
+            return 0.0
+        self._voltage_setpoints[channel] = voltage
+        return voltage
 
     def measure_voltage(self, channel: int = 1) -> float:
         """Measure the actual output voltage.
@@ -861,13 +1131,89 @@ class Supply(LibraryTemplate):
         """
         return self.supply.measure_current(channel)
 
+    def measure_voltage_current(self, channel: int = 1) -> Tuple[float, float]:
+        """Measure the output voltage and current, in one transaction where supported.
+
+        Args:
+            channel: Output channel number
+
+        Returns:
+            Tuple of (voltage, current) in volts and amperes
+        """
+        return self.supply.measure_voltage_current(channel)
+
+    def measure_power(self, channel: int = 1) -> float:
+        """Measure the output power from one voltage/current reading.
+
+        Args:
+            channel: Output channel number
+
+        Returns:
+            float: The output power in watts
+        """
+        voltage, current = self.measure_voltage_current(channel)
+        return voltage * current
+
+    def apply(self, voltage: float, current_limit: float = 0.1, channel: int = 1) -> None:
+        """Set the voltage and current limit and enable the output in one message.
+
+        Args:
+            voltage: Target voltage in volts
+            current_limit: Current limit in amperes
+            channel: Output channel number
+        """
+        if not self.supply.apply(voltage, current_limit, channel):
+            return
+        self._voltage_setpoints[channel] = voltage
+        self._current_limits[channel] = current_limit
+        self._record_output_state(True, channel)
+
+    def apply_all(self, voltages: Sequence[float], current_limits: Sequence[float],
+                  channels: Sequence[int] = (1, 2, 3), enable: bool = True) -> None:
+        """Program several channels in one message (E36300 series only).
+
+        Args:
+            voltages: Target voltage per channel in volts
+            current_limits: Current limit per channel in amperes
+            channels: Output channel numbers, in the same order as the values
+            enable: Also switch the listed outputs on
+
+        Raises:
+            NotImplementedError: If the connected model has no channel-list support
+        """
+        if not hasattr(self.supply, 'apply_all'):
+            raise NotImplementedError(f"apply_all is not supported on the {self.supply.device_name}")
+        if not self.supply.apply_all(voltages, current_limits, channels, enable):  # type: ignore
+            return
+        for voltage, current_limit, channel in zip(voltages, current_limits, channels):
+            self._voltage_setpoints[channel] = voltage
+            self._current_limits[channel] = current_limit
+            if enable:
+                self._record_output_state(True, channel)
+
+    def _record_output_state(self, state: Optional[bool], channel: Optional[int]) -> None:
+        """Remember an output state we just commanded.
+
+        Args:
+            state: True if the output was enabled, None if the state is unknown
+            channel: Output channel number (if None, all channels changed)
+        """
+        if channel is None or not self.supply._per_channel_output:
+            # Other channels changed too, and the channel count isn't known
+            # here, so forget them rather than guess
+            self._output_states.clear()
+        else:
+            self._output_states.pop(channel, None)
+        if channel is not None and state is not None:
+            self._output_states[channel] = (state, time.monotonic())
+
     def enable_output(self, channel: Optional[int] = None) -> None:
         """Enable the output.
 
         Args:
             channel: Output channel number (if None, enable all channels)
         """
-        self.supply.enable_output(channel)
+        self._record_output_state(True if self.supply.enable_output(channel) else None, channel)
 
     def disable_output(self, channel: Optional[int] = None) -> None:
         """Disable the output.
@@ -875,26 +1221,59 @@ class Supply(LibraryTemplate):
         Args:
             channel: Output channel number (if None, disable all channels)
         """
-        self.supply.disable_output(channel)
+        self._record_output_state(False if self.supply.disable_output(channel) else None, channel)
 
-    def get_output_state(self, channel: int = 1) -> bool:
+    def switch_output(self, state: bool, channel: int = 1) -> bool:
+        """Switch an output and read its state back in one transaction.
+
+        Args:
+            state: True to enable the output, False to disable it
+            channel: Output channel number
+
+        Returns:
+            bool: The output state reported by the instrument
+        """
+        try:
+            actual = self.supply._switch_output(state, channel)
+        except Exception as e:
+            logger.error(f"Error switching output {channel}: {str(e)}")
+            self._record_output_state(None, channel)
+            return False
+        self._record_output_state(actual, channel)
+        return actual
+
+    def get_output_state(self, channel: int = 1, refresh: bool = False) -> bool:
         """Get the output state.
 
         Args:
             channel: Output channel number
+            refresh: Query the instrument even if the state was set recently
 
         Returns:
             bool: True if output is enabled, False otherwise
         """
-        return self.supply.get_output_state(channel)
+        cached = self._output_states.get(channel)
+        if not refresh and cached and time.monotonic() - cached[1] < self._OUTPUT_STATE_TTL:
+            return cached[0]
+        try:
+            state = self.supply._query_output_state(channel)
+        except Exception as e:
+            logger.error(f"Error getting output state: {str(e)}")
+            self._record_output_state(None, channel)
+            return False
+        self._record_output_state(state, channel)
+        return state
 
     def reset(self) -> None:
-        """Reset the instrument to default settings."""
-        # First reset using the base class method (sends *RST command)
-        super().reset()
-        # Then allow the specific controller to do any additional reset steps
-        if hasattr(self.supply, 'reset'):
-            self.supply.reset()
+        """Reset the instrument to default settings and clear its status."""
+        # Reset and clear in one message, then block on *OPC? so this returns
+        # as soon as the reset has finished rather than after a fixed delay
+        self._write_many("*RST", "*CLS")
+        self.wait_for_operation_complete()
+        self._voltage_setpoints.clear()
+        self._current_limits.clear()
+        self._output_states.clear()
+        logger.info(f"Reset {self.instrument_address}")
 
     def clear(self) -> None:
         """Clear the instrument's status registers and error queue."""
@@ -924,23 +1303,64 @@ class Supply(LibraryTemplate):
 
     def set_current_limit(self, current: float, channel: int = 1) -> None:
         """Set only the current limit for a channel."""
-        # Delegate where available
-        if hasattr(self.supply, 'set_current_limit'):
-            self.supply.set_current_limit(current, channel)  # type: ignore
+        if self.supply.set_current_limit(current, channel):
+            self._current_limits[channel] = current
         else:
-            # Fallback: set voltage to existing setting and update current
-            v = self.get_voltage(channel)
-            self.set_voltage(v, current, channel)
+            self._current_limits.pop(channel, None)
 
-    def get_current_limit(self, channel: int = 1) -> float:
-        """Get current limit for a channel if supported."""
-        if hasattr(self.supply, 'get_current_limit'):
-            return self.supply.get_current_limit(channel)  # type: ignore
-        return 0.0
+    def get_current_limit(self, channel: int = 1, refresh: bool = False) -> float:
+        """Get current limit for a channel if supported.
+
+        Returns the value last set through this object unless refresh is requested.
+        """
+        if not refresh and channel in self._current_limits:
+            return self._current_limits[channel]
+        try:
+            current = self.supply._query_current_limit(channel)
+        except Exception as e:
+            logger.error(f"Error getting current limit: {str(e)}")
+            return 0.0
+        self._current_limits[channel] = current
+        return current
 
     def set_output_state(self, state: bool, channel: Optional[int] = None) -> None:
         """Enable or disable output."""
-        self.supply.set_output_state(state, channel)
+        sent = self.supply.set_output_state(state, channel)
+        self._record_output_state(state if sent else None, channel)
+
+    def measure_channels(self, channels: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Measure voltage and current on several channels.
+
+        The E36300 series reads every channel in one transaction; other models
+        take one reading pair per channel.
+
+        Args:
+            channels: Output channel numbers to measure
+
+        Returns:
+            Tuple of (voltages, currents) arrays in volts and amperes, in channel order
+        """
+        return self.supply.measure_channels(channels)
+
+    @classmethod
+    def measure_many(cls, supplies: Sequence["Supply"], channel: int = 1) -> List[Tuple[float, float]]:
+        """Measure voltage and current on several supplies concurrently.
+
+        Each supply is read from its own thread, so supplies on separate
+        sessions overlap their bus time instead of queueing behind each
+        other. Transfers on one supply are serialized by its I/O lock, so
+        listing a supply twice is safe but those reads run one after the
+        other. Supplies behind the same GPIB interface also share that bus
+        and gain little.
+
+        Args:
+            supplies: Connected supplies, ideally each with its own VISA session
+            channel: Output channel number to measure on every supply
+
+        Returns:
+            List of (voltage, current) tuples, in the order of ``supplies``
+        """
+        return configure_parallel(supplies, lambda supply: supply.measure_voltage_current(channel))
 
     def get_all_measurements(self, channel: int = 1) -> Dict[str, float]:
         """Get all measurements for a channel.
@@ -951,7 +1371,8 @@ class Supply(LibraryTemplate):
         Returns:
             Dict with voltage and current measurements
         """
-        return {"voltage": self.measure_voltage(channel), "current": self.measure_current(channel)}
+        voltage, current = self.measure_voltage_current(channel)
+        return {"voltage": voltage, "current": current}
 
     def voltage_sweep(
         self,
@@ -993,8 +1414,7 @@ class Supply(LibraryTemplate):
                 time.sleep(delay)  # Allow settling time
 
                 # Measure
-                measured_v = self.measure_voltage(channel)
-                measured_i = self.measure_current(channel)
+                measured_v, measured_i = self.measure_voltage_current(channel)
 
                 # Store results
                 result = {
@@ -29,6 +29,18 @@ class TemperatureSensorBase(ABC):
     Specific implementations inherit from this class.
     """
 
+    # UNIT:TEMP argument for each accepted unit spelling
+    _unit_commands = {
+        'C': 'C',
+        'CEL': 'C',
+        'CELSIUS': 'C',
+        'F': 'F',
+        'FAR': 'F',
+        'FAHRENHEIT': 'F',
+        'K': 'K',
+        'KELVIN': 'K',
+    }
+
     def __init__(self, connection, device_name: str):
         """Initialize with an open connection.
 
@@ -54,12 +66,9 @@ class TemperatureSensorBase(ABC):
     def set_units(self, unit: str) -> None:
         """Set the temperature units."""
         try:
-            if unit.upper() in ['C', 'CEL', 'CELSIUS']:
-                self.connection.write("UNIT:TEMP C")
-            elif unit.upper() in ['F', 'FAR', 'FAHRENHEIT']:
-                self.connection.write("UNIT:TEMP F")
-            elif unit.upper() in ['K', 'KELVIN']:
-                self.connection.write("UNIT:TEMP K")
+            std_unit = self._unit_commands.get(unit.upper())
+            if std_unit:
+                self.connection.write(f"UNIT:TEMP {std_unit}")
             else:
                 logger.warning(f"Unsupported unit: {unit}")
         except Exception as e:
@@ -79,7 +88,7 @@ class SimpleFetchThermometer(TemperatureSensorBase):
             float: The current temperature or sys.maxsize on error.
         """
         try:
-            response = self.connection.query("FETCH?").strip()
+            response = self.connection.query("FETCH?")
             return float(response)
         except Exception as e:
             logger.error(f"Error reading temperature: {str(e)}")
@@ -99,13 +108,13 @@ class MeasureThermometer(TemperatureSensorBase):
             float: The current temperature or sys.maxsize on error.
         """
         try:
-            response = self.connection.query(f"MEAS?{channel}").strip()
+            response = self.connection.query(f"MEAS?{channel}")
             return float(response)
         except Exception as e:
             logger.error(f"Error reading temperature from channel {channel}: {str(e)}")
             try:
                 # Retry once
-                response = self.connection.query(f"MEAS?{channel}").strip()
+                response = self.connection.query(f"MEAS?{channel}")
                 return float(response)
             except Exception as retry_e:
                 logger.error(f"Retry failed: {str(retry_e)}")
@@ -125,7 +134,7 @@ class TCoupleThermometer(TemperatureSensorBase):
             float: The current temperature or sys.maxsize on error.
         """
         try:
-            response = self.connection.query(f"MEAS?{channel}").strip()
+            response = self.connection.query(f"MEAS?{channel}")
             return float(response)
         except Exception as e:
             logger.error(f"Error reading temperature from channel {channel}: {str(e)}")
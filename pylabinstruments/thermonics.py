@@ -20,9 +20,7 @@ import time
 from abc import ABC, abstractmethod
 from typing import Callable, List, Optional
 
-import pyvisa
-
-from .utils import visa_exception_handler
+from .utils import get_resource_manager, visa_exception_handler
 
 # Setup module logger
 logger = logging.getLogger(__name__)
@@ -191,7 +189,7 @@ class ThermocoupleOven(TemperatureController):
             float: Current temperature in °C.
         """
         try:
-            temp = float(self.connection.query("T").strip())
+            temp = float(self.connection.query("T"))
             logger.debug(f"Current oven temperature: {temp}°C")
             return temp
         except Exception as e:
@@ -223,7 +221,6 @@ class ThermocoupleController(TemperatureController):
         """
         try:
             logger.info(f"Setting temperature to {temp}°C")
-            print(f"Setting temperature to: {temp}°C")
 
             # Thermonics has different commands for hot vs cold
             if temp <= 25.0:
@@ -238,7 +235,6 @@ class ThermocoupleController(TemperatureController):
             self._stable_temperature = False
         except Exception as e:
             logger.error(f"Error setting temperature to {temp}°C: {str(e)}")
-            print(f"Error setting temperature: {str(e)}")
 
     def get_temperature(self) -> float:
         """Get the current temperature.
@@ -247,7 +243,7 @@ class ThermocoupleController(TemperatureController):
             float: Current temperature in °C.
         """
         try:
-            temp = float(self.connection.query("RA").strip())
+            temp = float(self.connection.query("RA"))
             logger.debug(f"Current temperature: {temp}°C")
             return temp
         except Exception as e:
@@ -359,7 +355,6 @@ class XStreamController(TemperatureController):
             temp: Target temperature in °C.
         """
         logger.warning("Temperature setting not yet implemented for X-Stream 4300")
-        print("Setting temperature is not yet implemented for X-Stream 4300")
         self._last_temperature = temp
 
     def get_temperature(self) -> float:
@@ -408,7 +403,7 @@ class Thermonics:
             identify: Attempt to identify the instrument with IDN query.
         """
         self.instrument_address = instrument_address
-        self.rm = pyvisa.ResourceManager()
+        self.rm = get_resource_manager()
         self.connection = None
         self.controller = None
 
@@ -446,12 +441,10 @@ class Thermonics:
                 return True
             else:
                 logger.error(f"No controller available for {instrument_name}")
-                print(f"No controller implemented for {instrument_name}")
                 return False
 
         except Exception as e:
             logger.error(f"Error connecting to {self.instrument_address}: {str(e)}")
-            print(f"Error connecting to {self.instrument_address}: {str(e)}")
             return False
 
     def _determine_instrument_type(self, selected_instrument: Optional[str], identify: bool) -> Optional[str]:
@@ -542,7 +535,6 @@ class Thermonics:
             self.controller.select_ambient()
         else:
             logger.warning("select_ambient not supported by this controller")
-            print("Ambient air selection not supported by this controller")
 
     def select_cold(self) -> None:
         """Select cold air."""
@@ -550,7 +542,6 @@ class Thermonics:
             self.controller.select_cold()
         else:
             logger.warning("select_cold not supported by this controller")
-            print("Cold air selection not supported by this controller")
 
     def select_hot(self) -> None:
         """Select hot air."""
@@ -558,7 +549,6 @@ class Thermonics:
             self.controller.select_hot()
         else:
             logger.warning("select_hot not supported by this controller")
-            print("Hot air selection not supported by this controller")
 
     def select_ambient_forced(self) -> None:
         """Select forced ambient air."""
@@ -566,7 +556,6 @@ class Thermonics:
             self.controller.select_ambient_forced()
         else:
             logger.warning("select_ambient_forced not supported by this controller")
-            print("Forced ambient air selection not supported by this controller")
 
     def set_cold_temp(self, temp: float) -> None:
         """Set cold air temperature."""
@@ -588,7 +577,6 @@ class Thermonics:
             self.controller.turn_on_compressor()
         else:
             logger.warning("turn_on_compressor not supported by this controller")
-            print("Compressor control not supported by this controller")
 
     def turn_off_compressor(self) -> None:
         """Turn off the compressor."""
@@ -596,7 +584,6 @@ class Thermonics:
             self.controller.turn_off_compressor()
         else:
             logger.warning("turn_off_compressor not supported by this controller")
-            print("Compressor control not supported by this controller")
 
     def turn_off_air(self) -> None:
         """Turn off forced air."""
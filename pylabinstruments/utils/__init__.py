@@ -9,12 +9,15 @@ instrument discovery, and data type conversion.
 from .decorators import visa_exception_handler
 from .logger import Logger
 from .utilities import (
+    configure_parallel,
     countdown,
     create_run_folder,
     format_bytes,
     get_directory,
+    get_resource_manager,
     getAllLiveUnits,
     is_valid_ip,
+    join_scpi_commands,
     parse_numeric,
     save_recent_directory,
     scan_gpib_devices,
@@ -28,6 +31,9 @@ __all__ = [
     'get_directory',
     'countdown',
     'getAllLiveUnits',
+    'configure_parallel',
+    'get_resource_manager',
+    'join_scpi_commands',
     'scan_gpib_devices',
     'stringToInt',
     'stringToFloat',
@@ -6,6 +6,7 @@ the library for common cross-cutting concerns like exception handling.
 """
 
 import functools
+import inspect
 import logging
 import sys
 import time
@@ -72,92 +73,100 @@ def visa_exception_handler(
         "VI_ERROR_INSTR_NFOUND": "Instrument not found. Check address and connections.",
     }
 
+    # Only these VISA errors might be transient enough to be worth retrying
+    retriable_errors = ("VI_ERROR_TMO", "VI_ERROR_CONN_LOST", "VI_ERROR_RSRC_BUSY")
+    max_attempts = retry_count + 1  # +1 for the initial attempt
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @functools.wraps(func)
-        def wrapper(self, *args: Any, **kwargs: Any) -> Union[T, Any]:
+        def handle_error(self, ex: Exception, attempt: int) -> bool:
+            """Log an exception raised by ``func`` and decide whether to retry.
+
+            Must be called from inside the ``except`` block so the traceback
+            is still available. Instrument details are only looked up here,
+            keeping the successful path free of attribute lookups.
+            """
             instrument_id = getattr(self, 'instrumentID', getattr(self, 'instrument_ID', 'unknown instrument'))
             address = getattr(self, 'instrument_address', 'unknown address')
+            retries_left = attempt < max_attempts - 1
+
+            if isinstance(ex, ValueError):
+                # Value conversion errors (e.g., float parsing)
+                log.error(
+                    f"Could not convert returned value from {instrument_id} "
+                    f"at {address} in method {func.__name__}: {str(ex)}"
+                )
+                # For value errors, don't retry as they're likely to persist
+                return False
+
+            if isinstance(ex, TypeError):
+                # Type errors (wrong parameter types); retrying won't help either
+                log.error(f"Type error in {func.__name__}: {str(ex)}")
+                return False
+
+            if isinstance(ex, pyvisa.errors.VisaIOError):
+                # Get a user-friendly error message if available
+                friendly_msg = ""
+                for error_code, message in visa_error_messages.items():
+                    if error_code in ex.abbreviation:
+                        friendly_msg = f" - {message}"
+                        break
+
+                error_msg = f"VISA error in {func.__name__} on {instrument_id} at {address}: {ex.abbreviation}{friendly_msg}"
+
+                # Log the error with appropriate level based on retry strategy
+                if retries_left:
+                    log.warning(f"{error_msg} (attempt {attempt + 1}/{max_attempts}, retrying in {retry_delay}s)")
+                else:
+                    log.error(error_msg)
 
-            # Add retry logic
-            attempt = 0
-            max_attempts = retry_count + 1  # +1 for the initial attempt
-
-            while attempt < max_attempts:
-                try:
-                    start_time = time.time()
-                    result = func(self, *args, **kwargs)
-                    elapsed = time.time() - start_time
-
-                    # Log success if requested (useful for performance monitoring)
-                    if log_success:
-                        log.debug(
-                            f"Successfully executed {func.__name__} on {instrument_id} "
-                            f"at {address} in {elapsed:.3f}s"
-                        )
+                return retries_left and any(code in ex.abbreviation for code in retriable_errors)
 
-                    return result
+            # Catch-all for unexpected exceptions
+            tb = "" if suppress_traceback else f"\nTraceback: {traceback.format_exc()}"
+            log.error(
+                f"Unexpected error in {func.__name__} on {instrument_id} at {address}: "
+                f"{type(ex).__name__}: {str(ex)}{tb}"
+            )
 
-                except ValueError as ex:
-                    # Value conversion errors (e.g., float parsing)
-                    error_msg = (
-                        f"Could not convert returned value from {instrument_id} "
-                        f"at {address} in method {func.__name__}: {str(ex)}"
-                    )
-                    log.error(error_msg)
+            # For unexpected errors, attempt retry if configured
+            return retries_left
 
-                    # For value errors, don't retry as they're likely to persist
+        if max_attempts == 1 and not log_success:
+            # Most methods neither retry nor log success, so give them a plain
+            # try/except without the retry loop and its bookkeeping
+            @functools.wraps(func)
+            def simple_wrapper(self, *args: Any, **kwargs: Any) -> Union[T, Any]:
+                try:
+                    return func(self, *args, **kwargs)
+                except Exception as ex:
+                    handle_error(self, ex, 0)
                     return default_return_value
 
-                except TypeError as ex:
-                    # Type errors (wrong parameter types)
-                    error_msg = f"Type error in {func.__name__}: {str(ex)}"
-                    log.error(error_msg)
-
-                    # For type errors, don't retry as they're likely to persist
-                    return default_return_value
+            return simple_wrapper
 
-                except pyvisa.errors.VisaIOError as ex:
-                    # Get a user-friendly error message if available
-                    friendly_msg = ""
-                    for error_code, message in visa_error_messages.items():
-                        if error_code in ex.abbreviation:
-                            friendly_msg = f" - {message}"
-                            break
-
-                    error_msg = f"VISA error in {func.__name__} on {instrument_id} at {address}: {ex.abbreviation}{friendly_msg}"
-
-                    # Log the error with appropriate level based on retry strategy
-                    if attempt < max_attempts - 1:
-                        log.warning(f"{error_msg} (attempt {attempt + 1}/{max_attempts}, retrying in {retry_delay}s)")
-                    else:
-                        log.error(error_msg)
-
-                    # Only retry certain VISA errors that might be transient
-                    retriable_errors = ["VI_ERROR_TMO", "VI_ERROR_CONN_LOST", "VI_ERROR_RSRC_BUSY"]
-                    can_retry = any(code in ex.abbreviation for code in retriable_errors)
-
-                    if can_retry and attempt < max_attempts - 1:
-                        attempt += 1
-                        time.sleep(retry_delay)
-                        continue
-                    return default_return_value
+        @functools.wraps(func)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Union[T, Any]:
+            attempt = 0
+            while True:
+                try:
+                    if not log_success:
+                        return func(self, *args, **kwargs)
 
-                except Exception as ex:
-                    # Catch-all for unexpected exceptions
-                    tb = "" if suppress_traceback else f"\nTraceback: {traceback.format_exc()}"
-                    error_msg = (
-                        f"Unexpected error in {func.__name__} on {instrument_id} at {address}: "
-                        f"{type(ex).__name__}: {str(ex)}{tb}"
+                    # Log success if requested (useful for performance monitoring)
+                    start_time = time.time()
+                    result = func(self, *args, **kwargs)
+                    elapsed = time.time() - start_time
+                    log.debug(
+                        f"Successfully executed {func.__name__} on {getattr(self, 'instrumentID', 'unknown instrument')} "
+                        f"at {getattr(self, 'instrument_address', 'unknown address')} in {elapsed:.3f}s"
                     )
+                    return result
 
-                    log.error(error_msg)
-
-                    # For unexpected errors, attempt retry if configured
-                    if attempt < max_attempts - 1:
-                        attempt += 1
-                        time.sleep(retry_delay)
-                        continue
-                    return default_return_value
+                except Exception as ex:
+                    if not handle_error(self, ex, attempt):
+                        return default_return_value
+                    attempt += 1
+                    time.sleep(retry_delay)
 
         return wrapper
 
@@ -189,12 +198,11 @@ def parameter_validator(**validators: Callable[[Any], bool]):
     """
 
     def decorator(func: Callable) -> Callable:
+        # Resolve the signature once here rather than on every call
+        sig = inspect.signature(func)
+
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            # Get function signature
-            import inspect
-
-            sig = inspect.signature(func)
             bound_args = sig.bind(self, *args, **kwargs)
             bound_args.apply_defaults()
 
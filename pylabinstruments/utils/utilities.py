@@ -8,20 +8,36 @@ like directory management, instrument discovery, data type conversion, and user
 import logging
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
 
 import pyvisa
 
-# PySimpleGUI may not be available in headless CI; import lazily/optionally
-try:
-    import PySimpleGUI as sg  # type: ignore
-except Exception:  # pragma: no cover - only in headless CI
-    sg = None  # fallback; get_directory will handle gracefully
-from typing import Dict, List, Optional, Union
-
 # Setup module logger
 logger = logging.getLogger(__name__)
 
+# Resource manager shared by every connection, opened on first use
+_resource_manager: Optional[pyvisa.ResourceManager] = None
+_resource_manager_lock = threading.Lock()
+
+
+def get_resource_manager() -> pyvisa.ResourceManager:
+    """Return the shared PyVISA resource manager.
+
+    Loading the VISA library is slow, so the manager is opened once and then
+    reused by every instrument instead of each one opening its own.
+
+    Returns:
+        The process-wide pyvisa.ResourceManager.
+    """
+    global _resource_manager
+    with _resource_manager_lock:
+        if _resource_manager is None:
+            _resource_manager = pyvisa.ResourceManager()
+        return _resource_manager
+
 
 def create_run_folder(base_path: str) -> str:
     """Create a new run folder with incrementing number.
@@ -119,7 +135,11 @@ def get_directory() -> Optional[str]:
     Returns:
         Selected directory path or None if canceled/unavailable.
     """
-    if sg is None:
+    # PySimpleGUI is only needed for this dialog and may not be available in
+    # headless CI, so import it here rather than with the package
+    try:
+        import PySimpleGUI as sg  # type: ignore
+    except Exception:  # pragma: no cover - only in headless CI
         logger.info("PySimpleGUI not available; get_directory returning None (headless environment)")
         return None
 
@@ -234,7 +254,7 @@ def scan_gpib_devices(start: int = 0, end: int = 32, timeout: int = 1000, verbos
         Dictionary mapping GPIB addresses to instrument identification strings.
     """
     devices: Dict[int, str] = {}
-    rm = pyvisa.ResourceManager()
+    rm = get_resource_manager()
 
     if verbose:
         logger.info(f"Scanning GPIB addresses {start}-{end}...")
@@ -277,6 +297,51 @@ def getAllLiveUnits() -> Dict[int, str]:
     return scan_gpib_devices()
 
 
+def configure_parallel(instruments: Iterable[Any], fn: Callable[[Any], Any], max_workers: Optional[int] = None) -> List[Any]:
+    """Apply a setup function to several instruments concurrently.
+
+    Each instrument owns its own VISA session, so independent instruments can
+    be configured at the same time instead of waiting on one another's
+    reset/identify/configure round trips. Commands to a single instrument
+    still go out in order from the one thread handling it.
+
+    Args:
+        instruments: Instrument instances to configure.
+        fn: Callable invoked once per instrument, e.g. ``lambda s: s.reset()``.
+        max_workers: Maximum number of worker threads (defaults to one per instrument).
+
+    Returns:
+        List of the values returned by ``fn``, in the order of ``instruments``.
+
+    Raises:
+        Exception: The first exception raised by ``fn``, re-raised in the caller.
+    """
+    instruments = list(instruments)
+    if not instruments:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers or len(instruments), thread_name_prefix="configure") as ex:
+        return list(ex.map(fn, instruments))
+
+
+def join_scpi_commands(commands: Sequence[str]) -> str:
+    """Join SCPI commands into one message, rooting every command after the first.
+
+    Every command after the first gets a leading colon, so the header path
+    of one command does not leak into the next. Commands that already start
+    with a colon, and common commands such as ``*CLS``, are left as they are.
+
+    Args:
+        commands: The command strings to join, in order.
+
+    Returns:
+        str: The semicolon-separated message.
+    """
+    return ";".join(
+        command if index == 0 or command.startswith((":", "*")) else f":{command}"
+        for index, command in enumerate(commands)
+    )
+
+
 def parse_numeric(string: str) -> Union[int, float]:
     """Extract and parse a numeric value from a string.
 
@@ -43,8 +43,11 @@ def mock_visa():
     # Create a mock resource manager that returns our mock resource
     mock_manager = MockResourceManager({"GPIB0::22::INSTR": mock_resource})
 
-    # Patch the pyvisa.ResourceManager to return our mock
-    with patch('pyvisa.ResourceManager', return_value=mock_manager):
+    # Patch the pyvisa.ResourceManager to return our mock, and drop any
+    # shared manager left over from an earlier test
+    with patch('pyvisa.ResourceManager', return_value=mock_manager), patch(
+        'pylabinstruments.utils.utilities._resource_manager', None
+    ):
         yield mock_manager
 
 
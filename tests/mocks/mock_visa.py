@@ -58,6 +58,8 @@ class MockResource:
         self.last_command: Optional[str] = None
         self.closed = False
         self.command_log: List[str] = []
+        self.status_byte = 0
+        self.enabled_events: set = set()
 
         # Instrument state
         self.idn = self.responses.get("*IDN?", "HEWLETT-PACKARD,34401A,0,1.0-5.0")
@@ -125,6 +127,11 @@ class MockResource:
         self.last_command = command
         self.command_log.append(command)
 
+        # Compound messages apply each command in turn
+        for part in command.split(";"):
+            self._apply_write(part)
+
+    def _apply_write(self, command: str) -> None:
         u = self._norm_upper(command)
         # Settings-style commands (no response)
         if u.startswith(":CONF:") or u.startswith("CONF:"):
@@ -296,6 +303,18 @@ class MockResource:
         return self.default_response + self.read_termination
 
     def _respond_to(self, command: str) -> str:
+        # Compound queries answer with one semicolon-separated line
+        if ";" in command:
+            if command in self.responses:
+                return str(self.responses[command])
+            # Only the queries in the message contribute to the reply
+            replies = []
+            for part in command.split(";"):
+                if "?" in part:
+                    replies.append(self._respond_to(part))
+                else:
+                    self._apply_write(part)
+            return ";".join(replies)
         u = self._norm_upper(command)
         # Common queries (stateful)
         if u == "*IDN?":
@@ -306,7 +325,8 @@ class MockResource:
             return "0,No error"
         if u == "FUNC?" or u == ":FUNC?":
             return f'"{self.current_function}"'
-        if u.startswith("MEAS:") or u.startswith(":MEAS:"):
+        # Channel-list measurements belong to the power supply model below
+        if (u.startswith("MEAS:") or u.startswith(":MEAS:")) and "(@" not in u:
             token = u.split(":", 1)[1][5:]  # after 'MEAS:'
             token = token.rstrip("?")
             token = _canonical_func(token)
@@ -347,6 +367,9 @@ class MockResource:
             # Return a stable sub-limit value
             val = min(limit, 0.251)
             return f"{val}"
+        if u == "OUTP?" or u == ":OUTP?":
+            state = self.supply_output_state.get(self.supply_selected_output, False)
+            return "1" if state else "0"
         if u.startswith("OUTP? (@") or u.startswith(":OUTP? (@"):
             ch = int(u[u.find("(@") + 2 : u.find(")")])
             state = self.supply_output_state.get(ch, False)
@@ -388,7 +411,8 @@ class MockResource:
         # Accept extra kwargs (e.g., delay=...) to mimic some library calls
         self.last_command = command
         self.command_log.append(command)
-        return self._respond_to(command) + self.read_termination
+        # pyvisa strips read_termination from query replies
+        return self._respond_to(command)
 
     def read_raw(self) -> bytes:
         response = self.read()
@@ -398,12 +422,39 @@ class MockResource:
         self, command: str, datatype: str = "f", is_big_endian: bool = True, container: Any = list
     ) -> List[Any]:
         self.write(command)
+        # Serve a canned comma-separated reply for the query part, if any
+        query = next((part for part in command.split(";") if part.endswith("?")), command)
+        canned = str(self.responses.get(query.lstrip(":"), ""))
+        if canned and not canned.startswith("#"):
+            return container([float(value) for value in canned.split(",")])
         return container([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0])
 
-    def query_ascii_values(self, command: str, separator: str = ",", container: Any = list) -> List[Any]:
+    def query_ascii_values(self, command: str, separator: Any = ",", container: Any = list) -> List[Any]:
         self.write(command)
+        if command in self.responses:
+            reply = str(self.responses[command])
+            values = separator(reply) if callable(separator) else reply.split(separator)
+            return container([float(value) for value in values])
         return container([1.1, 2.2, 3.3, 4.4, 5.5])
 
+    def read_stb(self) -> int:
+        stb = self.status_byte
+        # A serial poll clears the service request bit
+        self.status_byte &= ~0x40
+        return stb
+
+    def enable_event(self, event_type: Any, mechanism: Any) -> None:
+        self.enabled_events.add(event_type)
+
+    def wait_on_event(self, event_type: Any, timeout: int, capture_timeout: bool = False) -> Any:
+        from types import SimpleNamespace
+
+        # Requests are only queued for event types enabled on the session
+        timed_out = not (event_type in self.enabled_events and self.status_byte & 0x40)
+        if timed_out and not capture_timeout:
+            raise TimeoutError("Timeout waiting for event")
+        return SimpleNamespace(timed_out=timed_out)
+
     def close(self) -> None:
         self.closed = True
 
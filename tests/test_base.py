@@ -5,6 +5,8 @@ This module tests the base functionality shared by all instrument classes,
 such as connection handling, identification, and basic VISA operations.
 """
 
+import time
+
 import pytest
 
 
@@ -20,10 +22,30 @@ def test_library_template_init(mock_visa):
         assert template.instrument_address == "GPIB0::22::INSTR"
         assert template.instrumentID == "Mock Instrument,Model 123,SN123456,FW1.0"
         assert template.connection is not None
+        assert template.connection.chunk_size == 1024 * 1024
     except ImportError:
         pytest.skip("pylabinstruments.base.LibraryTemplate not available")
 
 
+def test_library_template_identifies_with_short_timeout(mock_visa):
+    """*IDN? runs under a short timeout and the normal one is restored after."""
+    from pylabinstruments.base import LibraryTemplate
+
+    resource = mock_visa.resources["GPIB0::22::INSTR"]
+    seen = []
+    original_query = resource.query
+
+    def query(command, **kwargs):
+        seen.append((command, resource.timeout))
+        return original_query(command, **kwargs)
+
+    resource.query = query
+    template = LibraryTemplate("GPIB0::22::INSTR", timeout=5000)
+
+    assert seen == [("*IDN?", 500)]
+    assert template.connection.timeout == 5000
+
+
 def test_library_template_write(mock_visa):
     """Test that LibraryTemplate.write works."""
     try:
@@ -76,6 +98,13 @@ def test_library_template_identify(mock_visa):
         # Check that the identification is correct
         assert identifier == "Mock Instrument,Model 123,SN123456,FW1.0"
         assert template.instrumentID == "Mock Instrument,Model 123,SN123456,FW1.0"
+
+        # A known identity is served without querying again unless refreshed
+        resource = mock_visa.resources["GPIB0::22::INSTR"]
+        assert template.identify() == identifier
+        assert resource.command_log.count("*IDN?") == 1
+        template.identify(refresh=True)
+        assert resource.command_log.count("*IDN?") == 2
     except ImportError:
         pytest.skip("pylabinstruments.base.LibraryTemplate not available")
 
@@ -172,3 +201,202 @@ def test_library_template_context_manager(mock_visa):
         assert mock_visa.resources["GPIB0::22::INSTR"].closed is True
     except ImportError:
         pytest.skip("pylabinstruments.base.LibraryTemplate not available")
+
+
+def test_library_template_write_many(mock_visa):
+    """Test that _write_many joins commands into one rooted SCPI message."""
+    from pylabinstruments.base import LibraryTemplate
+
+    template = LibraryTemplate("GPIB0::22::INSTR")
+    template._write_many("SOUR:VOLT 1", ":SENS:CURR:PROT 0.1", "*OPC")
+
+    assert mock_visa.resources["GPIB0::22::INSTR"].last_command == "SOUR:VOLT 1;:SENS:CURR:PROT 0.1;*OPC"
+
+
+def test_library_template_wait_for_operation_complete(mock_visa):
+    """Test that *OPC? is queried under the requested timeout without a fixed delay."""
+    from pylabinstruments.base import LibraryTemplate
+
+    template = LibraryTemplate("GPIB0::22::INSTR")
+    resource = mock_visa.resources["GPIB0::22::INSTR"]
+    original_timeout = resource.timeout
+
+    start = time.time()
+    assert template.wait_for_operation_complete(timeout=5.0) is True
+    assert time.time() - start < 1.0
+    assert resource.last_command == "*OPC?"
+    assert resource.timeout == original_timeout
+
+
+def test_library_template_has_errors(mock_visa):
+    """Test that has_errors reads the status byte instead of querying the queue."""
+    from pylabinstruments.base import LibraryTemplate
+
+    template = LibraryTemplate("GPIB0::22::INSTR")
+    resource = mock_visa.resources["GPIB0::22::INSTR"]
+    before = len(resource.command_log)
+
+    assert template.has_errors() is False
+    resource.status_byte = 0x04 | 0x10
+    assert template.has_errors() is True
+    assert len(resource.command_log) == before
+
+
+def test_library_template_wait_for_srq(mock_visa):
+    """Test that errors are reported through SRQ events instead of queue polling."""
+    import pyvisa
+
+    from pylabinstruments.base import LibraryTemplate
+
+    template = LibraryTemplate("GPIB0::22::INSTR")
+    resource = mock_visa.resources["GPIB0::22::INSTR"]
+
+    assert template.enable_error_srq() is True
+    assert resource.command_log[-1] == "*ESE 60;*SRE 32"
+    assert pyvisa.constants.EventType.service_request in resource.enabled_events
+
+    before = len(resource.command_log)
+    assert template.wait_for_srq(timeout=0.01) is False
+    resource.status_byte = 0x40 | 0x20
+    assert template.wait_for_srq(timeout=0.01) is True
+    # The serial poll cleared the request, and nothing was sent on the bus
+    assert template.wait_for_srq(timeout=0.01) is False
+    assert len(resource.command_log) == before
+
+
+def test_library_template_pipeline(mock_visa):
+    """Test that writes inside pipeline() are sent as one message, flushed before queries."""
+    from pylabinstruments.base import LibraryTemplate
+
+    template = LibraryTemplate("GPIB0::22::INSTR")
+    resource = mock_visa.resources["GPIB0::22::INSTR"]
+    before = len(resource.command_log)
+
+    with template.pipeline():
+        template.write("SOUR:VOLT 1")
+        template._write_many("SOUR:CURR:LIMIT 0.1", "OUTP ON")
+        assert len(resource.command_log) == before
+        template.query("*OPC?")
+        template.write("OUTP OFF")
+
+    assert resource.command_log[before:] == [
+        "SOUR:VOLT 1;:SOUR:CURR:LIMIT 0.1;:OUTP ON",
+        "*OPC?",
+        "OUTP OFF",
+    ]
+
+
+def test_library_template_pipeline_failures_and_threads(mock_visa):
+    """Test that a failed flush is logged, not raised, and other threads bypass the buffer."""
+    import pytest
+    import pyvisa
+
+    from pylabinstruments.base import LibraryTemplate
+
+    template = LibraryTemplate("GPIB0::22::INSTR")
+    resource = mock_visa.resources["GPIB0::22::INSTR"]
+    before = len(resource.command_log)
+
+    # A write made by the submit() worker goes out on its own
+    with template.pipeline():
+        assert template.write("SOUR:VOLT 1") is False
+        assert template.submit(template.write, "OUTP ON").result(timeout=5) is True
+        assert resource.command_log[before:] == ["OUTP ON"]
+    assert resource.command_log[before:] == ["OUTP ON", "SOUR:VOLT 1"]
+
+    def timeout(_command):
+        raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+
+    # The flush failure does not escape, nor replace the error from the block
+    resource.write = timeout
+    with template.pipeline():
+        template.write("SOUR:VOLT 2")
+    with pytest.raises(KeyError):
+        with template.pipeline():
+            template.write("SOUR:VOLT 3")
+            raise KeyError("from the block")
+    assert template._pipeline is None
+
+
+def test_library_template_submit(mock_visa):
+    """Test that submitted calls run in order on one worker thread and finish before close."""
+    import threading
+
+    from pylabinstruments.base import LibraryTemplate
+
+    template = LibraryTemplate("GPIB0::22::INSTR")
+    resource = mock_visa.resources["GPIB0::22::INSTR"]
+    threads = set()
+
+    def record(command):
+        threads.add(threading.current_thread().name)
+        template.write(command)
+        return command
+
+    futures = [template.submit(record, f"SOUR:VOLT {v}") for v in range(5)]
+    assert futures[-1].result(timeout=5) == "SOUR:VOLT 4"
+    assert resource.command_log[-5:] == [f"SOUR:VOLT {v}" for v in range(5)]
+    assert len(threads) == 1 and threading.current_thread().name not in threads
+
+    # The barrier returns only after queued calls have run
+    slow = template.submit(lambda: time.sleep(0.05) or template.write("OUTP OFF"))
+    template.wait_for_submitted(timeout=5)
+    assert slow.done() and resource.last_command == "OUTP OFF"
+
+    template.close_connection()
+    assert template._executor is None
+
+
+def test_library_template_run_async(mock_visa):
+    """Test that run_async awaits calls from each instrument's own queue."""
+    import asyncio
+
+    from pylabinstruments.base import LibraryTemplate
+    from tests.mocks.mock_visa import MockResource
+
+    for address in ("GPIB0::23::INSTR", "GPIB0::24::INSTR"):
+        mock_visa.resources[address] = MockResource(address)
+    first = LibraryTemplate("GPIB0::23::INSTR")
+    second = LibraryTemplate("GPIB0::24::INSTR")
+
+    async def configure():
+        return await asyncio.gather(
+            first.run_async(first.write, "VOLT 1.0"),
+            second.run_async(second.query, "*IDN?"),
+        )
+
+    _, idn = asyncio.run(configure())
+    assert first.connection.command_log[-1] == "VOLT 1.0"
+    assert idn == second.instrumentID
+    first.close_connection()
+    second.close_connection()
+
+
+def test_library_template_io_holds_instrument_lock(mock_visa):
+    """Transfers from another thread wait while the instrument lock is held."""
+    import concurrent.futures
+
+    from pylabinstruments.base import LibraryTemplate
+
+    template = LibraryTemplate("GPIB0::22::INSTR")
+    resource = mock_visa.resources["GPIB0::22::INSTR"]
+
+    with template._io_lock:
+        future = template.submit(template.write, "FROM:WORKER")
+        with pytest.raises(concurrent.futures.TimeoutError):
+            future.result(timeout=0.1)
+        assert "FROM:WORKER" not in resource.command_log
+
+    future.result(timeout=1)
+    assert resource.command_log[-1] == "FROM:WORKER"
+    # Attribute access still reaches the underlying resource
+    template.connection.timeout = 1234
+    assert resource.timeout == 1234
+
+    # The locking wrapper is built once per method, and still reaches a
+    # method replaced on the resource afterwards
+    assert template.connection.write is template.connection.write
+    sent = []
+    resource.write = sent.append
+    template.write("REPLACED")
+    assert sent == ["REPLACED"]
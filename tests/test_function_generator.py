@@ -41,3 +41,25 @@ def test_afg3000_close(mock_function_generator):
     fg = mock_function_generator
     fg.close()
     # Should not raise an exception
+
+
+def test_afg3000_get_error_signed_no_error(mock_function_generator, caplog):
+    fg = mock_function_generator
+    fg.connection.responses["SYSTem:ERRor?"] = '+0,"No error"'
+
+    with caplog.at_level("WARNING"):
+        assert fg.get_error() == '+0,"No error"'
+    assert "Error in function generator" not in caplog.text
+
+
+def test_afg3000_sweep_and_burst_single_writes(mock_function_generator):
+    fg = mock_function_generator
+    log = fg.connection.command_log
+    before = len(log)
+
+    fg.set_sweep(1, 1e3, 1e6, 0.5)
+    fg.setup_burst_mode(2, 5, 0.01)
+    assert log[before:] == [
+        "FREQ1:STAR 1000.0;:FREQ1:STOP 1000000.0;:SWE1:TIME 0.5;:SWE1:STAT ON",
+        "BURS2:STAT ON;:BURS2:NCYC 5;:BURS2:INT:PER 0.01",
+    ]
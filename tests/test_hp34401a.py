@@ -23,6 +23,8 @@ def test_hp34401a_init_and_basic_measurements(mock_visa):
 
     dmm = HP34401A("GPIB0::22::INSTR")
     assert dmm.instrument_address == "GPIB0::22::INSTR"
+    assert dmm.connection.read_termination == "\n"
+    assert dmm.connection.write_termination == "\n"
 
     # Measure wrappers
     v = dmm.measure_voltage()
@@ -90,3 +92,74 @@ def test_hp34401a_display_text_and_clear(mock_visa):
 
     dmm.clear_display()
     assert any("DISP:TEXT:CLE" in cmd for cmd in mock_resource.command_log)
+
+
+def test_hp34401a_display_skips_unchanged_text(mock_visa):
+    from pylabinstruments import HP34401A
+    from tests.mocks.mock_visa import MockResource
+    from tests.mocks.responses.multimeter_responses import MULTIMETER_RESPONSES
+
+    responses = MULTIMETER_RESPONSES.get("HP34401A", MULTIMETER_RESPONSES["GENERIC"])
+    mock_resource = MockResource("GPIB0::22::INSTR", responses)
+    mock_visa.resources["GPIB0::22::INSTR"] = mock_resource
+
+    dmm = HP34401A("GPIB0::22::INSTR")
+    before = len(mock_resource.command_log)
+
+    # Display starts cleared, and repeating the same text is a no-op
+    dmm.clear_display()
+    dmm.display_text("RUN 1")
+    dmm.display_text("RUN 1")
+    dmm.clear_display()
+    dmm.clear_display()
+    assert mock_resource.command_log[before:] == ['DISP:TEXT "RUN 1"', "DISP:TEXT:CLE"]
+
+    # After a reset the display state is unknown, so the next write goes out
+    dmm.reset()
+    dmm.clear_display()
+    assert mock_resource.command_log[-1] == "DISP:TEXT:CLE"
+
+
+def test_hp34401a_function_cache_skips_func_query(mock_visa):
+    from pylabinstruments import HP34401A
+    from tests.mocks.mock_visa import MockResource
+    from tests.mocks.responses.multimeter_responses import MULTIMETER_RESPONSES
+
+    responses = MULTIMETER_RESPONSES.get("HP34401A", MULTIMETER_RESPONSES["GENERIC"])
+    mock_resource = MockResource("GPIB0::22::INSTR", responses)
+    mock_visa.resources["GPIB0::22::INSTR"] = mock_resource
+
+    dmm = HP34401A("GPIB0::22::INSTR")
+
+    dmm.measure_voltage()
+    dmm.measure_voltage()
+    dmm.read_voltage()
+    assert mock_resource.command_log.count("FUNC?") <= 1
+
+    # A reset forgets the cached function, and refresh always asks the instrument
+    dmm.reset()
+    dmm.get_function()
+    dmm.get_function(refresh=True)
+    assert mock_resource.command_log.count("FUNC?") <= 3
+    assert mock_resource.command_log[-1] == "FUNC?"
+
+
+def test_hp34401a_data_logging_returns_array(mock_visa):
+    import numpy as np
+
+    from pylabinstruments import HP34401A
+    from tests.mocks.mock_visa import MockResource
+    from tests.mocks.responses.multimeter_responses import MULTIMETER_RESPONSES
+
+    responses = MULTIMETER_RESPONSES.get("HP34401A", MULTIMETER_RESPONSES["GENERIC"])
+    mock_resource = MockResource("GPIB0::22::INSTR", responses)
+    mock_visa.resources["GPIB0::22::INSTR"] = mock_resource
+
+    dmm = HP34401A("GPIB0::22::INSTR")
+    dmm.setup_data_logging(samples=5, count=2, delay=0.01)
+    assert mock_resource.command_log[-1] == "TRIG:COUN 2;:SAMP:COUN 5;:SAMP:TIM 0.01"
+
+    readings = dmm.read_logged_data()
+    assert isinstance(readings, np.ndarray)
+    assert readings.dtype == np.float64
+    assert mock_resource.command_log[-1] == "READ?"
@@ -166,3 +166,18 @@ def test_keithley2110_validation(mock_visa):
     # Test invalid temperature unit
     with pytest.raises(ValueError):
         dmm.set_temperature_unit("INVALID")
+
+
+def test_keithley2110_temperature_unit_table(mock_visa):
+    from pylabinstruments import Keithley2110
+    from tests.mocks.mock_visa import MockResource
+    from tests.mocks.responses.multimeter_responses import MULTIMETER_RESPONSES
+
+    responses = MULTIMETER_RESPONSES.get("KEITHLEY2110", MULTIMETER_RESPONSES["GENERIC"])
+    mock_resource = MockResource("GPIB0::22::INSTR", responses)
+    mock_visa.resources["GPIB0::22::INSTR"] = mock_resource
+
+    dmm = Keithley2110("GPIB0::22::INSTR")
+    for unit, expected in [("c", "CEL"), ("FAR", "FAR"), ("K", "K")]:
+        dmm.set_temperature_unit(unit)
+        assert mock_resource.command_log[-1] == f"UNIT:TEMP {expected}"
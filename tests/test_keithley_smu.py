@@ -97,3 +97,25 @@ def test_keithley238_basic_commands(mock_visa):
 
     # Test close
     smu.close()
+
+
+def test_keithley238_batched_setters_and_measure_both(mock_visa):
+    """Test that limit setup and dual measurement use one transaction each."""
+    from pylabinstruments import Keithley238
+    from tests.mocks.mock_visa import MockResource
+
+    responses = {
+        "*IDN?": "KEITHLEY,238,12345,1.0",
+        "MEAS:VOLT?;:MEAS:CURR?": "1.5;0.002",
+    }
+    mock_resource = MockResource("GPIB0::13::INSTR", responses)
+    mock_visa.resources["GPIB0::13::INSTR"] = mock_resource
+
+    smu = Keithley238("GPIB0::13::INSTR")
+    before = len(mock_resource.command_log)
+
+    smu.configure_limits(10.0, 0.1)
+    assert mock_resource.command_log[before:] == ["SENS:VOLT:PROT 10.0;:SENS:CURR:PROT 0.1"]
+
+    assert smu.measure_both() == (1.5, 0.002)
+    assert len(mock_resource.command_log) == before + 2
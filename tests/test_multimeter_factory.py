@@ -12,6 +12,8 @@ import pytest
         ("KEITHLEY INSTRUMENTS,2000,1234567,1.0", "Keithley2000"),
         ("KEITHLEY INSTRUMENTS,2110,1234567,1.0", "Keithley2110"),
         ("TEKTRONIX,DMM4050,12345,1.0", "TektronixDMM4050"),
+        # The serial number contains "2000", but the model field decides
+        ("KEITHLEY INSTRUMENTS INC.,MODEL 2110,1420001,02.03", "Keithley2110"),
     ],
 )
 def test_multimeter_factory_detects_models(mock_visa, idn, expected_class_name):
@@ -25,6 +27,9 @@ def test_multimeter_factory_detects_models(mock_visa, idn, expected_class_name):
 
     dmm = Multimeter("GPIB0::22::INSTR")
     assert dmm.__class__.__name__ == expected_class_name
+    # The factory's probe reply is reused rather than queried a second time
+    assert dmm.instrumentID == idn
+    assert mock_resource.command_log.count("*IDN?") == 1
 
 
 def test_multimeter_factory_model_override(mock_visa):
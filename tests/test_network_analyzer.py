@@ -25,3 +25,60 @@ def test_network_analyzer_helpers_and_trace(mock_network_analyzer):
 
     # Touchstone saving is a write-only operation; ensure no error
     assert vna.save_touchstone("test_data", ports=2) is True
+
+
+def test_network_analyzer_connection_settings(mock_network_analyzer):
+    assert mock_network_analyzer.connection.timeout == 10000
+    assert mock_network_analyzer.connection.chunk_size == 1024 * 1024
+
+
+def test_network_analyzer_screenshot_single_write(mock_network_analyzer):
+    vna = mock_network_analyzer
+    log = vna.connection.command_log
+    before = len(log)
+
+    assert vna.save_screenshot("shot") is True
+    assert log[before:] == ["HCOP:DEV:LANG PNG;:HCOP:DEST 'MMEM';:MMEM:NAME 'shot.png';:HCOP:IMM"]
+
+
+def test_network_analyzer_complex_trace(mock_network_analyzer):
+    vna = mock_network_analyzer
+    vna.connection.responses["CALC:DATA:SDAT?"] = "1.0,-1.0,0.5,0.25,0.0,2.0"
+
+    freqs, values = vna.get_trace_data_complex()
+
+    assert freqs == [1.0, 2.0, 3.0]
+    assert values == [complex(1.0, -1.0), complex(0.5, 0.25), complex(0.0, 2.0)]
+
+
+def test_network_analyzer_set_markers_single_write(mock_network_analyzer):
+    vna = mock_network_analyzer
+    log = vna.connection.command_log
+    before = len(log)
+
+    vna.set_markers([1e6, 2e6])
+    assert log[before:] == ["CALC:MARK:AOFF;:CALC:MARK1:STAT ON;:CALC:MARK1:X 1000000.0;:CALC:MARK2:STAT ON;:CALC:MARK2:X 2000000.0"]
+
+
+def test_network_analyzer_trace_uses_binary_block(mock_network_analyzer):
+    vna = mock_network_analyzer
+    log = vna.connection.command_log
+
+    vna.get_trace_data()
+
+    assert log[-1] == "FORM:DATA REAL;:FORM:BORD SWAP;:CALC:DATA:FDAT?;:FORM:DATA ASC"
+
+
+def test_network_analyzer_setup_blocks_single_writes(mock_network_analyzer):
+    vna = mock_network_analyzer
+    log = vna.connection.command_log
+    before = len(log)
+
+    vna.set_sweep_parameters(1e6, 10e6, points=201)
+    vna.setup_s_parameter_measurement("S11")
+    vna.set_averaging(count=4)
+    assert log[before:] == [
+        "SENS:FREQ:STAR 1000000.0;:SENS:FREQ:STOP 10000000.0;:SENS:SWE:POIN 201",
+        "CALC:PAR:DEL:ALL;:CALC:PAR:DEF:EXT 'Meas1', S11;:CALC:PAR:SEL 'Meas1';:CALC:FORM MLOG",
+        "SENS:AVER:COUN 4;:SENS:AVER:STAT ON",
+    ]
@@ -41,3 +41,133 @@ def test_oscilloscope_measurements(mock_oscilloscope):
     vpp = scope.measure_vpp(1)
     assert isinstance(f, float)
     assert isinstance(vpp, float)
+
+
+def test_oscilloscope_export_waveform_to_csv(mock_oscilloscope, tmp_path):
+    scope = mock_oscilloscope
+    target = tmp_path / "waveform"
+
+    assert scope.export_waveform_to_csv(1, str(target)) is True
+
+    lines = (tmp_path / "waveform.csv").read_text().splitlines()
+    assert lines[0] == "Time (s),Voltage (V)"
+    assert len(lines) > 1
+    t, v = (float(x) for x in lines[1].split(","))
+    assert isinstance(t, float) and isinstance(v, float)
+
+
+def test_oscilloscope_export_waveform_keeps_float64_values(mock_oscilloscope, tmp_path, monkeypatch):
+    import numpy as np
+
+    volts = np.array([0.123456789012, -1.000000000001])
+    monkeypatch.setattr(mock_oscilloscope, "acquire", lambda *_a, **_k: (np.array([0.0, 1e-6]), volts))
+
+    target = tmp_path / "waveform.csv"
+    assert mock_oscilloscope.export_waveform_to_csv(1, str(target)) is True
+    exported = [float(line.split(",")[1]) for line in target.read_text().splitlines()[1:]]
+    assert exported == volts.tolist()
+
+
+def test_oscilloscope_acquire_returns_float32_volts(mock_oscilloscope):
+    import numpy as np
+
+    time_data, volts = mock_oscilloscope.acquire(1, show=False)
+
+    assert volts.dtype == np.float32
+    assert len(volts) == len(time_data) > 0
+
+    # Scaled in place with the canned 0.02 V/div, 0 V offset and 1 us spacing
+    adc = mock_oscilloscope.connection.query_binary_values("CURVE?", datatype="B", container=np.array)
+    np.testing.assert_allclose(volts, (adc - 127.5) * 0.02, rtol=1e-6)
+    np.testing.assert_allclose(time_data, np.arange(len(volts)) * 1e-6)
+
+
+def test_oscilloscope_message_skips_unchanged_text(mock_oscilloscope):
+    scope = mock_oscilloscope
+    log = scope.connection.command_log
+    before = len(log)
+
+    scope.show_message("RUN 1")
+    scope.show_message("RUN 1")
+    scope.remove_message()
+    scope.remove_message()
+    assert log[before:] == ['MESSage:SHOW "RUN 1"', 'MESSage:SHOW ""']
+
+    # After a reset the screen state is unknown, so the next write goes out
+    scope.reset()
+    scope.remove_message()
+    assert log[-1] == 'MESSage:SHOW ""'
+
+
+def _stub_image_transfer(scope, replies):
+    """Serve read_bytes chunks and their VISA status from the mock resource."""
+    resource = scope.connection._resource
+    requests = []
+
+    def read_bytes(count, chunk_size=None, break_on_termchar=False):
+        requests.append((count, chunk_size, break_on_termchar))
+        chunk, resource.last_status = replies[len(requests) - 1]
+        return chunk
+
+    resource.read_bytes = read_bytes
+    return requests
+
+
+def test_oscilloscope_save_image_failure_keeps_existing_file(mock_oscilloscope, tmp_path):
+    target = tmp_path / "shot.png"
+    target.write_bytes(b"previous screenshot")
+
+    # The mock resource has no read_bytes to stream from, so the transfer fails
+    assert mock_oscilloscope.save_image(str(target)) is False
+    assert target.read_bytes() == b"previous screenshot"
+    assert [p.name for p in tmp_path.iterdir()] == ["shot.png"]
+
+
+def test_oscilloscope_save_image_streams_every_chunk(mock_oscilloscope, tmp_path):
+    import pyvisa
+
+    status = pyvisa.constants.StatusCode
+    requests = _stub_image_transfer(
+        mock_oscilloscope,
+        [
+            (b"\x89PNG", status.success_max_count_read),
+            (b"\r\n\x1a\n", status.success_max_count_read),
+            (b"IEND", status.success),
+        ],
+    )
+
+    # Reads continue while VISA reports more data, and stop on success
+    target = tmp_path / "shot.png"
+    with open(target, "wb") as sink:
+        assert mock_oscilloscope._read_raw_into(sink, chunk_size=4) == 12
+    assert requests == [(4, 4, True)] * 3
+    assert target.read_bytes() == b"\x89PNG\r\n\x1a\nIEND"
+
+    # save_image moves the finished transfer into place
+    _stub_image_transfer(mock_oscilloscope, [(b"\x89PNG", status.success_max_count_read), (b"IEND", status.success)])
+    assert mock_oscilloscope.save_image(str(target), chunk_size=4) is True
+    assert target.read_bytes() == b"\x89PNGIEND"
+    assert [p.name for p in tmp_path.iterdir()] == ["shot.png"]
+
+
+def test_mdo3000_acquire_spectrum_parses_plain_and_block_replies(mock_visa):
+    from pylabinstruments.oscilloscope import TektronixMDO3000
+    from tests.mocks.mock_visa import MockResource
+
+    responses = {
+        "*IDN?": "TEKTRONIX,MDO3024,12345,1.0",
+        "CURVE?": "-40.5,-38.0,-41.25",
+        "SPECTrum:FREQuency:STARt?;:SPECTrum:FREQuency:STOP?": "1.0E+6;3.0E+6",
+    }
+    mr = MockResource("GPIB0::8::INSTR", responses)
+    mock_visa.resources["GPIB0::8::INSTR"] = mr
+
+    scope = TektronixMDO3000("GPIB0::8::INSTR")
+    freqs, amps = scope.acquire_spectrum(show=False)
+    assert amps.tolist() == [-40.5, -38.0, -41.25]
+    assert freqs.tolist() == [1e6, 2e6, 3e6]
+
+    # A definite-length block header is skipped by its declared size
+    mr.responses["CURVE?"] = "#218-40.5,-38.0,-41.25"
+    _, amps = scope.acquire_spectrum(show=False)
+    assert amps.tolist() == [-40.5, -38.0, -41.25]
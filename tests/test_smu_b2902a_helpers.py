@@ -2,6 +2,9 @@
 Tests for SMU helpers (Keysight B2902A).
 """
 
+import numpy as np
+import pytest
+
 
 def test_smu_configure_output_and_compliance(mock_visa):
     from pylabinstruments import SMU
@@ -54,3 +57,369 @@ def test_smu_ramp_voltage(mock_visa):
     log = smu.connection.command_log  # type: ignore[attr-defined]
     assert any("SOUR1:VOLT 0.5" in cmd for cmd in log)
     assert any("SOUR1:VOLT 1.0" in cmd for cmd in log)
+    assert log.count("SOUR1:CURR:LIMIT?") == 1
+
+
+def test_smu_set_mode_voltage_limit_single_write(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    before = len(mr.command_log)
+    smu.set_mode_voltage_limit(2, "VOLT", 1.5, 0.01)
+
+    assert mr.command_log[before:] == ["SOUR2:FUNC:MODE VOLT;:SOUR2:VOLT 1.5;:SOUR2:CURR:LIMIT 0.01"]
+
+
+def test_smu_function_mode_cache(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    responses = {"*IDN?": "KEYSIGHT,B2902A,12345,1.0", "SOUR1:FUNC:MODE?": "VOLT"}
+    mr = MockResource("GPIB0::25::INSTR", responses)
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+
+    # Unknown mode is queried once, then served from the cache
+    assert smu.get_function(1) == "VOLT"
+    assert smu.get_function(1) == "VOLT"
+    assert mr.command_log.count("SOUR1:FUNC:MODE?") == 1
+
+    # Setting the mode updates the cache without a query
+    smu.set_function("CURR", channel=1)
+    assert smu.get_function(1) == "CURR"
+    assert mr.command_log.count("SOUR1:FUNC:MODE?") == 1
+
+    # Reset forgets the cached mode
+    smu.reset()
+    assert "*RST;*CLS" in mr.command_log
+    assert smu.get_function(1) == "VOLT"
+    assert mr.command_log.count("SOUR1:FUNC:MODE?") == 2
+
+
+def test_smu_failed_write_forgets_function_mode(mock_visa):
+    import pyvisa
+
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    smu.set_voltage(1.0, 0.01, channel=1)
+    write = mr.write
+
+    def timeout(_command):
+        raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+
+    # The mode switch may or may not have landed, so it must not stay cached
+    mr.write = timeout
+    smu.set_current(0.001, 5.0, channel=1)
+    assert smu._function_mode[1] is None
+
+    # The next voltage write switches the function explicitly again
+    mr.write = write
+    smu.set_voltage(2.0, 0.01, channel=1)
+    assert mr.command_log[-1] == "SOUR1:FUNC:MODE VOLT;:SOUR1:VOLT 2.0;:SOUR1:CURR:LIMIT 0.01"
+
+    # A write queued by pipeline() is not confirmed, so the mode stays unknown
+    with smu.pipeline():
+        smu.set_current(0.001, 5.0, channel=1)
+    assert smu._function_mode[1] is None
+
+
+def test_smu_digitize_fetches_binary_block(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0", "*OPC?": "1"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    data = smu.digitize(1)
+
+    assert data == [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]
+    assert all(type(value) is float for value in data)
+    assert mr.command_log[-1] == (
+        "FORM:DATA REAL,64;:FORM:BORD SWAP;:INIT:IMM (@1);*WAI;:FETC:ARR? (@1);:FORM:DATA ASC"
+    )
+    assert "*OPC?" not in mr.command_log
+
+    array = smu.digitize(1, as_array=True)
+    assert array.dtype == np.float64
+    assert array.tolist() == data
+
+
+def test_smu_measure_power_single_query(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    responses = {"*IDN?": "KEYSIGHT,B2902A,12345,1.0", "MEAS:VOLT? (@1);:MEAS:CURR? (@1)": "+2.0E+00;+5.0E-03"}
+    mr = MockResource("GPIB0::25::INSTR", responses)
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    before = len(mr.command_log)
+
+    assert smu.measure_voltage_current(1) == (2.0, 0.005)
+    assert smu.measure_power(1) == 0.01
+    assert mr.command_log[before:] == ["MEAS:VOLT? (@1);:MEAS:CURR? (@1)"] * 2
+
+
+def test_smu_voltage_sweep_results(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0", "*OPC?": "1"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    results = smu.voltage_sweep(0.0, 2.0, 5)
+
+    assert [r['set_voltage'] for r in results] == [0.0, 0.5, 1.0, 1.5, 2.0]
+    assert [r['measured_current'] for r in results] == [0.1, 0.2, 0.3, 0.4, 0.5]
+    assert results[4]['measured_power'] == 2.0 * 0.5
+
+
+def test_smu_connection_io_settings(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    SMU("GPIB0::25::INSTR")
+
+    assert mr.read_termination == "\n"
+    assert mr.write_termination == "\n"
+    assert mr.chunk_size == 1024 * 1024
+
+
+def test_smu_log_samples(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    samples = smu.log_samples(10, nplc=0.1, channel=2)
+
+    assert samples.shape == (10, 2)
+    assert "TRIG:ACQ:COUN 10, (@2)" in mr.command_log
+    assert mr.command_log[-2:] == [
+        "FORM:DATA REAL,64;:FORM:BORD SWAP;:INIT:IMM (@2);*WAI;:FETC:ARR:VOLT? (@2);:FORM:DATA ASC",
+        "FORM:DATA REAL,64;:FORM:BORD SWAP;:FETC:ARR:CURR? (@2);:FORM:DATA ASC",
+    ]
+
+
+def test_smu_get_all_errors(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+    smu = SMU("GPIB0::25::INSTR")
+
+    mr.responses["SYST:ERR:ALL?"] = '+0,"No error"'
+    assert smu.get_all_errors() == []
+
+    mr.responses["SYST:ERR:ALL?"] = '-113,"Undefined header",-222,"Data out of range"'
+    assert smu.get_all_errors() == ['-113,"Undefined header"', '-222,"Data out of range"']
+    assert mr.command_log.count("SYST:ERR:ALL?") == 2
+
+
+def test_smu_set_compliance_uses_mode_cache(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0", "SOUR2:FUNC:MODE?": "CURR"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    smu.set_mode(1, "VOLT")
+    before = len(mr.command_log)
+
+    smu.set_compliance(0.05, channel=1)
+    smu.set_compliance(2.0, channel=2)
+    smu.set_compliance(3.0, channel=2)
+
+    assert mr.command_log[before:] == [
+        "SOUR1:CURR:LIMIT 0.05",
+        "SOUR2:FUNC:MODE?",
+        "SOUR2:VOLT:LIMIT 2.0",
+        "SOUR2:VOLT:LIMIT 3.0",
+    ]
+
+
+def test_smu_set_voltage_switches_mode_once(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    before = len(mr.command_log)
+
+    smu.set_voltage(1.0, 0.01, channel=1)
+    smu.set_voltage(2.0, 0.01, channel=1)
+    smu.set_current(0.001, 5.0, channel=1)
+
+    assert mr.command_log[before:] == [
+        "SOUR1:FUNC:MODE VOLT;:SOUR1:VOLT 1.0;:SOUR1:CURR:LIMIT 0.01",
+        "SOUR1:VOLT 2.0;:SOUR1:CURR:LIMIT 0.01",
+        "SOUR1:FUNC:MODE CURR;:SOUR1:CURR 0.001;:SOUR1:VOLT:LIMIT 5.0",
+    ]
+
+
+def test_smu_measure_voltage_current_both(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    responses = {
+        "*IDN?": "KEYSIGHT,B2902A,12345,1.0",
+        "MEAS:VOLT? (@1,2);:MEAS:CURR? (@1,2)": "+1.0E+00,+2.0E+00;+1.0E-03,-2.0E-03",
+    }
+    mr = MockResource("GPIB0::25::INSTR", responses)
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    before = len(mr.command_log)
+
+    assert smu.measure_voltage_current_both() == {1: (1.0, 0.001), 2: (2.0, -0.002)}
+    assert len(mr.command_log) == before + 1
+
+    assert smu.measure_power_both() == {1: 0.001, 2: -0.004}
+    assert len(mr.command_log) == before + 2
+
+
+def test_smu_measure_voltage_and_current_both(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+
+    assert smu.measure_voltage_both() == (1.1, 2.2)
+    assert mr.command_log[-1] == "MEAS:VOLT? (@1,2)"
+    assert smu.measure_current_both() == (1.1, 2.2)
+    assert mr.command_log[-1] == "MEAS:CURR? (@1,2)"
+
+
+def test_smu_get_voltage_and_current_arrays(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    voltages = smu.get_voltage_array(2)
+    currents = smu.get_current_array(2)
+
+    assert isinstance(voltages, np.ndarray) and voltages.dtype == np.float64
+    assert len(currents) == 10
+    assert mr.command_log[-2:] == [
+        "FORM:DATA REAL,64;:FORM:BORD SWAP;:FETC:ARR:VOLT? (@2);:FORM:DATA ASC",
+        "FORM:DATA REAL,64;:FORM:BORD SWAP;:FETC:ARR:CURR? (@2);:FORM:DATA ASC",
+    ]
+
+
+def test_smu_list_sweep_bounded_transactions(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    before = len(mr.command_log)
+
+    levels, currents = smu.list_sweep(1, [0.0, 0.5, 1.0, 1.5])
+
+    assert isinstance(currents, np.ndarray)
+    assert levels.tolist() == [0.0, 0.5, 1.0, 1.5]
+    sent = mr.command_log[before:]
+    assert "LIST:VOLT 0.0,0.5,1.0,1.5, (@1)" in sent[1]
+    assert "INIT:IMM (@1);*WAI;:FETC:ARR:CURR? (@1)" in sent[-1]
+    assert len(sent) <= 5
+
+
+def test_smu_find_current_for_power_bisects(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+
+    # Simulate a 100 ohm load: P = I^2 * R, so 0.25 W needs 50 mA
+    def load_reading(channel=1):
+        current = float(mr.command_log[-1].rsplit("CURR ", 1)[1].split(";")[0])
+        return current * 100.0, current
+
+    smu.measure_voltage_current = load_reading
+    current = smu.find_current_for_power(0.25, max_current=0.1, channel=1, settle_time=0.0)
+
+    assert abs(current - 0.05) < 1e-4
+    assert sum("SOUR1:CURR " in command for command in mr.command_log) <= 12
+
+
+def test_smu_find_current_for_power_syncs_with_opc(mock_visa, monkeypatch):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    smu.measure_voltage_current = lambda channel=1: (1.0, 0.0)
+    monkeypatch.setattr("pylabinstruments.smu.time.sleep", lambda _s: pytest.fail("unexpected sleep"))
+
+    smu.find_current_for_power(1.0, max_current=0.1, tolerance=0.03)
+
+    # One *OPC? per bisection step and no fixed delays
+    assert mr.command_log.count("*OPC?") == 2
+
+
+def test_smu_pulse_train_single_message(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    before = len(mr.command_log)
+
+    smu.set_pulse_train(1, [0.0, 1.0], [1e-3, 2e-3])
+
+    sent = mr.command_log[before:]
+    assert len(sent) == 1
+    assert sent[0].startswith("SOUR1:FUNC:MODE VOLT;:LIST:CLE (@1);:LIST:VOLT 0.0,1.0, (@1)")
+    assert sent[0].endswith(";:LIST:WIDT 0.001,0.002, (@1)")
+
+
+def test_smu_channel_shortcuts_delegate(mock_visa):
+    from pylabinstruments import SMU
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::25::INSTR", {"*IDN?": "KEYSIGHT,B2902A,12345,1.0"})
+    mock_visa.resources["GPIB0::25::INSTR"] = mr
+
+    smu = SMU("GPIB0::25::INSTR")
+    smu.ch2_on()
+    smu.set_ch1_mode("CURR")
+    smu.ch2_off()
+
+    assert mr.command_log[-3:] == ["OUTP2 ON", "SOUR1:FUNC:MODE CURR", "OUTP2 OFF"]
+    assert smu._function_mode[1] == "CURR"
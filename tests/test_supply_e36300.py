@@ -40,3 +40,205 @@ def test_e36300_basic_channel_control(mock_visa):
     # Combined helper
     allm = ps.get_all_measurements(1)
     assert set(allm.keys()) == {"voltage", "current"}
+
+
+def test_e36300_measure_voltage_current_single_query(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    responses = {
+        "*IDN?": "KEYSIGHT,E36313A,12345,1.0",
+        "MEAS:VOLT? (@2);:MEAS:CURR? (@2)": "5.0;0.2",
+    }
+    mock_resource = MockResource("GPIB0::26::INSTR", responses)
+    mock_visa.resources["GPIB0::26::INSTR"] = mock_resource
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E36313A")
+    before = len(mock_resource.command_log)
+
+    assert ps.measure_voltage_current(2) == (5.0, 0.2)
+    assert ps.measure_power(2) == 1.0
+    assert ps.get_all_measurements(2) == {"voltage": 5.0, "current": 0.2}
+    assert len(mock_resource.command_log) == before + 3
+
+
+def test_supply_sets_connection_termination(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mock_resource = MockResource("GPIB0::26::INSTR", {"*IDN?": "KEYSIGHT,E36313A,12345,1.0"})
+    mock_resource.read_termination = mock_resource.write_termination = "\r\n"
+    mock_visa.resources["GPIB0::26::INSTR"] = mock_resource
+
+    Supply("GPIB0::26::INSTR", selected_instrument="E36313A")
+
+    assert mock_resource.read_termination == "\n"
+    assert mock_resource.write_termination == "\n"
+
+
+def test_supply_reset_single_message(mock_visa, monkeypatch):
+    import pytest
+
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mock_resource = MockResource("GPIB0::26::INSTR", {"*IDN?": "KEYSIGHT,E36313A,12345,1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mock_resource
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E36313A")
+    before = len(mock_resource.command_log)
+    monkeypatch.setattr("pylabinstruments.base.time.sleep", lambda _s: pytest.fail("unexpected sleep"))
+
+    ps.reset()
+
+    assert mock_resource.command_log[before:] == ["*RST;*CLS", "*OPC?"]
+
+
+def test_e36300_measure_channels_single_query(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    command = "MEAS:VOLT? (@1,3);:MEAS:CURR? (@1,3)"
+    responses = {"*IDN?": "KEYSIGHT,E36313A,12345,1.0", command: "5.0,12.0;0.25,0.5"}
+    mock_resource = MockResource("GPIB0::26::INSTR", responses)
+    mock_visa.resources["GPIB0::26::INSTR"] = mock_resource
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E36313A")
+    before = len(mock_resource.command_log)
+
+    voltages, currents = ps.supply.measure_channels((1, 3))
+
+    assert mock_resource.command_log[before:] == [command]
+    assert voltages.tolist() == [5.0, 12.0]
+    assert currents.tolist() == [0.25, 0.5]
+
+
+def test_supply_setpoint_cache_skips_queries(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mock_resource = MockResource("GPIB0::26::INSTR", {"*IDN?": "KEYSIGHT,E36313A,12345,1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mock_resource
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E36313A")
+    ps.set_voltage(5.0, 0.25, channel=2)
+    ps.set_current_limit(0.3, channel=2)
+    before = len(mock_resource.command_log)
+
+    assert ps.get_voltage(2) == 5.0
+    assert ps.get_current_limit(2) == 0.3
+    assert mock_resource.command_log[before:] == []
+
+    # An explicit refresh goes to the instrument and updates the cache
+    assert isinstance(ps.get_voltage(2, refresh=True), float)
+    assert mock_resource.command_log[before:] == ["VOLT? (@2)"]
+
+    # After a reset the setpoints are unknown again
+    ps.reset()
+    ps.get_voltage(2)
+    assert mock_resource.command_log[-1] == "VOLT? (@2)"
+
+
+def test_supply_set_voltage_skips_unchanged_setpoints(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mock_resource = MockResource("GPIB0::26::INSTR", {"*IDN?": "KEYSIGHT,E36313A,12345,1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mock_resource
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E36313A")
+    before = len(mock_resource.command_log)
+
+    ps.set_voltage(3.3, 0.5, channel=1)
+    ps.set_voltage(3.3, 0.5, channel=1)
+    ps.set_voltage(3.3, 0.5, channel=2)
+    assert len(mock_resource.command_log) == before + 2
+
+    ps.set_voltage(3.3, 0.5, channel=1, force=True)
+    ps.set_voltage(3.3, 0.6, channel=1)
+    assert len(mock_resource.command_log) == before + 4
+
+
+def test_e36300_apply_all_single_message(mock_visa):
+    import pytest
+
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::26::INSTR", {"*IDN?": "KEYSIGHT,E36313A,12345,1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mr
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E36313A")
+    before = len(mr.command_log)
+
+    ps.apply_all([1.8, 3.3], [0.1, 0.2], channels=(1, 2))
+    assert mr.command_log[before:] == [
+        "VOLT 1.8000, (@1);:CURR 0.1000, (@1);:VOLT 3.3000, (@2);:CURR 0.2000, (@2);:OUTP ON, (@1,2)"
+    ]
+    assert ps.get_voltage(2) == 3.3
+    assert ps.get_current_limit(1) == 0.1
+
+    with pytest.raises(ValueError):
+        ps.apply_all([1.0], [0.1, 0.2], channels=(1, 2))
+
+
+def test_supply_output_state_cache(mock_visa, monkeypatch):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mock_resource = MockResource("GPIB0::26::INSTR", {"*IDN?": "KEYSIGHT,E36313A,12345,1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mock_resource
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E36313A")
+    ps.enable_output(channel=1)
+    before = len(mock_resource.command_log)
+
+    # A state we just commanded is answered without a round-trip
+    assert ps.get_output_state(1) is True
+    assert mock_resource.command_log[before:] == []
+
+    # Once it expires, or on an explicit refresh, the instrument is asked
+    monkeypatch.setattr(Supply, "_OUTPUT_STATE_TTL", 0.0)
+    assert ps.get_output_state(1) is True
+    assert mock_resource.command_log[before:] == ["OUTP? (@1)"]
+
+
+def test_supply_output_state_not_cached_on_failure(mock_visa):
+    import pyvisa
+
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mock_resource = MockResource("GPIB0::26::INSTR", {"*IDN?": "KEYSIGHT,E36313A,12345,1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mock_resource
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E36313A")
+    ps.enable_output(channel=1)
+
+    def timeout(*_args, **_kwargs):
+        raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+
+    mock_resource.write = timeout
+    mock_resource.query = timeout
+
+    # A failed switch leaves the state unknown rather than remembered
+    ps.disable_output(channel=1)
+    assert 1 not in ps._output_states
+    assert ps.switch_output(True, channel=1) is False
+    assert 1 not in ps._output_states
+    assert ps.get_output_state(1) is False
+    assert 1 not in ps._output_states
+
+
+def test_supply_measure_many(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    supplies = []
+    for address in ("GPIB0::5::INSTR", "GPIB0::6::INSTR"):
+        mock_visa.resources[address] = MockResource(address, {"*IDN?": "KEYSIGHT,E36313A,12345,1.0"})
+        supplies.append(Supply(address, selected_instrument="E36313A"))
+    supplies[0].set_voltage(3.3, 0.5, channel=1)
+    supplies[1].set_voltage(5.0, 0.5, channel=1)
+
+    readings = Supply.measure_many(supplies, channel=1)
+    assert [round(v, 3) for v, _ in readings] == [3.301, 5.001]
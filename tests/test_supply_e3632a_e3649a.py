@@ -46,3 +46,236 @@ def test_e3649a_channel_selection_and_limits(mock_visa):
     # Current limit helper through Supply
     ps.set_current_limit(0.25, channel=2)
     assert any("CURR 0.2500" in cmd for cmd in log)
+
+
+def test_e3649a_set_voltage_single_write(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::26::INSTR", {"*IDN?": "KEYSIGHT,E3649A,12345,1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mr
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E3649A")
+    before = len(mr.command_log)
+
+    ps.set_voltage(48.0, 0.4, channel=1)
+    assert mr.command_log[before:] == ["INST:SEL OUT1;:VOLT:RANG HIGH;:VOLT 48.0000;:CURR 0.4000"]
+
+
+def test_e3649a_selects_output_in_same_message(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    responses = {"*IDN?": "KEYSIGHT,E3649A,12345,1.0", "INST:SEL OUT2;:MEAS:VOLT?": "11.998"}
+    mr = MockResource("GPIB0::26::INSTR", responses)
+    mock_visa.resources["GPIB0::26::INSTR"] = mr
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E3649A")
+    before = len(mr.command_log)
+
+    assert ps.measure_voltage(2) == 11.998
+    ps.enable_output(2)
+    assert mr.command_log[before:] == ["INST:SEL OUT2;:MEAS:VOLT?", "INST:SEL OUT2;:OUTP ON"]
+
+
+def test_e3632a_e3649a_measure_voltage_current_single_query(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    for model, command in [
+        ("E3632A", "MEAS:VOLT?;:MEAS:CURR?"),
+        ("E3649A", "INST:SEL OUT2;:MEAS:VOLT?;:MEAS:CURR?"),
+    ]:
+        mr = MockResource("GPIB0::26::INSTR", {"*IDN?": f"AGILENT,{model},12345,1.0", command: "12.0;0.25"})
+        mock_visa.resources["GPIB0::26::INSTR"] = mr
+
+        ps = Supply("GPIB0::26::INSTR", selected_instrument=model)
+        before = len(mr.command_log)
+
+        assert ps.measure_voltage_current(2) == (12.0, 0.25)
+        assert mr.command_log[before:] == [command]
+
+
+def test_e3649a_measure_channels_arrays(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    responses = {
+        "*IDN?": "AGILENT,E3649A,12345,1.0",
+        "INST:SEL OUT1;:MEAS:VOLT?;:MEAS:CURR?": "5.0;0.1",
+        "INST:SEL OUT2;:MEAS:VOLT?;:MEAS:CURR?": "12.0;0.25",
+    }
+    mock_visa.resources["GPIB0::26::INSTR"] = MockResource("GPIB0::26::INSTR", responses)
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E3649A")
+    voltages, currents = ps.measure_channels((1, 2))
+    assert voltages.tolist() == [5.0, 12.0]
+    assert currents.tolist() == [0.1, 0.25]
+
+
+def test_supply_model_detection(mock_visa):
+    from pylabinstruments import Supply
+    from pylabinstruments.supply import AgilentE3631A, KeysightE3649A, KeysightE36300
+    from tests.mocks.mock_visa import MockResource
+
+    for idn, selected, expected in [
+        ("Agilent Technologies,E3649A,0,1.7-5.0-1.0", None, KeysightE3649A),
+        ("HEWLETT-PACKARD, E3631A ,0,2.1-5.0-1.0", None, AgilentE3631A),
+        ("Keysight Technologies E36234A rev 2", None, KeysightE36300),
+        ("ACME,UNKNOWN,0,1.0", "1", AgilentE3631A),
+    ]:
+        mock_visa.resources["GPIB0::26::INSTR"] = MockResource("GPIB0::26::INSTR", {"*IDN?": idn})
+        ps = Supply("GPIB0::26::INSTR", selected_instrument=selected)
+        assert type(ps.supply) is expected
+
+
+def test_supply_apply_single_message(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    for model, expected in [
+        ("E3632A", "VOLT:RANG LOW;:VOLT 5.0000;:CURR 0.2000;:OUTP ON"),
+        ("E3649A", "INST:SEL OUT2;:VOLT:RANG LOW;:VOLT 5.0000;:CURR 0.2000;:INST:SEL OUT2;:OUTP ON"),
+        ("E36313A", "VOLT 5.0000, (@2);:CURR 0.2000, (@2);:OUTP ON, (@2)"),
+    ]:
+        mr = MockResource("GPIB0::26::INSTR", {"*IDN?": f"AGILENT,{model},12345,1.0"})
+        mock_visa.resources["GPIB0::26::INSTR"] = mr
+
+        ps = Supply("GPIB0::26::INSTR", selected_instrument=model)
+        before = len(mr.command_log)
+
+        ps.apply(5.0, 0.2, channel=2)
+        assert mr.command_log[before:] == [expected]
+        assert ps.get_voltage(2) == 5.0
+
+
+def test_supply_switch_output_single_transaction(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    for model, expected in [
+        ("E3632A", "OUTP ON;:OUTP?"),
+        ("E3649A", "INST:SEL OUT2;:OUTP ON;:INST:SEL OUT2;:OUTP?"),
+        ("E36313A", "OUTP ON, (@2);:OUTP? (@2)"),
+    ]:
+        mr = MockResource("GPIB0::26::INSTR", {"*IDN?": f"AGILENT,{model},12345,1.0"})
+        mock_visa.resources["GPIB0::26::INSTR"] = mr
+
+        ps = Supply("GPIB0::26::INSTR", selected_instrument=model)
+        before = len(mr.command_log)
+
+        assert ps.switch_output(True, channel=2) is True
+        assert mr.command_log[before:] == [expected]
+        # The state read back is cached, so this asks nothing
+        assert ps.get_output_state(2) is True
+        assert len(mr.command_log) == before + 1
+
+
+def test_supply_apply_invalid_channel_sends_nothing(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::26::INSTR", {"*IDN?": "HEWLETT-PACKARD,E3631A,0,2.1-5.0-1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mr
+
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E3631A")
+    before = len(mr.command_log)
+
+    # Channel 9 does not exist, so the output must not be switched on either
+    ps.apply(1.0, 0.1, channel=9)
+    assert mr.command_log[before:] == []
+    assert 9 not in ps._voltage_setpoints
+    assert 9 not in ps._output_states
+
+
+def test_supply_set_voltage_failure_not_cached(mock_visa):
+    import pyvisa
+
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::26::INSTR", {"*IDN?": "HEWLETT-PACKARD,E3631A,0,2.1-5.0-1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mr
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E3631A")
+
+    # An invalid channel sends nothing and records nothing
+    before = len(mr.command_log)
+    ps.set_voltage(1.0, 0.1, channel=9)
+    assert mr.command_log[before:] == []
+    assert 9 not in ps._voltage_setpoints
+
+    # A timed-out write drops the earlier setpoint, so the retry is sent
+    ps.set_voltage(5.0, 0.2, channel=1)
+    write = mr.write
+
+    def timeout(_command):
+        raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+
+    mr.write = timeout
+    ps.set_voltage(3.0, 0.2, channel=1)
+    assert 1 not in ps._voltage_setpoints
+    assert 1 not in ps._current_limits
+
+    mr.write = write
+    before = len(mr.command_log)
+    ps.set_voltage(3.0, 0.2, channel=1)
+    assert mr.command_log[before:] == ["INST:SEL P6V;:VOLT 3.0000;:CURR 0.2000"]
+    assert ps.get_voltage(1) == 3.0
+
+
+def test_supply_failed_reads_not_cached(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::26::INSTR", {"*IDN?": "HEWLETT-PACKARD,E3631A,0,2.1-5.0-1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mr
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E3631A")
+
+    # Unreadable channels fall back to 0.0 without caching the sentinel
+    assert ps.get_voltage(9) == 0.0
+    assert ps.get_current_limit(9) == 0.0
+    assert 9 not in ps._voltage_setpoints
+    assert 9 not in ps._current_limits
+
+    ps.set_current_limit(0.5, channel=9)
+    assert 9 not in ps._current_limits
+
+    ps.set_current_limit(0.5, channel=1)
+    assert ps._current_limits[1] == 0.5
+
+
+def test_e3631a_output_switch_forgets_other_channels(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::26::INSTR", {"*IDN?": "HEWLETT-PACKARD,E3631A,0,2.1-5.0-1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mr
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E3631A")
+
+    # OUTP OFF on the E3631A switches every output, so channel 1's cached
+    # state must not survive a switch commanded for channel 2
+    ps.enable_output(1)
+    ps.disable_output(2)
+    assert list(ps._output_states) == [2]
+    before = len(mr.command_log)
+    assert ps.get_output_state(1) is False
+    assert mr.command_log[before:] == ["OUTP?"]
+
+    ps.switch_output(True, channel=3)
+    assert list(ps._output_states) == [3]
+
+
+def test_e3631a_apply_forgets_other_output_states(mock_visa):
+    from pylabinstruments import Supply
+    from tests.mocks.mock_visa import MockResource
+
+    mr = MockResource("GPIB0::26::INSTR", {"*IDN?": "HEWLETT-PACKARD,E3631A,0,2.1-5.0-1.0"})
+    mock_visa.resources["GPIB0::26::INSTR"] = mr
+    ps = Supply("GPIB0::26::INSTR", selected_instrument="E3631A")
+
+    # apply() enables every E3631A output, so an earlier "off" for channel 1 is stale
+    ps.disable_output(1)
+    before = len(mr.command_log)
+    ps.apply(5.0, 0.2, channel=2)
+    assert mr.command_log[before:] == ["INST:SEL P25V;:VOLT 5.0000;:CURR 0.2000;:OUTP ON"]
+    assert list(ps._output_states) == [2]
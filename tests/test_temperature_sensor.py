@@ -119,3 +119,19 @@ def test_temperature_sensor_close(mock_visa):
     sensor = TemperatureSensor("GPIB0::28::INSTR", sensor_type="ThermometerFetch")
     sensor.close()
     # Should not raise an exception
+
+
+def test_temperature_sensor_set_units_table(mock_visa):
+    from pylabinstruments import TemperatureSensor
+    from tests.mocks.mock_visa import MockResource
+
+    mock_resource = MockResource("GPIB0::28::INSTR", {"*IDN?": "ACME,THERMOMETER,12345,1.0"})
+    mock_visa.resources["GPIB0::28::INSTR"] = mock_resource
+
+    sensor = TemperatureSensor("GPIB0::28::INSTR", sensor_type="ThermometerFetch")
+    sensor.set_units("fahrenheit")
+    assert mock_resource.command_log[-1] == "UNIT:TEMP F"
+
+    before = len(mock_resource.command_log)
+    sensor.set_units("rankine")
+    assert len(mock_resource.command_log) == before
@@ -85,6 +85,21 @@ def test_thermonics_set_temperature(mock_visa):
     assert any("TH85" in cmd for cmd in mock_resource.command_log)
 
 
+def test_thermonics_set_temperature_is_quiet(mock_visa, capsys):
+    """Setting the temperature reports through logging, not stdout."""
+    from pylabinstruments import Thermonics
+    from tests.mocks.mock_visa import MockResource
+
+    responses = {"*IDN?": "THERMONICS,T-2500SE,12345,1.0", "RA": "25.0"}
+    mock_visa.resources["GPIB0::21::INSTR"] = MockResource("GPIB0::21::INSTR", responses)
+
+    tc = Thermonics("GPIB0::21::INSTR", selected_instrument="Thermonics T-2500SE")
+    capsys.readouterr()
+    tc.set_temperature(85.0)
+    tc.set_temperature(-10.0)
+    assert capsys.readouterr().out == ""
+
+
 def test_thermonics_select_ambient(mock_visa):
     """Test selecting ambient air."""
     from pylabinstruments import Thermonics
@@ -8,9 +8,12 @@ import re
 import pytest
 
 from pylabinstruments.utils.utilities import (
+    configure_parallel,
     create_run_folder,
     format_bytes,
+    get_resource_manager,
     is_valid_ip,
+    join_scpi_commands,
     parse_numeric,
     scan_gpib_devices,
     stringToFloat,
@@ -67,3 +70,117 @@ def test_scan_gpib_devices(mock_visa):
     # Our mock creates a default resource with HP34401A IDN
     assert 22 in devices
     assert re.search(r"34401A|Mock Instrument|KEITHLEY|TEKTRONIX", devices[22])
+
+
+def test_visa_exception_handler_retries_timeouts():
+    import pyvisa
+
+    from pylabinstruments.utils.decorators import visa_exception_handler
+
+    class Flaky:
+        instrument_address = "GPIB0::1::INSTR"
+
+        def __init__(self):
+            self.calls = 0
+
+        @visa_exception_handler(default_return_value="failed", retry_count=2, retry_delay=0)
+        def read(self):
+            self.calls += 1
+            if self.calls < 3:
+                raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+            return "ok"
+
+        @visa_exception_handler(default_return_value="failed", retry_count=2, retry_delay=0)
+        def parse(self):
+            self.calls += 1
+            return float("not a number")
+
+    flaky = Flaky()
+    assert flaky.read() == "ok"
+    assert flaky.calls == 3
+
+    flaky.calls = 0
+    assert flaky.parse() == "failed"
+    assert flaky.calls == 1
+
+
+def test_visa_exception_handler_without_retries(caplog):
+    import pyvisa
+
+    from pylabinstruments.utils.decorators import visa_exception_handler
+
+    class Instrument:
+        instrument_address = "GPIB0::1::INSTR"
+        calls = 0
+
+        @visa_exception_handler(default_return_value=-1.0)
+        def measure(self, fail=False):
+            """Docstring is kept."""
+            self.calls += 1
+            if fail:
+                raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+            return 1.5
+
+    inst = Instrument()
+    assert inst.measure() == 1.5
+    assert inst.measure(fail=True) == -1.0
+    assert inst.calls == 2
+    assert "VI_ERROR_TMO" in caplog.text
+    assert Instrument.measure.__doc__ == "Docstring is kept."
+
+
+def test_parameter_validator_binds_defaults_and_rejects(monkeypatch):
+    import inspect
+
+    from pylabinstruments.utils.decorators import parameter_validator
+
+    class Source:
+        @parameter_validator(level=lambda v: 0 <= v <= 5, channel=lambda c: c in (1, 2))
+        def set_level(self, level, channel=1):
+            return level, channel
+
+    # The signature is resolved when decorating, not on each call
+    monkeypatch.setattr(inspect, "signature", None)
+
+    source = Source()
+    assert source.set_level(2.5) == (2.5, 1)
+    with pytest.raises(ValueError):
+        source.set_level(6)
+    with pytest.raises(ValueError):
+        source.set_level(1, channel=3)
+
+
+def test_configure_parallel_runs_each_instrument_once():
+    import threading
+
+    barrier = threading.Barrier(3, timeout=2)
+    seen = []
+
+    def setup(inst):
+        # All three must be in flight at once for the barrier to release
+        barrier.wait()
+        seen.append(inst)
+        return inst * 10
+
+    assert configure_parallel([1, 2, 3], setup) == [10, 20, 30]
+    assert sorted(seen) == [1, 2, 3]
+    assert configure_parallel([], setup) == []
+
+
+def test_join_scpi_commands_roots_later_commands():
+    assert join_scpi_commands(["VOLT 1", "CURR 0.1"]) == "VOLT 1;:CURR 0.1"
+    assert join_scpi_commands(["*RST", "*CLS", ":OUTP ON"]) == "*RST;*CLS;:OUTP ON"
+    assert join_scpi_commands(["OUTP?"]) == "OUTP?"
+
+
+def test_get_resource_manager_is_shared(mock_visa):
+    from pylabinstruments.base import LibraryTemplate
+
+    rm = get_resource_manager()
+    assert rm is mock_visa
+    assert get_resource_manager() is rm
+
+    # Every instrument reuses the one manager
+    first = LibraryTemplate("GPIB0::22::INSTR")
+    second = LibraryTemplate("GPIB0::22::INSTR")
+    assert first.rm is rm and second.rm is rm